@@ -1,4 +1,8 @@
 from website import create_app
+from website.leaderboard.widgets import invalidate_all_widgets
+from website.leaderboard.leaderboard import invalidate_games_summary
+from website.leaderboard.user_bests import rebuild_user_bests
+from website.runtime import debug_enabled
 import os
 import time
 import sqlite3
@@ -11,8 +15,8 @@ app = create_app()
 # Production-ready configuration
 app.secret_key = os.environ.get('SECRET_KEY', 'dev-key-change-in-production')
 
-# Enable debug mode
-DEBUG_MODE = True
+# Debug mode is only enabled outside production (see website/runtime.py)
+DEBUG_MODE = debug_enabled()
 
 # ========== DYNAMIC GAME DETECTION SYSTEM ==========
 
@@ -271,6 +275,31 @@ def simple_admin():
                 <a href="/admin/summerlockin/cleanup" class="admin-btn danger-btn">
                     🧹 Clean Old Data
                 </a>
+                <a href="/admin/summerlockin/retention" class="admin-btn">
+                    📦 Retention & Archive
+                </a>
+            </div>
+            
+            <div class="admin-section">
+                <h3>🛡️ Score Verification</h3>
+                <p class="info-text">Review flagged and quarantined runs and verifier throughput.</p>
+                <a href="/admin/summerlockin/verification" class="admin-btn">
+                    🛡️ Review Queue
+                </a>
+                <a href="/admin/summerlockin/outliers" class="admin-btn">
+                    📈 Score Outliers
+                </a>
+            </div>
+            
+            <div class="admin-section">
+                <h3>🗜️ Delivery</h3>
+                <p class="info-text">Response compression and bytes sent per route.</p>
+                <a href="/admin/summerlockin/compression" class="admin-btn">
+                    🗜️ Bytes on Wire
+                </a>
+                <a href="/admin/summerlockin/caches" class="admin-btn">
+                    🧊 Caches
+                </a>
             </div>
             
             <div class="admin-section">
@@ -402,8 +431,15 @@ def update_entry(entry_id):
             WHERE id = ?
         ''', (username, score, score, date_submitted, entry_id))
         
+        cursor.execute('SELECT game_name FROM leaderboard_entries WHERE id = ?', (entry_id,))
+        row = cursor.fetchone()
+        if row:
+            rebuild_user_bests(cursor, row[0])
+        
         conn.commit()
         conn.close()
+        invalidate_all_widgets()
+        invalidate_games_summary()
         
         return redirect('/admin/summerlockin/database?updated=1')
         
@@ -418,9 +454,17 @@ def delete_entry(entry_id):
         conn = sqlite3.connect('leaderboards.db')
         cursor = conn.cursor()
         
+        cursor.execute('SELECT game_name FROM leaderboard_entries WHERE id = ?', (entry_id,))
+        row = cursor.fetchone()
+        
         cursor.execute('DELETE FROM leaderboard_entries WHERE id = ?', (entry_id,))
+        cursor.execute('DELETE FROM period_leaderboard_entries WHERE entry_id = ?', (entry_id,))
+        if row:
+            rebuild_user_bests(cursor, row[0])
         conn.commit()
         conn.close()
+        invalidate_all_widgets()
+        invalidate_games_summary()
         
         return redirect('/admin/summerlockin/database?deleted=1')
         
@@ -465,8 +509,12 @@ def create_entry():
             VALUES (?, ?, ?, ?, 10)
         ''', (game_name, score_type, ranking_method, 1 if ranking_method == 'higher_is_better' else 0))
         
+        rebuild_user_bests(cursor, game_name)
+        
         conn.commit()
         conn.close()
+        invalidate_all_widgets()
+        invalidate_games_summary()
         
         return redirect('/admin/summerlockin/database?created=1')
         
@@ -477,6 +525,16 @@ def create_entry():
 @simple_admin_required  
 def admin_database_cleanup():
     """Database cleanup interface"""
+    from website.leaderboard.cleanup import preview_cleanup, CLEANUP_POLICIES, DEFAULT_CLEANUP_POLICY
+    
+    policy = request.args.get('policy', DEFAULT_CLEANUP_POLICY)
+    if policy not in CLEANUP_POLICIES:
+        abort(404)
+    
+    preview = preview_cleanup(policy)
+    if request.args.get('format') == 'json':
+        return jsonify(preview)
+    
     return render_template_string('''
     <!DOCTYPE html>
     <html>
@@ -564,11 +622,14 @@ def admin_database_cleanup():
             
             <div class="data-preview">
                 <h3>📋 Data to be Removed:</h3>
-                {% for entry in old_entries %}
-                <div>• {{ entry[0] }}: {{ entry[1] }} (Score: {{ entry[2] }})</div>
+                <p>{{ preview.description }}</p>
+                {% for game in preview.games %}
+                <div>• {{ game.game_name }}: {{ game.entries }} entries</div>
+                {% else %}
+                <div>Nothing matches this cleanup.</div>
                 {% endfor %}
                 <br>
-                <strong>Total entries to delete: {{ old_entries|length }}</strong>
+                <strong>Total entries to delete: {{ preview.total_entries }}</strong>
             </div>
             
             <div class="confirm-form">
@@ -576,6 +637,7 @@ def admin_database_cleanup():
                 <p class="warning">This action cannot be undone!</p>
                 
                 <form method="POST" action="/admin/summerlockin/cleanup">
+                    <input type="hidden" name="policy" value="{{ preview.policy }}">
                     <p>Type <strong>DELETE_OLD_LEADERBOARD_DATA</strong> to confirm:</p>
                     <input type="text" name="confirm" placeholder="Confirmation phrase..." required>
                     <br>
@@ -591,7 +653,7 @@ def admin_database_cleanup():
         </div>
     </body>
     </html>
-    ''', old_entries=get_old_data_preview())
+    ''', preview=preview)
 
 @app.route('/admin/summerlockin/cleanup', methods=['POST'])
 @simple_admin_required
@@ -608,40 +670,331 @@ def admin_database_cleanup_execute():
         </body></html>
         ''')
     
-    # Execute cleanup
-    try:
-        from website.leaderboard.leaderboard import get_db_connection
-        
-        with get_db_connection() as conn:
-            cursor = conn.cursor()
-            
-            # Delete old entries
-            cursor.execute('DELETE FROM leaderboard_entries WHERE game_name LIKE "%React Mode%" OR game_name LIKE "%Predict Mode%"')
-            entries_deleted = cursor.rowcount
-            
-            cursor.execute('DELETE FROM game_configs WHERE game_name LIKE "%React Mode%" OR game_name LIKE "%Predict Mode%"')
-            configs_deleted = cursor.rowcount
-            
-            conn.commit()
-            
-            return render_template_string('''
-            <html><body style="background:#000;color:#00ff00;font-family:monospace;padding:50px;text-align:center;">
-            <h1>✅ CLEANUP SUCCESSFUL</h1>
-            <p>Deleted {{ entries_deleted }} leaderboard entries</p>
-            <p>Deleted {{ configs_deleted }} game configurations</p>
-            <p>Old "React Mode" and "Predict Mode" data has been removed.</p>
-            <a href="/admin/summerlockin" style="color:#00ffff;">← Back to Admin Panel</a>
-            </body></html>
-            ''', entries_deleted=entries_deleted, configs_deleted=configs_deleted)
-            
-    except Exception as e:
-        return render_template_string('''
-        <html><body style="background:#000;color:#ff4444;font-family:monospace;padding:50px;text-align:center;">
-        <h1>💥 ERROR OCCURRED</h1>
-        <p>{{ error }}</p>
-        <a href="/admin/summerlockin" style="color:#00ffff;">← Back to Admin Panel</a>
-        </body></html>
-        ''', error=str(e))
+    from website.leaderboard.cleanup import start_cleanup, CLEANUP_POLICIES, DEFAULT_CLEANUP_POLICY
+    
+    policy = request.form.get('policy', DEFAULT_CLEANUP_POLICY)
+    if policy not in CLEANUP_POLICIES:
+        abort(404)
+    
+    job_id = start_cleanup(policy)
+    return redirect(f'/admin/summerlockin/cleanup/status/{job_id}')
+
+@app.route('/admin/summerlockin/cleanup/status/<job_id>')
+@simple_admin_required
+def admin_database_cleanup_status(job_id):
+    """Progress of a running cleanup"""
+    from website.leaderboard.cleanup import get_cleanup_progress
+    
+    progress = get_cleanup_progress(job_id)
+    if progress is None:
+        abort(404)
+    if request.args.get('format') == 'json':
+        return jsonify(progress)
+    
+    return render_template_string('''
+    <html>
+    <head>{% if progress.status == 'running' %}<meta http-equiv="refresh" content="2">{% endif %}</head>
+    <body style="background:#000;color:{{ '#ff4444' if progress.status == 'error' else '#00ff00' }};font-family:monospace;padding:50px;text-align:center;">
+    {% if progress.status == 'running' %}
+    <h1>🧹 CLEANUP IN PROGRESS</h1>
+    <p>{{ progress.percent }}% - {{ progress.entries_deleted }} / {{ progress.entries_total }} entries deleted</p>
+    <p>Game {{ progress.games_done + 1 }} of {{ progress.games|length }}: {{ progress.current_game or '...' }}</p>
+    {% elif progress.status == 'error' %}
+    <h1>💥 ERROR OCCURRED</h1>
+    <p>{{ progress.error }}</p>
+    <p>Deleted {{ progress.entries_deleted }} leaderboard entries before the error</p>
+    {% else %}
+    <h1>✅ CLEANUP SUCCESSFUL</h1>
+    <p>Deleted {{ progress.entries_deleted }} leaderboard entries</p>
+    <p>Deleted {{ progress.configs_deleted }} game configurations</p>
+    {% for game in progress.games %}<div>• {{ game }}</div>{% endfor %}
+    {% endif %}
+    <a href="/admin/summerlockin" style="color:#00ffff;">← Back to Admin Panel</a>
+    </body></html>
+    ''', progress=progress)
+
+@app.route('/admin/summerlockin/verification')
+@simple_admin_required
+def admin_verification():
+    """Run-replay verification review queue and verifier metrics"""
+    from website.leaderboard.verification import get_review_queue, get_verifier_metrics
+    
+    if request.args.get('format') == 'json':
+        return jsonify({'metrics': get_verifier_metrics(), 'queue': get_review_queue()})
+    
+    return render_template_string('''
+    <html><body style="background:#001122;color:#00ffff;font-family:monospace;padding:30px;">
+    <h1>🛡️ SCORE VERIFICATION</h1>
+    <h3>Verifier Metrics</h3>
+    <table style="border-collapse:collapse;margin-bottom:30px;">
+        {% for key, value in metrics.items() %}
+        <tr><td style="padding:4px 20px 4px 0;color:#888;">{{ key }}</td><td>{{ value }}</td></tr>
+        {% endfor %}
+    </table>
+    <h3>Review Queue</h3>
+    <table style="border-collapse:collapse;width:100%;">
+        <tr style="color:#888;text-align:left;">
+            <th>ID</th><th>Game</th><th>Player</th><th>Claimed</th><th>Replay</th><th>Status</th><th>Reason</th><th></th>
+        </tr>
+        {% for run in queue %}
+        <tr style="border-top:1px solid #333;">
+            <td>{{ run.id }}</td>
+            <td>{{ run.game_name }}</td>
+            <td>{{ run.username or '-' }}</td>
+            <td>{{ run.claimed_score }}</td>
+            <td>{{ run.simulated_score if run.simulated_score is not none else '-' }}</td>
+            <td>{{ run.status }}</td>
+            <td>{{ run.reason or '' }}</td>
+            <td>
+                {% if run.username %}
+                <form method="POST" action="/admin/summerlockin/verification/{{ run.id }}/release" style="display:inline;">
+                    <button type="submit">✅ Release</button>
+                </form>
+                <form method="POST" action="/admin/summerlockin/verification/{{ run.id }}/reject" style="display:inline;">
+                    <button type="submit">🗑️ Reject</button>
+                </form>
+                {% endif %}
+            </td>
+        </tr>
+        {% else %}
+        <tr><td colspan="8" style="color:#888;padding:20px 0;">No runs need review.</td></tr>
+        {% endfor %}
+    </table>
+    <p><a href="/admin/summerlockin" style="color:#00ffff;">← Back to Admin Panel</a></p>
+    </body></html>
+    ''', metrics=get_verifier_metrics(), queue=get_review_queue())
+
+@app.route('/admin/summerlockin/verification/<int:verification_id>/<action>', methods=['POST'])
+@simple_admin_required
+def admin_verification_action(verification_id, action):
+    """Release a held score into the leaderboard or reject it"""
+    from website.leaderboard.verification import release_held_score, reject_held_score
+    
+    if action == 'release':
+        release_held_score(verification_id)
+    elif action == 'reject':
+        reject_held_score(verification_id)
+    else:
+        abort(404)
+    
+    return redirect('/admin/summerlockin/verification')
+
+@app.route('/admin/summerlockin/outliers')
+@simple_admin_required
+def admin_outliers():
+    """Statistical outlier flags and per-game distribution estimates"""
+    from website.leaderboard.outliers import get_outlier_overview
+    
+    overview = get_outlier_overview()
+    if request.args.get('format') == 'json':
+        return jsonify(overview)
+    
+    return render_template_string('''
+    <html><body style="background:#001122;color:#00ffff;font-family:monospace;padding:30px;">
+    <h1>📈 SCORE OUTLIERS</h1>
+    {% if request.args.get('rebuilt') %}
+    <p style="color:#00ff00;">✅ Distributions rebuilt from existing entries.</p>
+    {% endif %}
+    <h3>Distributions</h3>
+    <table style="border-collapse:collapse;margin-bottom:10px;">
+        <tr style="color:#888;text-align:left;"><th>Game</th><th>Percentile</th><th>Estimate</th><th>Samples</th></tr>
+        {% for dist in overview.distributions %}
+        <tr><td style="padding:4px 20px 4px 0;">{{ dist.game_name }}</td><td>{{ dist.quantile }}</td>
+            <td>{{ '%.2f'|format(dist.estimate) if dist.estimate is not none else '-' }}</td><td>{{ dist.sample_count }}</td></tr>
+        {% else %}
+        <tr><td colspan="4" style="color:#888;">No scores tracked yet.</td></tr>
+        {% endfor %}
+    </table>
+    <form method="POST" action="/admin/summerlockin/outliers/rebuild">
+        <button type="submit">🔄 Rebuild from existing entries</button>
+    </form>
+    <h3>Unreviewed Flags</h3>
+    <table style="border-collapse:collapse;width:100%;">
+        <tr style="color:#888;text-align:left;">
+            <th>Entry</th><th>Game</th><th>Player</th><th>Score</th><th>Threshold</th><th>Flagged</th><th></th>
+        </tr>
+        {% for flag in overview.flags %}
+        <tr style="border-top:1px solid #333;">
+            <td><a href="/admin/summerlockin/database/edit/{{ flag.entry_id }}" style="color:#00ffff;">#{{ flag.entry_id }}</a></td>
+            <td>{{ flag.game_name }}</td>
+            <td>{{ flag.username or '(deleted)' }}</td>
+            <td>{{ flag.original_score if flag.original_score is not none else flag.ranking_score }}</td>
+            <td>{{ '%.2f'|format(flag.threshold) }} (p{{ (flag.percentile * 100)|round(1) }})</td>
+            <td>{{ flag.flagged_at }}</td>
+            <td>
+                <form method="POST" action="/admin/summerlockin/outliers/{{ flag.id }}/dismiss" style="display:inline;">
+                    <button type="submit">✔️ Dismiss</button>
+                </form>
+            </td>
+        </tr>
+        {% else %}
+        <tr><td colspan="7" style="color:#888;padding:20px 0;">No outliers flagged.</td></tr>
+        {% endfor %}
+    </table>
+    <p><a href="/admin/summerlockin" style="color:#00ffff;">← Back to Admin Panel</a></p>
+    </body></html>
+    ''', overview=overview)
+
+@app.route('/admin/summerlockin/outliers/<int:flag_id>/dismiss', methods=['POST'])
+@simple_admin_required
+def admin_dismiss_outlier(flag_id):
+    """Mark an outlier flag as reviewed"""
+    from website.leaderboard.outliers import dismiss_outlier_flag
+    dismiss_outlier_flag(flag_id)
+    return redirect('/admin/summerlockin/outliers')
+
+@app.route('/admin/summerlockin/outliers/rebuild', methods=['POST'])
+@simple_admin_required
+def admin_rebuild_outliers():
+    """Backfill distributions from existing leaderboard entries"""
+    from website.leaderboard.outliers import rebuild_all_distributions
+    rebuild_all_distributions()
+    return redirect('/admin/summerlockin/outliers?rebuilt=1')
+
+@app.route('/admin/summerlockin/retention')
+@simple_admin_required
+def admin_retention():
+    """Retention policies, prunable entries and archive contents"""
+    from website.leaderboard.retention import get_retention_overview
+    
+    overview = get_retention_overview(refresh=request.args.get('refresh') == '1')
+    if request.args.get('format') == 'json':
+        return jsonify(overview)
+    
+    return render_template_string('''
+    <html><body style="background:#001122;color:#00ffff;font-family:monospace;padding:30px;">
+    <h1>📦 RETENTION & ARCHIVE</h1>
+    {% if request.args.get('ran') %}
+    <p style="color:#00ff00;">✅ Retention applied.</p>
+    {% endif %}
+    <p style="color:#888;">
+        Background compactor: {{ 'enabled' if overview.enabled else 'disabled (set LEADERBOARD_RETENTION=1 to enable)' }},
+        every {{ (overview.interval_seconds / 3600)|round(1) }}h.
+        Personal bests and unreviewed outlier entries are always kept.
+    </p>
+    {% if overview.prunable_computed_at %}
+    <p style="color:#888;">Prunable counts from {{ ((now - overview.prunable_computed_at) / 60)|round|int }} min ago
+        (<a href="?refresh=1" style="color:#00ffff;">recount</a>)</p>
+    {% endif %}
+    <table style="border-collapse:collapse;width:100%;margin-bottom:10px;">
+        <tr style="color:#888;text-align:left;">
+            <th>Game</th><th>Keep top</th><th>Keep days</th><th>Keep per user</th>
+            <th>Hot entries</th><th>Prunable</th><th>Archived</th>
+        </tr>
+        {% for game in overview.games %}
+        <tr style="border-top:1px solid #333;">
+            <td style="padding:4px 20px 4px 0;">{{ game.game_name }}</td>
+            <td>{{ game.policy.keep_top }}</td>
+            <td>{{ game.policy.keep_days }}</td>
+            <td>{{ game.policy.keep_per_user or 'max_entries_per_user' }}</td>
+            <td>{{ game.hot_entries }}</td>
+            <td>{{ game.prunable_entries }}</td>
+            <td>{{ game.archived_entries }}</td>
+        </tr>
+        {% else %}
+        <tr><td colspan="7" style="color:#888;">No games yet.</td></tr>
+        {% endfor %}
+    </table>
+    {% if overview.last_run.finished_at %}
+    <p style="color:#888;">Last run archived {{ overview.last_run.archived.values()|sum }} entries
+        {% if overview.last_run.error %}<span style="color:#ff4444;">(error: {{ overview.last_run.error }})</span>{% endif %}</p>
+    {% endif %}
+    <form method="POST" action="/admin/summerlockin/retention/run">
+        <button type="submit">📦 Apply retention now</button>
+    </form>
+    <p><a href="/admin/summerlockin" style="color:#00ffff;">← Back to Admin Panel</a></p>
+    </body></html>
+    ''', overview=overview, now=time.time())
+
+@app.route('/admin/summerlockin/retention/run', methods=['POST'])
+@simple_admin_required
+def admin_run_retention():
+    """Apply retention policies immediately"""
+    from website.leaderboard.retention import run_retention
+    run_retention()
+    return redirect('/admin/summerlockin/retention?ran=1')
+
+@app.route('/admin/summerlockin/compression')
+@simple_admin_required
+def admin_compression():
+    """Per-route uncompressed vs. on-the-wire bytes for this worker"""
+    from website.compression import get_compression_metrics
+    
+    metrics = get_compression_metrics()
+    if request.args.get('format') == 'json':
+        return jsonify(metrics)
+    
+    return render_template_string('''
+    <html><body style="background:#001122;color:#00ffff;font-family:monospace;padding:30px;">
+    <h1>🗜️ BYTES ON WIRE</h1>
+    <p style="color:#888;">
+        Compression {{ 'enabled' if metrics.enabled else 'disabled (COMPRESSION=0)' }}:
+        {{ metrics.encodings|join(', ') }}, gzip level {{ metrics.gzip_level }},
+        responses over {{ metrics.min_size }} bytes. Worker pid {{ metrics.pid }} -
+        each worker keeps its own counts.
+    </p>
+    <p>Total: {{ metrics.raw_bytes }} bytes → {{ metrics.sent_bytes }} bytes on wire ({{ metrics.saved_percent }}% saved)</p>
+    <table style="border-collapse:collapse;width:100%;">
+        <tr style="color:#888;text-align:left;">
+            <th>Route</th><th>Requests</th><th>Compressed</th><th>Raw bytes</th><th>Sent bytes</th><th>Avg sent</th><th>Saved</th>
+        </tr>
+        {% for route in metrics.routes %}
+        <tr style="border-top:1px solid #333;">
+            <td style="padding:4px 20px 4px 0;">{{ route.route }}</td>
+            <td>{{ route.requests }}</td>
+            <td>{{ route.compressed }}</td>
+            <td>{{ route.raw_bytes }}</td>
+            <td>{{ route.sent_bytes }}</td>
+            <td>{{ route.avg_sent_bytes }}</td>
+            <td>{{ route.saved_percent }}%</td>
+        </tr>
+        {% else %}
+        <tr><td colspan="7" style="color:#888;">No requests recorded yet.</td></tr>
+        {% endfor %}
+    </table>
+    <p><a href="/admin/summerlockin" style="color:#00ffff;">← Back to Admin Panel</a></p>
+    </body></html>
+    ''', metrics=metrics)
+
+@app.route('/admin/summerlockin/caches')
+@simple_admin_required
+def admin_caches():
+    """Hit/miss counts of the in-process caches and single-flight groups"""
+    from website.pagecache import get_page_cache_stats
+    from website.test_home.fragments import get_fragment_cache_stats
+    from website.leaderboard.widgets import get_widget_cache_stats
+    from website.singleflight import get_singleflight_stats
+    from website.leaderboard.plays import get_play_pipeline_stats
+    
+    caches = {
+        'pages': get_page_cache_stats(),
+        'card fragments': get_fragment_cache_stats(),
+        'leaderboard widgets': get_widget_cache_stats()
+    }
+    caches['play counter buffer'] = get_play_pipeline_stats()
+    # Coalesced concurrent requests ('collapsed') per single-flight group
+    for name, stats in get_singleflight_stats().items():
+        caches[f'single-flight: {name}'] = stats
+    if request.args.get('format') == 'json':
+        return jsonify(dict(caches, pid=os.getpid()))
+    
+    return render_template_string('''
+    <html><body style="background:#001122;color:#00ffff;font-family:monospace;padding:30px;">
+    <h1>🧊 CACHES</h1>
+    <p style="color:#888;">Worker pid {{ pid }} - each worker keeps its own caches and counts.</p>
+    {% for name, stats in caches.items() %}
+    <h3>{{ name }}</h3>
+    <table style="border-collapse:collapse;">
+        {% for key, value in stats.items() %}
+        <tr style="border-top:1px solid #333;">
+            <td style="padding:4px 20px 4px 0;color:#888;">{{ key }}</td><td>{{ value }}</td>
+        </tr>
+        {% endfor %}
+    </table>
+    {% endfor %}
+    <p><a href="/admin/summerlockin" style="color:#00ffff;">← Back to Admin Panel</a></p>
+    </body></html>
+    ''', caches=caches, pid=os.getpid())
 
 @app.route('/admin/logout')
 def admin_logout():
@@ -656,18 +1009,6 @@ def admin_logout():
     </body></html>
     ''')
 
-def get_old_data_preview():
-    """Get preview of old data to be deleted"""
-    try:
-        conn = sqlite3.connect('leaderboards.db')
-        cursor = conn.cursor()
-        cursor.execute('SELECT game_name, username, score FROM leaderboard_entries WHERE game_name LIKE "%React Mode%" OR game_name LIKE "%Predict Mode%"')
-        data = cursor.fetchall()
-        conn.close()
-        return data
-    except:
-        return []
-
 # Database Management Templates
 DATABASE_MANAGER_TEMPLATE = '''
 <!DOCTYPE html>
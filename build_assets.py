@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+Build minified static bundles for SUMMERLOCKIN
+
+Concatenates and minifies every bundle in website.assets.BUNDLES into
+<static folder>/dist/, then writes .gz/.br siblings for every text asset.
+Production startup rebuilds stale files on its own; run this as a deploy
+step so workers start with them already built.
+
+Usage:
+    python build_assets.py
+"""
+
+import os
+import sys
+
+# Build explicitly below rather than as a side effect of create_app()
+os.environ['ASSET_BUNDLES'] = '0'
+os.environ['ASSET_PRECOMPRESS'] = '0'
+
+from website import create_app
+from website.assets import BUNDLES, build_bundles, precompress_static
+
+def main():
+    app = create_app()
+    result = build_bundles(app, force=True)
+    for name in result['built']:
+        print(f"✅ {name}")
+    for name, error in result['failed'].items():
+        print(f"❌ {name}: {error}")
+    print(f"Built {len(result['built'])}/{len(BUNDLES)} bundles")
+
+    precompressed = precompress_static(app)
+    for endpoint, files in precompressed.items():
+        for filename, variant in sorted(files.items()):
+            print(f"🗜️ {endpoint}: {filename} ({', '.join(variant['encodings'])})")
+    return 1 if result['failed'] else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,108 @@
+"""
+Gunicorn production configuration for SUMMERLOCKIN
+
+Gunicorn loads this file automatically from the working directory:
+
+    gunicorn app:app
+
+Tuning is driven by environment variables:
+
+    GUNICORN_PRESET         small | balanced (default) | io
+    GUNICORN_WORKERS        override the worker count
+    GUNICORN_THREADS        override threads per worker (gthread)
+    GUNICORN_WORKER_CLASS   override the worker class (gthread, gevent, sync)
+    PORT                    port to bind (default 5000)
+
+The app is preloaded in the master, which also runs the deferred init hooks
+(schema migrations, data validation) once per deployment; forked workers
+inherit that state and only reset their thread pools. With gevent workers the
+master monkey-patches the standard library before the app is imported, so the
+app's module-level locks and events are created cooperative.
+"""
+
+import multiprocessing
+import os
+
+# Anything imported after this point sees a production environment
+os.environ.setdefault('APP_ENV', 'production')
+
+CPU_COUNT = multiprocessing.cpu_count()
+
+def _gevent_available():
+    try:
+        import gevent  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+# ===== PRESETS =====
+
+PRESETS = {
+    # Small instances (e.g. 512MB): few processes, threads absorb slow clients
+    'small': {
+        'workers': 2,
+        'threads': 4,
+        'worker_class': 'gthread'
+    },
+    # General purpose: (2 x CPU) + 1 processes, capped for SQLite write contention
+    'balanced': {
+        'workers': min(CPU_COUNT * 2 + 1, 8),
+        'threads': 4,
+        'worker_class': 'gthread'
+    },
+    # Many idle connections (widget ETag polling, cleanup status refresh,
+    # score submissions waiting on replay verification): cooperative workers
+    'io': {
+        'workers': min(CPU_COUNT + 1, 8),
+        'threads': 1,
+        'worker_class': 'gevent' if _gevent_available() else 'gthread',
+        'worker_connections': 500
+    }
+}
+
+PRESET_NAME = os.environ.get('GUNICORN_PRESET', 'balanced')
+preset = PRESETS.get(PRESET_NAME, PRESETS['balanced'])
+
+# ===== SERVER SETTINGS =====
+
+bind = f"0.0.0.0:{os.environ.get('PORT', 5000)}"
+workers = int(os.environ.get('GUNICORN_WORKERS', preset['workers']))
+worker_class = os.environ.get('GUNICORN_WORKER_CLASS', preset['worker_class'])
+threads = int(os.environ.get('GUNICORN_THREADS', preset['threads']))
+worker_connections = preset.get('worker_connections', 1000)
+
+if worker_class == 'gevent':
+    # Must run before preload_app imports the app (see module docstring)
+    from gevent import monkey
+    monkey.patch_all()
+
+preload_app = True
+
+# Keep connections open between a game's score POST and the widget refresh
+keepalive = 5
+
+# Recycle workers periodically; jitter stops them all restarting at once
+max_requests = 1000
+max_requests_jitter = 100
+
+# Score submission may wait briefly for a replay verdict (VERIFY_WAIT_SECONDS)
+timeout = 30
+graceful_timeout = 30
+
+accesslog = '-'
+errorlog = '-'
+loglevel = os.environ.get('GUNICORN_LOG_LEVEL', 'info')
+
+# ===== HOOKS =====
+
+def when_ready(server):
+    """Runs in the master after the preloaded app is imported, before forking"""
+    from website.startup import run_deferred_inits
+    run_deferred_inits()
+    server.log.info(f"Preset '{PRESET_NAME}': {workers} x {worker_class} workers"
+                    + (f", {threads} threads each" if worker_class == 'gthread' else ''))
+
+def post_fork(server, worker):
+    """Give each worker its own thread pools and background threads"""
+    from website.runtime import reset_after_fork
+    reset_after_fork()
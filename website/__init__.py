@@ -3,39 +3,68 @@ Main Flask application initialization for SUMMERLOCKIN project
 Registers all blueprints and configures the application
 """
 
+import logging
 from flask import Flask
+from .startup import profiler, install_deferred_init
+from .runtime import is_production
+from .assets import init_assets
+from .compression import init_compression
 
 def create_app():
     """
     Create and configure the Flask application
+    
+    One-off setup (schema migrations, data validation) is registered as
+    deferred init hooks and runs before the first request - see startup.py.
+    Set STARTUP_PROFILE=1 for a per-step timing breakdown.
     """
     app = Flask(__name__)
     
+    # Configure logging once here rather than in each game module
+    logging.basicConfig(level=logging.INFO)
+    
     # Secret key for session management
     app.secret_key = 'shh_its_a_secret'
     
     # Configuration settings
-    app.config['TEMPLATES_AUTO_RELOAD'] = True
-    app.config['SEND_FILE_MAX_AGE_DEFAULT'] = 0  # Disable caching during development
+    app.config['TEMPLATES_AUTO_RELOAD'] = not is_production()  # Avoid stat() per render in production
+    app.config['SEND_FILE_MAX_AGE_DEFAULT'] = 0  # Unhashed static URLs always revalidate
     
-    # Import blueprints
-    from .home import home
-    from .leaderboard.leaderboard import leaderboard
-    from .time_predict import time_predict
-    from .react_time.react_time import react_time
-    from .dino_runner.dino_runner import dino_runner
-    from .space_invaders.space_invaders import space_invaders
-    from .test_home import test_home
+    # Import blueprints (timed individually when profiling)
+    with profiler.step('import website.leaderboard'):
+        from .leaderboard.leaderboard import leaderboard
+    with profiler.step('import website.home'):
+        from .home import home
+    with profiler.step('import website.time_predict'):
+        from .time_predict import time_predict
+    with profiler.step('import website.react_time'):
+        from .react_time.react_time import react_time
+    with profiler.step('import website.dino_runner'):
+        from .dino_runner.dino_runner import dino_runner
+    with profiler.step('import website.space_invaders'):
+        from .space_invaders.space_invaders import space_invaders
+    with profiler.step('import website.test_home'):
+        from .test_home import test_home
 
     # Register blueprints with URL prefixes
-    app.register_blueprint(home, url_prefix='/')
-    app.register_blueprint(leaderboard, url_prefix='/leaderboard')
-    app.register_blueprint(time_predict, url_prefix='/timepredict')
-    app.register_blueprint(react_time, url_prefix='/reacttime')
-    app.register_blueprint(dino_runner, url_prefix='/dino-runner')
-    app.register_blueprint(space_invaders, url_prefix='/spaceinvaders')
-    app.register_blueprint(test_home, url_prefix='/test-home')
+    with profiler.step('register blueprints'):
+        app.register_blueprint(home, url_prefix='/')
+        app.register_blueprint(leaderboard, url_prefix='/leaderboard')
+        app.register_blueprint(time_predict, url_prefix='/timepredict')
+        app.register_blueprint(react_time, url_prefix='/reacttime')
+        app.register_blueprint(dino_runner, url_prefix='/dino-runner')
+        app.register_blueprint(space_invaders, url_prefix='/spaceinvaders')
+        app.register_blueprint(test_home, url_prefix='/test-home')
+
+    # Minified bundles and content-hashed static URLs in production - see assets.py
+    with profiler.step('static asset pipeline'):
+        init_assets(app)
+
+    # gzip/brotli for dynamic responses + bytes-on-wire metrics - see compression.py
+    init_compression(app)
 
+    # Schema check, game data validation etc. run before the first request
+    install_deferred_init(app)
 
     # Add any new blueprints here following the same pattern:
     # from .new_feature import new_feature
@@ -49,7 +78,7 @@ def create_app():
         
         # Get dynamic navigation games
         try:
-            from .home.home import GAMES_DATA
+            from .home.home import GAMES_DATA, SEARCH_INDEX
             navigation_games = []
             for game_data in GAMES_DATA:
                 if game_data.get('endpoint'):  # Only include games with valid endpoints
@@ -57,7 +86,7 @@ def create_app():
                         'name': game_data['name'],
                         'icon': game_data.get('icon', '🎮'),
                         'endpoint': game_data['endpoint'],
-                        'search_terms': ' '.join(game_data.get('tags', [])) + ' ' + game_data['name'].lower()
+                        'search_terms': SEARCH_INDEX.search_terms(game_data['name'])
                     })
         except ImportError:
             navigation_games = []
@@ -77,6 +106,7 @@ def create_app():
     #     """Convert number to star emojis"""
     #     return '⭐' * min(int(number), 5)
     
+    app.extensions['startup_profile'] = profiler.report()
     return app
 
 # For development server
@@ -0,0 +1,489 @@
+"""
+Static asset pipeline: bundling, minification, fingerprinting and HTTP caching
+
+Page CSS/JS lives in static source files (not inline in templates) and is
+included with {{ asset_bundle('home.js') }}. With bundling on (production by
+default) each bundle's sources are concatenated and minified into
+<static folder>/dist/<name>.min.<ext> at startup, rebuilding only when a
+source is newer than its bundle; `python build_assets.py` does the same as a
+deploy step. In development the unminified sources are linked individually.
+
+With fingerprinting on (also production by default) every file under the
+app's and blueprints' static folders is hashed at startup and
+url_for('static', ...) / url_for('<bp>.static', ...) return content-addressed
+names (css/space.css -> css/space.3f9a1c2b7d4e.css). Those URLs can never
+point at different bytes, so they are served with a year-long "immutable"
+Cache-Control and browsers stop revalidating them. Deploying a changed file
+changes its hash and therefore its URL.
+
+Unhashed names keep working (old cached HTML, hand-written links) and are
+served as before. In development URLs are unchanged and
+SEND_FILE_MAX_AGE_DEFAULT = 0 keeps every response uncached.
+
+With precompression on (production by default) text assets get .gz/.br
+siblings written at maximum compression at startup (or by build_assets.py),
+and the static views serve those as-is to clients that accept them - no
+compression work per request.
+"""
+
+import hashlib
+import mimetypes
+import os
+
+from flask import g
+from werkzeug.exceptions import NotFound
+
+from .compression import COMPRESSION_MIN_SIZE, ENCODING_SUFFIXES, SUPPORTED_ENCODINGS, choose_encoding, compress
+from .runtime import is_production
+
+FINGERPRINT_LENGTH = 12
+IMMUTABLE_MAX_AGE = 365 * 24 * 3600  # One year
+
+# Source files and precompressed siblings that are never linked directly
+SKIPPED_EXTENSIONS = ('.scss', '.gz', '.br', '.map')
+
+# ===== MANIFEST =====
+
+def _file_hash(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(65536), b''):
+            digest.update(chunk)
+    return digest.hexdigest()[:FINGERPRINT_LENGTH]
+
+def fingerprint_name(filename, file_hash):
+    """css/space.css -> css/space.<hash>.css"""
+    root, ext = os.path.splitext(filename)
+    return f"{root}.{file_hash}{ext}"
+
+def scan_static_folder(folder):
+    """
+    Hash every servable file in a static folder
+
+    Returns:
+        dict: {filename: fingerprinted filename}, with '/'-separated paths
+    """
+    manifest = {}
+    if not folder or not os.path.isdir(folder):
+        return manifest
+    for dirpath, _, filenames in os.walk(folder):
+        for name in filenames:
+            if name.endswith(SKIPPED_EXTENSIONS):
+                continue
+            path = os.path.join(dirpath, name)
+            filename = os.path.relpath(path, folder).replace(os.sep, '/')
+            try:
+                manifest[filename] = fingerprint_name(filename, _file_hash(path))
+            except OSError as e:
+                print(f"Error fingerprinting {path}: {e}")
+    return manifest
+
+def _static_folders(app):
+    """(endpoint, folder) for the app and every blueprint that serves static files"""
+    folders = [('static', app.static_folder)] if app.has_static_folder else []
+    for name, blueprint in app.blueprints.items():
+        if blueprint.has_static_folder:
+            folders.append((f'{name}.static', blueprint.static_folder))
+    return folders
+
+def build_manifest(app):
+    """
+    Fingerprint every static folder registered on the app
+
+    Returns:
+        dict: {endpoint: {filename: fingerprinted filename}}
+    """
+    return {endpoint: scan_static_folder(folder) for endpoint, folder in _static_folders(app)}
+
+# ===== PRECOMPRESSION =====
+
+PRECOMPRESS_EXTENSIONS = ('.css', '.js', '.svg', '.json', '.txt', '.html')
+
+def _write_atomic(path, data):
+    temp = f"{path}.{os.getpid()}.tmp"
+    with open(temp, 'wb') as f:
+        f.write(data)
+    os.replace(temp, path)  # Atomic, so concurrent builders never serve half a file
+
+def precompress_folder(folder):
+    """
+    Write .gz (and .br, if brotli is installed) siblings at maximum
+    compression for every text asset in a static folder, skipping ones that
+    are already up to date
+
+    Returns:
+        dict: {filename: {'size': original bytes, 'encodings': (encoding, ...)}}
+    """
+    variants = {}
+    if not folder or not os.path.isdir(folder):
+        return variants
+    for dirpath, _, filenames in os.walk(folder):
+        for name in filenames:
+            if not name.endswith(PRECOMPRESS_EXTENSIONS):
+                continue
+            path = os.path.join(dirpath, name)
+            filename = os.path.relpath(path, folder).replace(os.sep, '/')
+            try:
+                size = os.path.getsize(path)
+                if size < COMPRESSION_MIN_SIZE:
+                    continue
+                encodings = []
+                for encoding in SUPPORTED_ENCODINGS:
+                    sibling = path + ENCODING_SUFFIXES[encoding]
+                    if not os.path.exists(sibling) or os.path.getmtime(sibling) < os.path.getmtime(path):
+                        with open(path, 'rb') as f:
+                            _write_atomic(sibling, compress(f.read(), encoding,
+                                                            level=11 if encoding == 'br' else 9))
+                    if os.path.getsize(sibling) < size:
+                        encodings.append(encoding)
+                if encodings:
+                    variants[filename] = {'size': size, 'encodings': tuple(encodings)}
+            except OSError as e:
+                print(f"Error precompressing {path}: {e}")
+    return variants
+
+def precompress_static(app):
+    """
+    Precompress every static folder registered on the app
+
+    Returns:
+        dict: {endpoint: {filename: {'size', 'encodings'}}}
+    """
+    return {endpoint: precompress_folder(folder) for endpoint, folder in _static_folders(app)}
+
+# ===== SERVING =====
+
+def _static_view(view, reverse, variants):
+    """
+    Wrap a static view so fingerprinted names resolve to the real file (and
+    are cached forever), and clients that accept it get a precompressed sibling
+    """
+    def serve_static(filename):
+        original = reverse.get(filename, filename)
+        variant = variants.get(original)
+        encoding = choose_encoding(variant['encodings']) if variant else None
+
+        response = None
+        if encoding:
+            try:
+                response = view(filename=original + ENCODING_SUFFIXES[encoding])
+            except NotFound:
+                encoding = None  # Sibling removed since startup - fall back to the original
+        if response is None:
+            response = view(filename=original)
+
+        if variant:
+            response.vary.add('Accept-Encoding')
+        if encoding:
+            response.headers['Content-Encoding'] = encoding
+            response.mimetype = mimetypes.guess_type(original)[0] or 'application/octet-stream'
+            g.uncompressed_length = variant['size']
+
+        if filename in reverse:
+            # send_file marks responses no-cache when SEND_FILE_MAX_AGE_DEFAULT is 0
+            response.cache_control.no_cache = None
+            response.cache_control.public = True
+            response.cache_control.max_age = IMMUTABLE_MAX_AGE
+            response.cache_control.immutable = True
+        return response
+    return serve_static
+
+# ===== MINIFICATION =====
+
+# After one of these characters (or keywords) a '/' starts a regex, not a division
+_REGEX_PRECEDERS = set('(,=:[!&|?{};+-*%<>~^')
+_REGEX_KEYWORDS = {'return', 'typeof', 'case', 'do', 'else', 'in', 'of', 'new',
+                   'delete', 'void', 'throw', 'instanceof', 'yield', 'await'}
+# Spaces next to these are never significant in JS
+_JS_TIGHT = set('{}()[];,:=')
+_CSS_TIGHT = set('{};,>')
+
+def _skip_quoted(source, i, quote):
+    """Index just past the string/regex body starting at source[i] (the opening quote)"""
+    i += 1
+    in_class = False
+    while i < len(source):
+        char = source[i]
+        if char == '\\':
+            i += 2
+            continue
+        if quote == '/' and char == '[':
+            in_class = True
+        elif quote == '/' and char == ']':
+            in_class = False
+        elif char == quote and not in_class:
+            return i + 1
+        elif char == '\n' and quote != '`':
+            return i  # Unterminated - leave the rest of the line alone
+        i += 1
+    return i
+
+def _previous_word(out):
+    text = ''.join(out[-12:]).rstrip()
+    word = ''
+    for char in reversed(text):
+        if not (char.isalnum() or char in '_$'):
+            break
+        word = char + word
+    return word
+
+def _emit_space(out, newline, next_char):
+    """
+    Collapse a whitespace run to one space or newline, or drop it where it's
+    insignificant. Line breaks are only dropped next to punctuation that
+    can't end or start a statement, so ASI is unaffected.
+    """
+    if not out:
+        return
+    if out[-1] == ' ':
+        out.pop()
+    last = out[-1][-1]
+    if newline:
+        if last != '\n' and last not in '{([,;' and next_char not in ')]},;':
+            out.append('\n')
+    elif last not in _JS_TIGHT and next_char not in _JS_TIGHT:
+        out.append(' ')
+
+def minify_js(source):
+    """
+    Conservative JS minifier: strips comments and redundant whitespace
+
+    Strings, template literals and regex literals are copied verbatim and line
+    breaks are kept, so automatic semicolon insertion behaves exactly as in
+    the original source.
+    """
+    out = []
+    braces = []  # '{' for blocks, '${' for template substitutions
+    i = 0
+    length = len(source)
+    while i < length:
+        char = source[i]
+        nxt = source[i + 1] if i + 1 < length else ''
+
+        if char in ' \t\r\n':
+            end = i
+            while end < length and source[end] in ' \t\r\n':
+                end += 1
+            _emit_space(out, '\n' in source[i:end], source[end:end + 1])
+            i = end
+            continue
+
+        if char == '/' and nxt == '/':
+            while i < length and source[i] != '\n':
+                i += 1
+            continue
+        if char == '/' and nxt == '*':
+            end = source.find('*/', i + 2)
+            end = length if end == -1 else end + 2
+            _emit_space(out, '\n' in source[i:end], source[end:end + 1])
+            i = end
+            continue
+
+        if char in '\'"':
+            end = _skip_quoted(source, i, char)
+            out.append(source[i:end])
+            i = end
+            continue
+
+        if char == '/':
+            previous = next((token[-1] for token in reversed(out) if token.strip()), '')
+            if not previous or previous in _REGEX_PRECEDERS or _previous_word(out) in _REGEX_KEYWORDS:
+                end = _skip_quoted(source, i, '/')
+                out.append(source[i:end])
+                i = end
+                continue
+
+        if char == '`' or (char == '}' and braces and braces[-1] == '${'):
+            # Template literal text up to the closing backtick or next substitution
+            if char == '}':
+                braces.pop()
+            start = i
+            i += 1
+            while i < length:
+                if source[i] == '\\':
+                    i += 2
+                    continue
+                if source[i] == '`':
+                    i += 1
+                    break
+                if source[i] == '$' and i + 1 < length and source[i + 1] == '{':
+                    braces.append('${')
+                    i += 2
+                    break
+                i += 1
+            out.append(source[start:i])
+            continue
+
+        if char == '{':
+            braces.append('{')
+        elif char == '}' and braces:
+            braces.pop()
+        out.append(char)
+        i += 1
+
+    return ''.join(out).strip() + '\n'
+
+def minify_css(source):
+    """Strip comments and whitespace from CSS (strings are copied verbatim)"""
+    out = []
+    i = 0
+    length = len(source)
+    while i < length:
+        char = source[i]
+        if char == '/' and source[i + 1:i + 2] == '*':
+            end = source.find('*/', i + 2)
+            i = length if end == -1 else end + 2
+            continue
+        if char in '\'"':
+            end = _skip_quoted(source, i, char)
+            out.append(source[i:end])
+            i = end
+            continue
+        if char in ' \t\r\n':
+            while i < length and source[i] in ' \t\r\n':
+                i += 1
+            if out and out[-1][-1] not in _CSS_TIGHT and out[-1][-1] not in ' :(':
+                out.append(' ')
+            continue
+        if char in _CSS_TIGHT or char == ')':
+            if out and out[-1] == ' ':
+                out.pop()
+            if char == '}' and out and out[-1] == ';':
+                out.pop()
+        out.append(char)
+        i += 1
+    return ''.join(out).strip() + '\n'
+
+# ===== BUNDLES =====
+
+# Bundle name -> (static endpoint, source files concatenated in order)
+BUNDLES = {
+    'base.css': ('static', ['css/style.css', 'css/space.css', 'css/base.css']),
+    'base.js': ('static', ['js/base.js']),
+    'home.css': ('static', ['css/home.css']),
+    'home.js': ('static', ['js/home.js']),
+    'space_invaders.css': ('static', ['css/space_invaders.css']),
+    'space_invaders.js': ('static', ['js/space_invaders.js']),
+    'test_home.css': ('test_home.static', ['css/test_layout.css']),
+    'test_home.js': ('test_home.static', ['js/test_home.js']),
+    'game_player.css': ('test_home.static', ['css/test_layout.css', 'css/game_player.css']),
+    'game_player.js': ('test_home.static', ['js/game_player.js'])
+}
+
+BUNDLE_DIR = 'dist'  # Build output inside each static folder (not committed)
+
+def bundle_filename(name):
+    """home.js -> dist/home.min.js"""
+    root, ext = os.path.splitext(name)
+    return f"{BUNDLE_DIR}/{root}.min{ext}"
+
+def build_bundle(folder, name, sources):
+    """Concatenate and minify one bundle into folder/dist; returns the output path"""
+    minify = minify_js if name.endswith('.js') else minify_css
+    parts = []
+    for filename in sources:
+        with open(os.path.join(folder, filename), encoding='utf-8') as f:
+            parts.append(minify(f.read()))
+    # ';' keeps a JS file without a trailing semicolon from running into the next
+    joined = (';\n' if name.endswith('.js') else '').join(parts)
+
+    output = os.path.join(folder, bundle_filename(name))
+    os.makedirs(os.path.dirname(output), exist_ok=True)
+    _write_atomic(output, joined.encode('utf-8'))
+    return output
+
+def _bundle_is_stale(folder, name, sources):
+    output = os.path.join(folder, bundle_filename(name))
+    if not os.path.exists(output):
+        return True
+    built = os.path.getmtime(output)
+    return any(os.path.getmtime(os.path.join(folder, filename)) > built for filename in sources)
+
+def build_bundles(app, force=False):
+    """
+    Build every bundle whose sources changed since its last build
+
+    Returns:
+        dict: {'built': [names], 'ready': [names], 'failed': {name: error}}
+    """
+    folders = dict(_static_folders(app))
+    result = {'built': [], 'ready': [], 'failed': {}}
+    for name, (endpoint, sources) in BUNDLES.items():
+        folder = folders.get(endpoint)
+        try:
+            if folder is None:
+                raise LookupError(f"no static folder for {endpoint}")
+            if force or _bundle_is_stale(folder, name, sources):
+                build_bundle(folder, name, sources)
+                result['built'].append(name)
+            result['ready'].append(name)
+        except Exception as e:
+            print(f"Error building bundle {name}: {e}")
+            result['failed'][name] = str(e)
+    return result
+
+def asset_bundle(name):
+    """
+    Template helper: <link>/<script> tags for a bundle
+
+    Serves the minified bundle when bundling is on and it built, otherwise
+    the individual source files (development, or a failed build).
+    """
+    from flask import current_app, url_for
+    from markupsafe import Markup, escape
+
+    endpoint, sources = BUNDLES[name]
+    if name in current_app.extensions.get('asset_bundles', ()):
+        files = [bundle_filename(name)]
+    else:
+        files = sources
+
+    if name.endswith('.js'):
+        tag = '<script src="{}"></script>'
+    else:
+        tag = '<link rel="stylesheet" href="{}">'
+    return Markup('\n'.join(tag.format(escape(url_for(endpoint, filename=f))) for f in files))
+
+# ===== SETUP =====
+
+def _env_flag(name, default):
+    setting = os.environ.get(name)
+    return default if setting is None else setting == '1'
+
+def init_assets(app):
+    """
+    Install bundles, precompressed and fingerprinted static files (call after
+    registering blueprints)
+
+    All three are on in production by default; override with
+    ASSET_BUNDLES=0/1, ASSET_PRECOMPRESS=0/1 and ASSET_FINGERPRINTING=0/1.
+    """
+    app.jinja_env.globals['asset_bundle'] = asset_bundle
+
+    app.config['ASSET_BUNDLES'] = _env_flag('ASSET_BUNDLES', is_production())
+    if app.config['ASSET_BUNDLES']:
+        # Built first so the bundles get compressed siblings and hashed URLs too
+        app.extensions['asset_bundles'] = set(build_bundles(app)['ready'])
+    else:
+        app.extensions['asset_bundles'] = set()
+
+    app.config['ASSET_PRECOMPRESS'] = _env_flag('ASSET_PRECOMPRESS', is_production())
+    precompressed = precompress_static(app) if app.config['ASSET_PRECOMPRESS'] else {}
+    app.extensions['asset_precompressed'] = precompressed
+
+    app.config['ASSET_FINGERPRINTING'] = _env_flag('ASSET_FINGERPRINTING', is_production())
+    manifest = build_manifest(app) if app.config['ASSET_FINGERPRINTING'] else {}
+    app.extensions['asset_manifest'] = manifest
+
+    for endpoint, _ in _static_folders(app):
+        reverse = {hashed: filename for filename, hashed in manifest.get(endpoint, {}).items()}
+        variants = precompressed.get(endpoint, {})
+        if reverse or variants:
+            app.view_functions[endpoint] = _static_view(app.view_functions[endpoint], reverse, variants)
+
+    if manifest:
+        @app.url_defaults
+        def _fingerprint_static_urls(endpoint, values):
+            files = manifest.get(endpoint)
+            if files and 'filename' in values:
+                values['filename'] = files.get(values['filename'], values['filename'])
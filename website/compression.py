@@ -0,0 +1,146 @@
+"""
+Response compression and bytes-on-wire metrics
+
+Dynamic responses (HTML pages, JSON APIs, widget fragments) are compressed
+in an after_request hook when they're a text type above COMPRESSION_MIN_SIZE
+and the client accepts gzip or brotli. Brotli is used when the optional
+`brotli` package is installed and the client prefers it.
+
+Static files are not compressed per request: assets.py serves build-time
+.gz/.br siblings instead (see precompress_static), so they cost no CPU.
+
+Every response's uncompressed and on-the-wire body size is recorded per
+route for the admin panel.
+
+Configuration (environment):
+    COMPRESSION=0           disable dynamic compression
+    COMPRESSION_LEVEL       gzip level 1-9 (default 6)
+    BROTLI_QUALITY          brotli quality 0-11 for dynamic responses (default 5)
+    COMPRESSION_MIN_SIZE    smallest body worth compressing, in bytes (default 1024)
+"""
+
+import gzip
+import os
+import threading
+
+from flask import g, request
+
+try:
+    import brotli
+except ImportError:  # Optional - gzip only without it
+    brotli = None
+
+COMPRESSION_ENABLED = os.environ.get('COMPRESSION', '1') == '1'
+COMPRESSION_LEVEL = int(os.environ.get('COMPRESSION_LEVEL', 6))
+BROTLI_QUALITY = int(os.environ.get('BROTLI_QUALITY', 5))
+COMPRESSION_MIN_SIZE = int(os.environ.get('COMPRESSION_MIN_SIZE', 1024))
+
+COMPRESSIBLE_MIMETYPES = {
+    'text/html', 'text/css', 'text/plain', 'text/javascript', 'application/javascript',
+    'application/json', 'image/svg+xml'
+}
+
+# Preferred first when the client rates them equally
+SUPPORTED_ENCODINGS = ('br', 'gzip') if brotli else ('gzip',)
+
+# File suffix of each encoding's precompressed static sibling
+ENCODING_SUFFIXES = {'br': '.br', 'gzip': '.gz'}
+
+# ===== ENCODING =====
+
+def choose_encoding(available=SUPPORTED_ENCODINGS):
+    """Best encoding from `available` that the current request accepts (None if none)"""
+    best, best_quality = None, 0
+    for encoding in available:
+        quality = request.accept_encodings[encoding]
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+def compress(data, encoding, level=None):
+    """Compress bytes with gzip or brotli (level defaults to the dynamic setting)"""
+    if encoding == 'br':
+        return brotli.compress(data, quality=BROTLI_QUALITY if level is None else level)
+    # mtime=0 keeps output deterministic, so identical bodies compress identically
+    return gzip.compress(data, compresslevel=COMPRESSION_LEVEL if level is None else level, mtime=0)
+
+# ===== BYTES-ON-WIRE METRICS =====
+
+_route_metrics = {}  # route -> {'requests', 'compressed', 'raw_bytes', 'sent_bytes'}
+_metrics_lock = threading.Lock()
+
+def record_bytes(route, raw_bytes, sent_bytes, compressed):
+    with _metrics_lock:
+        metrics = _route_metrics.setdefault(
+            route, {'requests': 0, 'compressed': 0, 'raw_bytes': 0, 'sent_bytes': 0})
+        metrics['requests'] += 1
+        metrics['compressed'] += int(compressed)
+        metrics['raw_bytes'] += raw_bytes
+        metrics['sent_bytes'] += sent_bytes
+
+def get_compression_metrics():
+    """Per-route byte counts for this worker process, biggest senders first"""
+    with _metrics_lock:
+        routes = [dict(metrics, route=route) for route, metrics in _route_metrics.items()]
+
+    for metrics in routes:
+        raw = metrics['raw_bytes']
+        metrics['saved_percent'] = round(100 * (1 - metrics['sent_bytes'] / raw), 1) if raw else 0.0
+        metrics['avg_sent_bytes'] = round(metrics['sent_bytes'] / metrics['requests'])
+    routes.sort(key=lambda metrics: -metrics['sent_bytes'])
+
+    raw_total = sum(metrics['raw_bytes'] for metrics in routes)
+    sent_total = sum(metrics['sent_bytes'] for metrics in routes)
+    return {
+        'enabled': COMPRESSION_ENABLED,
+        'encodings': list(SUPPORTED_ENCODINGS),
+        'gzip_level': COMPRESSION_LEVEL,
+        'brotli_quality': BROTLI_QUALITY if brotli else None,
+        'min_size': COMPRESSION_MIN_SIZE,
+        'pid': os.getpid(),
+        'raw_bytes': raw_total,
+        'sent_bytes': sent_total,
+        'saved_percent': round(100 * (1 - sent_total / raw_total), 1) if raw_total else 0.0,
+        'routes': routes
+    }
+
+# ===== MIDDLEWARE =====
+
+def _should_compress(response):
+    return (
+        COMPRESSION_ENABLED
+        and response.status_code == 200
+        and not response.direct_passthrough  # send_file - static files are precompressed
+        and not response.is_streamed
+        and 'Content-Encoding' not in response.headers
+        and 'no-transform' not in response.headers.get('Cache-Control', '')
+        and response.content_length is not None
+        and response.content_length >= COMPRESSION_MIN_SIZE
+    )
+
+def init_compression(app):
+    """Compress dynamic responses and record bytes on the wire for every route"""
+
+    @app.after_request
+    def _compress_response(response):
+        compressible = response.mimetype in COMPRESSIBLE_MIMETYPES
+        if compressible:
+            response.vary.add('Accept-Encoding')
+
+        raw_bytes = response.content_length or 0
+        encoding = choose_encoding() if compressible and _should_compress(response) else None
+        if encoding:
+            response.set_data(compress(response.get_data(), encoding))
+            response.headers['Content-Encoding'] = encoding
+            # The body differs per encoding, so a strong validator must become weak
+            etag, weak = response.get_etag()
+            if etag and not weak:
+                response.set_etag(etag, weak=True)
+
+        route = request.url_rule.rule if request.url_rule else '<unmatched>'
+        # Precompressed static files report their original size (see assets.py)
+        raw_bytes = g.get('uncompressed_length', raw_bytes)
+        sent_bytes = response.content_length or 0
+        record_bytes(route, raw_bytes, sent_bytes,
+                     encoding is not None or 'Content-Encoding' in response.headers)
+        return response
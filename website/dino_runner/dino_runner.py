@@ -1,10 +1,260 @@
 # File: website/dino_runner/dino_runner.py
 from flask import Blueprint, render_template, session, jsonify, request, redirect, url_for
 from website.leaderboard.leaderboard import submit_score_higher_better
-import random
+from website.leaderboard.widgets import widget_response
+from website.leaderboard.plays import record_request_play
+from website.leaderboard.verification import (
+    register_verifier, submit_run_for_verification, InvalidInputLog,
+    VerificationStatus, MAX_REPLAY_FRAMES
+)
+import datetime
+import hashlib
+import secrets
 
 dino_runner = Blueprint('dino_runner', __name__, template_folder='templates')
 
+# ===== SEEDED OBSTACLE GENERATION =====
+# The client expands the same seed with an identical PRNG (see dino_runner.html),
+# so both sides produce the exact same obstacle stream for a given run.
+
+OBSTACLE_SPAWN_TIME = 90  # Frames between obstacle spawns (matches game.OBSTACLE_SPAWN_TIME)
+GROUND_OBSTACLES = ['cactus', 'rock', 'crystal']
+AIR_OBSTACLES = ['bird', 'drone', 'asteroid']
+MAX_OBSTACLES_PER_REQUEST = 500
+MAX_OPEN_RUNS = 3  # Issued runs a session may still submit (restarts abandon runs)
+
+_UINT32 = 0xFFFFFFFF
+
+def _imul(a, b):
+    """32-bit integer multiply (JavaScript Math.imul semantics, unsigned result)"""
+    return (a * b) & _UINT32
+
+def mulberry32(seed):
+    """Return a mulberry32 generator yielding floats in [0, 1)"""
+    state = seed & _UINT32
+
+    def next_float():
+        nonlocal state
+        state = (state + 0x6D2B79F5) & _UINT32
+        t = _imul(state ^ (state >> 15), 1 | state)
+        t = ((t + _imul(t ^ (t >> 7), 61 | t)) & _UINT32) ^ t
+        return ((t ^ (t >> 14)) & _UINT32) / 4294967296
+
+    return next_float
+
+def derive_run_seed(seed, run_index):
+    """Derive the seed for a single run from the page seed and run counter"""
+    return (seed + run_index * 0x9E3779B9) & _UINT32
+
+def get_daily_seed(date=None):
+    """Deterministic daily challenge seed shared by every player on a given day"""
+    date = date or datetime.date.today()
+    digest = hashlib.sha256(f'cosmic-dino-daily-{date.isoformat()}'.encode()).digest()
+    return int.from_bytes(digest[:4], 'big')
+
+def generate_obstacles(seed, count):
+    """
+    Expand a seed into an obstacle stream.
+
+    Each obstacle consumes exactly five PRNG draws, in the same order as
+    spawnObstacle() on the client, so the streams never drift apart.
+    """
+    rng = mulberry32(seed)
+    return [_draw_obstacle(rng) for _ in range(count)]
+
+def _draw_obstacle(rng):
+    """Draw the next obstacle from a seeded stream"""
+    is_air = rng() < 0.3
+    types = AIR_OBSTACLES if is_air else GROUND_OBSTACLES
+    obstacle_type = types[int(rng() * len(types))]
+    width = 20 + rng() * 20
+    height = 30 + rng() * 20
+    lift = rng() * 20
+    return {
+        'type': obstacle_type,
+        'is_air': is_air,
+        'width': width,
+        'height': height,
+        'lift': lift
+    }
+
+def obstacles_for_score(seed, score):
+    """Obstacles that were spawned during a run that reached the given score"""
+    return generate_obstacles(seed, max(0, int(score)) // OBSTACLE_SPAWN_TIME)
+
+# ===== HEADLESS REPLAY =====
+# Mirrors update() in dino_runner.html frame for frame. Keep the two in sync.
+
+GROUND_Y = 240  # canvas.height (300) - 60
+DINO_X = 50
+DINO_WIDTH = 40
+DINO_HEIGHT = 40
+DINO_DUCK_HEIGHT = 20
+GRAVITY = 0.8
+BASE_JUMP_FORCE = -12
+JUMP_EXTENSION_FORCE = -0.8
+JUMP_EXTENSION_DELAY = 6  # frames
+MAX_JUMP_FRAMES = 12
+
+INPUT_JUMP_HELD = 1
+INPUT_DUCK = 2
+INPUT_JUMP_PRESSED = 4
+
+# Replays that die within this many frames of the claimed score are flagged, not quarantined
+REPLAY_TOLERANCE_FRAMES = 30
+
+def simulate_run(seed, canvas_width, events, max_frames):
+    """
+    Replay a run from its seed and input events
+
+    Args:
+        seed: Run seed (already derived with derive_run_seed)
+        canvas_width: Canvas width the run was played at
+        events: List of (frame, bits) input events, in order
+        max_frames: Stop replaying after this many frames
+
+    Returns:
+        int: Score at which the dino collides, or None if it survives max_frames
+    """
+    rng = mulberry32(seed)
+    height = DINO_HEIGHT
+    y = GROUND_Y - height
+    velocity_y = 0
+    is_jumping = False
+    is_ducking = False
+    jump_held = False
+    duck = False
+    jump_start_frame = 0
+    obstacle_timer = 0
+    obstacles = []  # [x, y, width, height]
+    next_event = 0
+    score = 0
+
+    while score < max_frames:
+        # Inputs logged at this frame happened between the previous update and this one
+        while next_event < len(events) and events[next_event][0] <= score:
+            bits = events[next_event][1]
+            if bits & INPUT_JUMP_PRESSED and not is_jumping and y >= GROUND_Y - height and not is_ducking:
+                velocity_y = BASE_JUMP_FORCE
+                is_jumping = True
+                jump_start_frame = score
+            jump_held = bool(bits & INPUT_JUMP_HELD)
+            duck = bool(bits & INPUT_DUCK)
+            next_event += 1
+
+        score += 1
+        speed = 7 + (score // 500) * 0.6
+
+        # Dinosaur
+        if duck and not is_jumping:
+            if not is_ducking:
+                is_ducking = True
+                height = DINO_DUCK_HEIGHT
+                y = GROUND_Y - height
+        elif is_ducking:
+            is_ducking = False
+            height = DINO_HEIGHT
+            y = GROUND_Y - height
+
+        if jump_held and is_jumping and velocity_y < 0:
+            jump_frames = score - jump_start_frame
+            if JUMP_EXTENSION_DELAY < jump_frames < MAX_JUMP_FRAMES:
+                velocity_y += JUMP_EXTENSION_FORCE
+
+        velocity_y += GRAVITY
+        y += velocity_y
+        if y >= GROUND_Y - height:
+            y = GROUND_Y - height
+            velocity_y = 0
+            is_jumping = False
+
+        # Obstacles
+        obstacle_timer += 1
+        if obstacle_timer >= OBSTACLE_SPAWN_TIME:
+            drawn = _draw_obstacle(rng)
+            width = drawn['width']
+            if drawn['is_air']:
+                obstacle_y = GROUND_Y - drawn['height'] - 40 - drawn['lift']
+                width = max(width, 35)
+            else:
+                obstacle_y = GROUND_Y - drawn['height']
+            obstacles.append([canvas_width, obstacle_y, width, drawn['height']])
+            obstacle_timer = 0
+
+        for obstacle in obstacles:
+            obstacle[0] -= speed
+        obstacles = [o for o in obstacles if not o[0] < -o[2]]
+
+        # Collisions
+        for ox, oy, ow, oh in obstacles:
+            if DINO_X < ox + ow and DINO_X + DINO_WIDTH > ox and y < oy + oh and y + height > oy:
+                return score
+
+    return None
+
+@register_verifier("Cosmic Dino Runner", replay_required=True)
+def verify_dino_run(claimed_score, run_log):
+    """Replay a Dino Runner run and compare with the claimed score"""
+    claimed_score = int(claimed_score)
+    max_frames = min(claimed_score + REPLAY_TOLERANCE_FRAMES, MAX_REPLAY_FRAMES)
+    events = run_log['events']
+
+    if events and events[-1][0] > claimed_score:
+        return {'status': VerificationStatus.QUARANTINED, 'simulated_score': None, 'frames': 0,
+                'reason': 'inputs logged after the claimed end of the run'}
+
+    seed = derive_run_seed(int(run_log['seed']), int(run_log.get('run', 0)))
+    simulated = simulate_run(seed, int(run_log.get('width', 800)), events, max_frames)
+    frames = simulated if simulated is not None else max_frames
+
+    if simulated == claimed_score:
+        status, reason = VerificationStatus.VERIFIED, None
+    elif simulated is None:
+        # Replay outlived the claim: not an inflated score, but the replay desynced
+        status, reason = VerificationStatus.FLAGGED, 'replay survived past the claimed score'
+    elif claimed_score - simulated <= REPLAY_TOLERANCE_FRAMES:
+        status, reason = VerificationStatus.FLAGGED, f'replay ended {claimed_score - simulated} frames early'
+    else:
+        status, reason = VerificationStatus.QUARANTINED, f'replay collides at {simulated}'
+
+    return {'status': status, 'simulated_score': simulated, 'frames': frames, 'reason': reason}
+
+def get_session_seed():
+    """Get (or issue) the obstacle seed for this player's session"""
+    if 'dino_seed' not in session:
+        session['dino_seed'] = secrets.randbits(32)
+    return session['dino_seed']
+
+def is_known_seed(seed):
+    """Check that a submitted seed was handed out by the server"""
+    return seed in (session.get('dino_seed'), get_daily_seed())
+
+def issue_run(daily=False):
+    """
+    Hand out the (seed, run index) the next game plays
+
+    Run indices come from a server-side counter so a player can't pick an
+    easy obstacle stream offline. The daily challenge is the same stream for
+    everyone (today's seed, run 0). Only the last MAX_OPEN_RUNS unsubmitted
+    runs stay valid.
+    """
+    if daily:
+        seed, run_index = get_daily_seed(), 0
+    else:
+        seed, run_index = get_session_seed(), session.get('dino_next_run', 0)
+        session['dino_next_run'] = run_index + 1
+    session['dino_open_runs'] = (session.get('dino_open_runs', []) + [[seed, run_index]])[-MAX_OPEN_RUNS:]
+    return seed, run_index
+
+def consume_run(seed, run_index):
+    """Close an issued run; False if it was never issued or already submitted"""
+    open_runs = session.get('dino_open_runs', [])
+    if [seed, run_index] not in open_runs:
+        return False
+    open_runs.remove([seed, run_index])
+    session['dino_open_runs'] = open_runs
+    return True
+
 @dino_runner.route('/')
 def index():
     """Main dinosaur runner game page"""
@@ -12,6 +262,7 @@ def index():
     if 'dino_high_score' not in session:
         session['dino_high_score'] = 0
     
+    record_request_play('Cosmic Dino Runner')
     return render_template('dino_runner.html', high_score=session['dino_high_score'])
 
 @dino_runner.route('/save-score', methods=['POST'])
@@ -21,14 +272,45 @@ def save_score():
         data = request.get_json()
         score = int(data.get('score', 0))
         
+        # Remember which obstacle stream the run used so it can be replayed later
+        verification_id = None
+        if data.get('input_log') and data.get('seed') is None:
+            return jsonify({'error': 'Input log without an issued run'}), 400
+        if data.get('seed') is not None:
+            seed = int(data['seed'])
+            run_index = int(data.get('run', -1))
+            if not is_known_seed(seed):
+                return jsonify({'error': 'Unknown obstacle seed'}), 400
+            if not consume_run(seed, run_index):
+                return jsonify({'error': 'Run was not issued or was already submitted'}), 400
+            session['dino_last_run'] = {
+                'seed': seed,
+                'run': run_index,
+                'score': score
+            }
+            
+            # Optional input log - queue the run for background replay
+            if data.get('input_log') and score > 0:
+                run_log = dict(data['input_log'], seed=seed, run=run_index)
+                try:
+                    verification_id = submit_run_for_verification(
+                        "Cosmic Dino Runner", score, run_log, session.get('session_id', 'unknown'))
+                except InvalidInputLog as e:
+                    return jsonify({'error': str(e)}), 400
+        
         # Update session high score
         is_new_record = score > session.get('dino_high_score', 0)
         if is_new_record:
             session['dino_high_score'] = score
             session.permanent = True
         
-        # Submit to leaderboard system
-        result = submit_score_higher_better("Cosmic Dino Runner", score, "points")
+        # Only runs the server issued and can replay are ranked; anything else
+        # (no run, no input log) just updates the personal high score
+        if verification_id is not None:
+            result = submit_score_higher_better("Cosmic Dino Runner", score, "points",
+                                                verification_id=verification_id)
+        else:
+            result = {'success': False, 'error': 'Only replayable runs are ranked'}
         
         return jsonify({
             'new_record': is_new_record,
@@ -45,41 +327,43 @@ def reset_score():
     session['dino_high_score'] = 0
     return jsonify({'high_score': 0})
 
+@dino_runner.route('/seed')
+def get_seed():
+    """Hand out the obstacle seed once per page load (plus today's challenge seed)"""
+    today = datetime.date.today()
+    return jsonify({
+        'seed': get_session_seed(),
+        'daily_seed': get_daily_seed(today),
+        'date': today.isoformat(),
+        'spawn_interval': OBSTACLE_SPAWN_TIME
+    })
+
+@dino_runner.route('/start-run', methods=['POST'])
+def start_run():
+    """Issue the seed and run index the next game plays (?daily=1 for the daily challenge)"""
+    seed, run_index = issue_run(daily=request.args.get('daily') == '1')
+    return jsonify({'seed': seed, 'run': run_index})
+
 @dino_runner.route('/get-obstacles')
 def get_obstacles():
-    """Generate random obstacle pattern for variety"""
-    obstacles = []
-    for i in range(5):
-        obstacle_type = random.choice(['cactus_small', 'cactus_large', 'bird'])
-        obstacles.append({
-            'type': obstacle_type,
-            'spacing': random.randint(150, 300)
-        })
-    return jsonify({'obstacles': obstacles})
+    """Expand an obstacle seed server-side (debugging and replay checks)"""
+    try:
+        seed = int(request.args.get('seed', get_session_seed()))
+        run_index = int(request.args.get('run', 0))
+        count = min(int(request.args.get('count', 5)), MAX_OBSTACLES_PER_REQUEST)
+    except ValueError:
+        return jsonify({'error': 'Invalid seed parameters'}), 400
+    
+    return jsonify({
+        'seed': seed,
+        'run': run_index,
+        'obstacles': generate_obstacles(derive_run_seed(seed, run_index), count)
+    })
 
 @dino_runner.route('/leaderboard')
 def leaderboard():
-    """Get leaderboard widget HTML"""
+    """Get leaderboard widget HTML (served from the shared widget render cache)"""
     try:
-        from website.leaderboard.leaderboard import get_leaderboard
-        leaderboard_data = get_leaderboard("Cosmic Dino Runner", limit=5)
-        
-        # Create simple HTML widget
-        html = '<div style="background: rgba(0,0,0,0.1); border-radius: 10px; padding: 1rem; margin-top: 1rem;">'
-        html += '<h4 style="color: rgba(255,255,255,0.9); margin: 0 0 0.5rem 0;">🏆 Top Scores</h4>'
-        
-        if leaderboard_data and leaderboard_data.get('scores'):
-            html += '<div style="font-size: 0.9rem;">'
-            for i, entry in enumerate(leaderboard_data['scores']):
-                if i >= 5:  # Limit to top 5
-                    break
-                medal = ['🥇', '🥈', '🥉'][i] if i < 3 else '🏅'
-                html += f'<div style="color: rgba(255,255,255,0.8); margin: 0.2rem 0;">{medal} {entry["username"]}: {entry["score"]:,}</div>'
-            html += '</div>'
-        else:
-            html += '<div style="color: rgba(255,255,255,0.6); font-style: italic;">No scores yet. Be the first!</div>'
-        
-        html += '</div>'
-        return jsonify({'html': html})
+        return widget_response("Cosmic Dino Runner", limit=5, style='compact', as_json=True)
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
\ No newline at end of file
+        return jsonify({'error': str(e)}), 500
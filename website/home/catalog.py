@@ -0,0 +1,88 @@
+"""
+Faceted catalog engine over the game list
+
+Facet postings (facet value -> set of game positions) and their counts are
+built once when the catalog is created. Filters on several facets are
+answered by intersecting those sets, and several values for one facet by
+their union, so the hub routes never re-scan the games list.
+
+Default facets are category, tag and difficulty; callers can add their own
+(test_home adds 'featured'). String values are matched case-insensitively.
+"""
+
+from collections import defaultdict
+
+DEFAULT_FACETS = {
+    'category': lambda game: [game.get('category')],
+    'tag': lambda game: game.get('tags', []),
+    # Same default validate_game_data() fills in (it runs after the catalog is built)
+    'difficulty': lambda game: [game.get('difficulty', 3)]
+}
+
+def _normalize(value):
+    return value.lower() if isinstance(value, str) else value
+
+class Catalog:
+    """Immutable facet index over a list of game dicts (catalog order is preserved)"""
+
+    def __init__(self, games, facets=None):
+        self.games = list(games)
+        self.facets = dict(DEFAULT_FACETS, **(facets or {}))
+        self.positions = {game['name']: position for position, game in enumerate(self.games)}
+        self.all_ids = frozenset(range(len(self.games)))
+
+        postings = {facet: defaultdict(set) for facet in self.facets}
+        for position, game in enumerate(self.games):
+            for facet, values_of in self.facets.items():
+                for value in values_of(game):
+                    if value is not None:
+                        postings[facet][_normalize(value)].add(position)
+
+        self.postings = {facet: {value: frozenset(ids) for value, ids in values.items()}
+                         for facet, values in postings.items()}
+        self._counts = {facet: {value: len(ids) for value, ids in values.items()}
+                        for facet, values in self.postings.items()}
+
+    def ids(self, **filters):
+        """
+        Positions of games matching every facet filter
+
+        A filter value may be a single value or a list/tuple/set of values
+        (any of them); None or empty filters are ignored.
+        """
+        matched = self.all_ids
+        for facet, wanted in filters.items():
+            if wanted is None or wanted == '' or wanted == []:
+                continue
+            facet_postings = self.postings[facet]
+            if isinstance(wanted, (list, tuple, set, frozenset)):
+                ids = frozenset().union(*(facet_postings.get(_normalize(value), frozenset())
+                                          for value in wanted))
+            else:
+                ids = facet_postings.get(_normalize(wanted), frozenset())
+            matched = matched & ids
+            if not matched:
+                break
+        return sorted(matched)
+
+    def query(self, **filters):
+        """Games matching every facet filter, in catalog order"""
+        return [self.games[position] for position in self.ids(**filters)]
+
+    def names(self, **filters):
+        """Names of games matching every facet filter, as a set"""
+        return {self.games[position]['name'] for position in self.ids(**filters)}
+
+    def counts(self, facet):
+        """Precomputed {value: game count} for a facet"""
+        return dict(self._counts[facet])
+
+    def values(self, facet):
+        """Sorted distinct values of a facet"""
+        return sorted(self._counts[facet], key=str)
+
+    def facet_counts(self, facet, ids):
+        """{value: count} of a facet among a subset of positions (e.g. a search result)"""
+        ids = set(ids)
+        return {value: len(ids & postings)
+                for value, postings in self.postings[facet].items() if not ids.isdisjoint(postings)}
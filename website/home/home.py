@@ -5,11 +5,14 @@ Designed for easy maintenance and game additions with user progress tracking
 Updated for direct navigation (no popups)
 """
 
-from flask import Blueprint, render_template, jsonify, request, session
+from flask import Blueprint, render_template, jsonify, request, session, url_for
 import json
-from collections import defaultdict
 import datetime
-from website.leaderboard.leaderboard import get_leaderboard
+from website.leaderboard.leaderboard import get_top_n_for_games
+from website.startup import deferred_init
+from website.pagecache import cached_page
+from .catalog import Catalog
+from .search import SearchIndex
 
 # Create blueprint with template folder
 home = Blueprint('home', __name__, template_folder='templates')
@@ -65,54 +68,38 @@ GAMES_DATA = [
     },
 ]
 
+# Built once here and shared by home, test_home and the navigation search
+SEARCH_INDEX = SearchIndex(GAMES_DATA)
+CATALOG = Catalog(GAMES_DATA)
+
 # ===== HELPER FUNCTIONS =====
 
 def get_categories():
     """Get all unique categories from games data"""
-    categories = set()
-    for game in GAMES_DATA:
-        categories.add(game['category'])
-    return sorted(list(categories))
+    return CATALOG.values('category')
 
 def get_category_counts():
     """Get count of games per category"""
-    counts = defaultdict(int)
-    for game in GAMES_DATA:
-        counts[game['category']] += 1
-    return dict(counts)
+    return CATALOG.counts('category')
 
 def get_games_by_category(category=None):
     """Get games filtered by category"""
-    if not category:
-        # Return clean copy of games data for direct navigation
-        return [dict(game) for game in GAMES_DATA]
-    return [dict(game) for game in GAMES_DATA if game['category'] == category]
+    # Return clean copies of games data for direct navigation
+    return [dict(game) for game in CATALOG.query(category=category)]
+
+def get_catalog_filters(args):
+    """Facet filters from request args: ?category=&tag=&tag=&difficulty="""
+    return {
+        'category': args.get('category') or None,
+        'tag': args.getlist('tag') or None,
+        'difficulty': args.get('difficulty', type=int)
+    }
 
 def search_games(query):
-    """Search games by name, description, or tags"""
+    """Search games by name, description, or tags (best matches first)"""
     if not query:
         return [dict(game) for game in GAMES_DATA]
-    
-    query = query.lower()
-    results = []
-    
-    for game in GAMES_DATA:
-        # Search in name
-        if query in game['name'].lower():
-            results.append(dict(game))
-            continue
-            
-        # Search in description
-        if query in game['description'].lower():
-            results.append(dict(game))
-            continue
-            
-        # Search in tags
-        if any(query in tag.lower() for tag in game['tags']):
-            results.append(dict(game))
-            continue
-    
-    return results
+    return [dict(game) for game in SEARCH_INDEX.search(query)]
 
 def get_mock_user_stats():
     """Generate mock user statistics for demonstration"""
@@ -143,37 +130,28 @@ def get_daily_game():
     game_index = day_of_year % len(GAMES_DATA)
     return dict(GAMES_DATA[game_index])
 
-def get_game_leaderboard_data(game_name, limit=3):
+# Top players shown on each home page card
+HOME_LEADERBOARD_SIZE = 3
+
+def get_game_leaderboard_data(game_name, limit=HOME_LEADERBOARD_SIZE):
     """Get top leaderboard entries for a specific game"""
-    try:
-        leaderboard_data = get_leaderboard(game_name, limit=limit)
-        if leaderboard_data and 'scores' in leaderboard_data:
-            # Return top entries
-            return leaderboard_data['scores'][:limit]
-        return []
-    except Exception as e:
-        print(f"Error fetching leaderboard for {game_name}: {e}")
-        return []
+    return get_top_n_for_games([game_name], limit)[game_name]
 
 def enhance_games_with_leaderboards(games):
-    """Add leaderboard data to games that have it"""
+    """Add leaderboard data to games that have it (one query for all games)"""
+    top_scores = get_top_n_for_games([game['name'] for game in games], HOME_LEADERBOARD_SIZE)
     enhanced_games = []
     for game in games:
         game_copy = dict(game)
-        # Add leaderboard data if available
-        if game['name'] == 'Space Invaders':
-            game_copy['leaderboard'] = get_game_leaderboard_data('Space Invaders')
-        else:
-            # Check for other games by name matching
-            leaderboard_data = get_game_leaderboard_data(game['name'])
-            if leaderboard_data:
-                game_copy['leaderboard'] = leaderboard_data
+        if top_scores.get(game['name']):
+            game_copy['leaderboard'] = top_scores[game['name']]
         enhanced_games.append(game_copy)
     return enhanced_games
 
 # ===== ROUTES =====
 
 @home.route('/')
+@cached_page(vary_args=('category', 'search'))
 def index():
     """
     Main test homepage route - displays enhanced viral game collection
@@ -219,18 +197,51 @@ def api_search():
     query = request.args.get('q', '')
     category = request.args.get('category', '')
     
-    # Apply filters
+    # Facet filters are set intersections in the catalog; the query ranks within them
+    matching_ids = CATALOG.ids(**get_catalog_filters(request.args))
     if query:
-        games = search_games(query)
+        allowed = {CATALOG.games[position]['name'] for position in matching_ids}
+        games = [game for game in search_games(query) if game['name'] in allowed]
     else:
-        games = get_games_by_category(category if category else None)
+        games = [dict(CATALOG.games[position]) for position in matching_ids]
     
+    result_ids = [CATALOG.positions[game['name']] for game in games]
     return jsonify({
         'success': True,
         'games': games,
         'count': len(games),
         'query': query,
-        'category': category
+        'category': category,
+        'facets': {
+            'category': CATALOG.facet_counts('category', result_ids),
+            'difficulty': CATALOG.facet_counts('difficulty', result_ids)
+        }
+    })
+
+AUTOCOMPLETE_LIMIT = 8
+AUTOCOMPLETE_MAX_LIMIT = 20
+
+@home.route('/api/autocomplete')
+def api_autocomplete():
+    """
+    Typo-tolerant suggestions for search dropdowns - only the fields they render
+    """
+    query = request.args.get('q', '')
+    limit = min(request.args.get('limit', AUTOCOMPLETE_LIMIT, type=int), AUTOCOMPLETE_MAX_LIMIT)
+    
+    suggestions = []
+    for game in SEARCH_INDEX.search(query, limit=max(limit, 0)):
+        suggestions.append({
+            'name': game['name'],
+            'icon': game.get('icon', '🎮'),
+            'category': game['category'],
+            'url': url_for(game['endpoint']) if game.get('endpoint') else None
+        })
+    
+    return jsonify({
+        'success': True,
+        'query': query,
+        'suggestions': suggestions
     })
 
 @home.route('/api/categories')
@@ -293,16 +304,11 @@ def stats():
         'average_difficulty': 0
     }
     
-    # Calculate difficulty breakdown
-    difficulty_counts = defaultdict(int)
-    total_difficulty = 0
-    
-    for game in GAMES_DATA:
-        difficulty = game.get('difficulty', 3)
-        difficulty_counts[difficulty] += 1
-        total_difficulty += difficulty
+    # Difficulty breakdown from the precomputed facet counts
+    difficulty_counts = CATALOG.counts('difficulty')
+    total_difficulty = sum(difficulty * count for difficulty, count in difficulty_counts.items())
     
-    stats_data['difficulty_breakdown'] = dict(difficulty_counts)
+    stats_data['difficulty_breakdown'] = difficulty_counts
     stats_data['average_difficulty'] = round(total_difficulty / len(GAMES_DATA), 1)
     
     return jsonify({
@@ -328,6 +334,7 @@ def add_game(name, description, endpoint, icon, category, tags, difficulty=3):
     }
     return new_game
 
+@deferred_init('validate game data')
 def validate_game_data():
     """
     Validate that all games have required fields
@@ -347,5 +354,4 @@ def validate_game_data():
         if 'difficulty' not in game:
             game['difficulty'] = 3
 
-# Run validation when module loads
-validate_game_data()
+# Validation runs once per process before the first request (see website/startup.py)
@@ -0,0 +1,232 @@
+"""
+Inverted search index over the game catalog
+
+Built once from GAMES_DATA when the home blueprint loads and shared by the
+home page, the test_home hub and the navigation search, so a query costs a
+few dictionary lookups regardless of catalog size instead of lowercasing and
+scanning every name, description and tag.
+
+Each query word matches indexed tokens four ways, best first:
+- exact token          ('space'  -> space)
+- token prefix         ('inv'    -> invaders), via bisect on the sorted vocabulary
+- token infix (n-gram) ('vader'  -> invaders), via a trigram -> token table
+- fuzzy (typos)        ('spce'   -> space), only when the word matched nothing
+                       above: trigram similarity against every token's
+                       precomputed padded trigram set, with candidates pruned
+                       by length and by probing only the rarest query trigrams
+
+A game must match every query word. Its score sums the best match for each
+word weighted by the field it was found in (name > tags > category >
+description), plus a bonus when the whole query appears in the name.
+"""
+
+import bisect
+import heapq
+import math
+import re
+from collections import Counter, defaultdict
+
+TOKEN_PATTERN = re.compile(r'[a-z0-9]+')
+
+FIELD_WEIGHTS = {
+    'name': 5.0,
+    'tags': 3.0,
+    'category': 2.0,
+    'description': 1.0
+}
+
+MATCH_WEIGHTS = {
+    'exact': 1.0,
+    'prefix': 0.7,
+    'infix': 0.4,
+    'fuzzy': 0.5  # Scaled by the trigram similarity
+}
+
+NAME_PHRASE_BONUS = 5.0
+NGRAM_SIZE = 3
+
+# Jaccard similarity of padded trigram sets needed for a fuzzy match (pg_trgm's default)
+FUZZY_THRESHOLD = 0.3
+
+def tokenize(text):
+    """Lowercase alphanumeric words of a string"""
+    return TOKEN_PATTERN.findall(text.lower())
+
+def _ngrams(token):
+    return {token[i:i + NGRAM_SIZE] for i in range(len(token) - NGRAM_SIZE + 1)}
+
+def padded_trigrams(token):
+    """Trigrams with word-boundary padding, so short words and first letters count"""
+    return frozenset(_ngrams(f"  {token} "))
+
+class SearchIndex:
+    """Immutable inverted index over a list of game dicts"""
+
+    def __init__(self, games):
+        self.games = list(games)
+        self.names = [game['name'].lower() for game in self.games]
+        self.postings = defaultdict(dict)  # token -> {game position: field weight}
+        self.terms = []  # Per game: space-joined name/tag/category tokens for client-side filters
+
+        for position, game in enumerate(self.games):
+            fields = {
+                'name': game['name'],
+                'tags': ' '.join(game.get('tags', [])),
+                'category': game.get('category', ''),
+                'description': game.get('description', '')
+            }
+            for field, text in fields.items():
+                for token in tokenize(text):
+                    # A token keeps the weight of the best field it appears in
+                    current = self.postings[token].get(position, 0)
+                    self.postings[token][position] = max(current, FIELD_WEIGHTS[field])
+            self.terms.append(' '.join(dict.fromkeys(
+                tokenize(fields['name']) + tokenize(fields['tags']) + tokenize(fields['category']))))
+
+        self.vocabulary = sorted(self.postings)
+        self.ngram_tokens = defaultdict(set)  # n-gram -> tokens containing it
+        self.token_trigrams = {}  # token -> padded trigram set (fuzzy matching)
+        self.trigram_tokens = defaultdict(set)  # padded trigram -> tokens containing it
+        for token in self.vocabulary:
+            for gram in _ngrams(token):
+                self.ngram_tokens[gram].add(token)
+            self.token_trigrams[token] = padded_trigrams(token)
+            for gram in self.token_trigrams[token]:
+                self.trigram_tokens[gram].add(token)
+        self.positions = {game['name']: position for position, game in enumerate(self.games)}
+
+    def _expand(self, word):
+        """Indexed tokens matching one query word, as {token: match weight}"""
+        matches = {}
+        if word in self.postings:
+            matches[word] = MATCH_WEIGHTS['exact']
+
+        position = bisect.bisect_left(self.vocabulary, word)
+        while position < len(self.vocabulary) and self.vocabulary[position].startswith(word):
+            matches.setdefault(self.vocabulary[position], MATCH_WEIGHTS['prefix'])
+            position += 1
+
+        grams = _ngrams(word)
+        if grams:
+            candidates = set.intersection(*(self.ngram_tokens.get(gram, set()) for gram in grams))
+            for token in candidates:
+                if word in token:
+                    matches.setdefault(token, MATCH_WEIGHTS['infix'])
+        return matches
+
+    def fuzzy_matches(self, word, threshold=FUZZY_THRESHOLD):
+        """Tokens within trigram similarity `threshold` of a word, as {token: similarity}"""
+        grams = padded_trigrams(word)
+        size = len(grams)
+        # Jaccard >= t needs overlap >= t * |query|, and a token size within [t, 1/t] x |query|
+        min_overlap = max(1, math.ceil(threshold * size))
+        min_size, max_size = threshold * size, size / threshold
+
+        # Any match shares min_overlap trigrams, so it must contain one of the
+        # (size - min_overlap + 1) rarest ones - the common trigrams are never probed
+        probes = sorted(grams, key=lambda gram: len(self.trigram_tokens.get(gram, ())))
+        overlaps = Counter()
+        for gram in probes[:size - min_overlap + 1]:
+            overlaps.update(self.trigram_tokens.get(gram, ()))
+
+        matches = {}
+        for token in overlaps:
+            token_grams = self.token_trigrams[token]
+            if not min_size <= len(token_grams) <= max_size:
+                continue
+            overlap = len(grams & token_grams)
+            similarity = overlap / (size + len(token_grams) - overlap)
+            if similarity >= threshold:
+                matches[token] = similarity
+        return matches
+
+    def score(self, query, limit=None, fuzzy=True):
+        """
+        Rank games for a query
+
+        Args:
+            limit: keep only the top `limit` (heap selection instead of a full sort)
+            fuzzy: fall back to typo-tolerant matching for words that match nothing
+
+        Returns:
+            list: (game position, score) pairs, best first, catalog order on ties
+        """
+        words = tokenize(query)
+        if not words:
+            return []
+
+        scores = None
+        for word in words:
+            matches = self._expand(word)
+            if not matches and fuzzy:
+                matches = {token: MATCH_WEIGHTS['fuzzy'] * similarity
+                           for token, similarity in self.fuzzy_matches(word).items()}
+            word_scores = {}
+            for token, match_weight in matches.items():
+                for position, field_weight in self.postings[token].items():
+                    score = match_weight * field_weight
+                    if score > word_scores.get(position, 0):
+                        word_scores[position] = score
+            if scores is None:
+                scores = word_scores
+            else:
+                # Every word must match
+                scores = {position: scores[position] + score
+                          for position, score in word_scores.items() if position in scores}
+            if not scores:
+                return []
+
+        phrase = ' '.join(words)
+        for position in scores:
+            if phrase in self.names[position]:
+                scores[position] += NAME_PHRASE_BONUS
+        rank = lambda item: (-item[1], item[0])
+        if limit is not None:
+            return heapq.nsmallest(limit, scores.items(), key=rank)
+        return sorted(scores.items(), key=rank)
+
+    def search(self, query, limit=None, fuzzy=True):
+        """Games matching a query, best first"""
+        return [self.games[position] for position, _ in self.score(query, limit, fuzzy)]
+
+    def search_page(self, query, category=None, offset=0, limit=20, names=None):
+        """
+        One page of ranked results plus per-category facet counts
+
+        Args:
+            query: search text (empty = every game in catalog order)
+            category: only return games in this category (case-insensitive);
+                      facets are still counted over all matches
+            names: optional set restricting which games are eligible
+
+        Returns:
+            dict: {'total', 'results': [(game, score)], 'facets': {category: count}}
+        """
+        if query.strip():
+            ranked = self.score(query)
+        else:
+            ranked = [(position, 0.0) for position in range(len(self.games))]
+        if names is not None:
+            ranked = [(position, score) for position, score in ranked
+                      if self.games[position]['name'] in names]
+
+        facets = Counter(self.games[position].get('category', '') for position, _ in ranked)
+        if category:
+            wanted = category.lower()
+            ranked = [(position, score) for position, score in ranked
+                      if self.games[position].get('category', '').lower() == wanted]
+
+        return {
+            'total': len(ranked),
+            'results': [(self.games[position], score) for position, score in ranked[offset:offset + limit]],
+            'facets': dict(facets)
+        }
+
+    def search_names(self, query, limit=None, fuzzy=True):
+        """Just the matching game names, best first"""
+        return [game['name'] for game in self.search(query, limit, fuzzy)]
+
+    def search_terms(self, game_name):
+        """Precomputed lowercase search terms for a game (navigation data-search)"""
+        position = self.positions.get(game_name)
+        return self.terms[position] if position is not None else game_name.lower()
@@ -0,0 +1,210 @@
+"""
+Policy-driven admin cleanup of whole leaderboards
+
+A cleanup policy names the games it removes by substring. Matching is done in
+Python against the (small) list of known game names, which comes from the
+game_configs registry plus a loose index scan of leaderboard_entries, so
+nothing runs a leading-wildcard LIKE over the entries table. Counts and
+deletes then use exact game_name keys, which the (game_name, ...) indexes
+answer directly. Deletes run in chunked transactions on a background thread,
+with progress committed to cleanup_jobs alongside each chunk.
+"""
+
+import json
+import threading
+import time
+import uuid
+
+# ===== POLICIES =====
+
+CLEANUP_POLICIES = {
+    'legacy_modes': {
+        'description': 'Old "React Mode" and "Predict Mode" leaderboards',
+        'name_contains': ['React Mode', 'Predict Mode']
+    }
+}
+
+DEFAULT_CLEANUP_POLICY = 'legacy_modes'
+CLEANUP_CHUNK_SIZE = 1000
+
+# Per-game tables cleared along with the entries, as (table, key column)
+GAME_KEYED_TABLES = [
+    ('period_leaderboard_entries', 'game_name'),
+    ('user_bests', 'game_name'),
+    ('game_score_histograms', 'game_name'),
+    ('score_distributions', 'game_name'),
+    ('score_outlier_flags', 'game_name'),
+    # Held scores before their runs, so a late verdict or admin release finds
+    # nothing to re-add (release_held_score -> add_score would recreate the game)
+    ('quarantined_scores', 'game_name'),
+    ('run_verifications', 'game_name'),
+    ('play_events', 'game_name'),
+    ('game_stats', 'game_name'),
+    ('game_configs', 'game_name')
+]
+
+# ===== GAME RESOLUTION =====
+
+def _known_game_names(cursor):
+    """
+    Every game name in the database: the game_configs registry plus any
+    names only present in leaderboard_entries, found by hopping through the
+    game_name index one distinct value at a time (one seek per game)
+    """
+    cursor.execute('SELECT game_name FROM game_configs')
+    names = {row[0] for row in cursor.fetchall()}
+
+    cursor.execute('SELECT MIN(game_name) FROM leaderboard_entries')
+    name = cursor.fetchone()[0]
+    while name is not None:
+        names.add(name)
+        cursor.execute('SELECT MIN(game_name) FROM leaderboard_entries WHERE game_name > ?', (name,))
+        name = cursor.fetchone()[0]
+
+    return sorted(names)
+
+def resolve_policy_games(cursor, policy_name):
+    """Exact game names a policy applies to"""
+    patterns = CLEANUP_POLICIES[policy_name]['name_contains']
+    return [name for name in _known_game_names(cursor)
+            if any(pattern in name for pattern in patterns)]
+
+def preview_cleanup(policy_name=DEFAULT_CLEANUP_POLICY):
+    """
+    Dry run: per-game entry counts for a policy (index-only COUNT per game)
+
+    Returns:
+        dict: {'policy', 'description', 'games': [{'game_name', 'entries'}], 'total_entries'}
+    """
+    from website.leaderboard.leaderboard import get_db_connection
+    games = []
+    try:
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            for game_name in resolve_policy_games(cursor, policy_name):
+                cursor.execute('SELECT COUNT(*) FROM leaderboard_entries WHERE game_name = ?', (game_name,))
+                games.append({'game_name': game_name, 'entries': cursor.fetchone()[0]})
+    except Exception as e:
+        print(f"Error previewing cleanup: {e}")
+
+    return {
+        'policy': policy_name,
+        'description': CLEANUP_POLICIES[policy_name]['description'],
+        'games': games,
+        'total_entries': sum(game['entries'] for game in games)
+    }
+
+# ===== EXECUTION =====
+
+def _save_job(cursor, job):
+    cursor.execute('''
+        INSERT OR REPLACE INTO cleanup_jobs
+        (id, policy, status, games, games_done, current_game, entries_total,
+         entries_deleted, configs_deleted, error, started_at, finished_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ''', (job['id'], job['policy'], job['status'], json.dumps(job['games']), job['games_done'],
+          job['current_game'], job['entries_total'], job['entries_deleted'], job['configs_deleted'],
+          job['error'], job['started_at'], job['finished_at']))
+
+def _delete_game(game_name, job):
+    """Delete one game's entries in chunks, then its per-game rows"""
+    from website.leaderboard.leaderboard import get_db_connection
+    while True:
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                DELETE FROM leaderboard_entries WHERE id IN (
+                    SELECT id FROM leaderboard_entries WHERE game_name = ? LIMIT ?
+                )
+            ''', (game_name, CLEANUP_CHUNK_SIZE))
+            deleted = cursor.rowcount
+            job['entries_deleted'] += deleted
+            # Progress is committed with each chunk, so any worker can report it
+            _save_job(cursor, job)
+            conn.commit()
+        if deleted < CLEANUP_CHUNK_SIZE:
+            break
+
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        for table, column in GAME_KEYED_TABLES:
+            cursor.execute(f'DELETE FROM {table} WHERE {column} = ?', (game_name,))
+            if table == 'game_configs':
+                job['configs_deleted'] += cursor.rowcount
+        job['games_done'] += 1
+        _save_job(cursor, job)
+        conn.commit()
+
+def _run_cleanup(job):
+    from website.leaderboard.leaderboard import get_db_connection, invalidate_games_summary
+    from website.leaderboard.widgets import invalidate_game_widgets
+    from website.leaderboard.plays import forget_game_plays
+    try:
+        for game_name in job['games']:
+            job['current_game'] = game_name
+            forget_game_plays(game_name)  # Or the next flush writes them back
+            _delete_game(game_name, job)
+            invalidate_game_widgets(game_name)
+            invalidate_games_summary()
+        job['status'] = 'done'
+    except Exception as e:
+        print(f"Error running cleanup {job['id']}: {e}")
+        job['status'] = 'error'
+        job['error'] = str(e)
+
+    job['current_game'] = None
+    job['finished_at'] = time.time()
+    try:
+        with get_db_connection() as conn:
+            _save_job(conn.cursor(), job)
+            conn.commit()
+    except Exception as e:
+        print(f"Error saving cleanup {job['id']}: {e}")
+
+def start_cleanup(policy_name=DEFAULT_CLEANUP_POLICY):
+    """
+    Start deleting a policy's games on a background thread
+
+    Returns:
+        str: job id for get_cleanup_progress
+    """
+    from website.leaderboard.leaderboard import get_db_connection
+    preview = preview_cleanup(policy_name)
+    job = {
+        'id': uuid.uuid4().hex[:12],
+        'policy': policy_name,
+        'status': 'running',
+        'games': [game['game_name'] for game in preview['games']],
+        'games_done': 0,
+        'current_game': None,
+        'entries_total': preview['total_entries'],
+        'entries_deleted': 0,
+        'configs_deleted': 0,
+        'error': None,
+        'started_at': time.time(),
+        'finished_at': None
+    }
+    with get_db_connection() as conn:
+        _save_job(conn.cursor(), job)
+        conn.commit()
+
+    threading.Thread(target=_run_cleanup, args=(job,), name=f"cleanup-{job['id']}", daemon=True).start()
+    return job['id']
+
+def get_cleanup_progress(job_id):
+    """Stored progress of a cleanup job (None if unknown)"""
+    from website.leaderboard.leaderboard import get_db_connection
+    try:
+        with get_db_connection() as conn:
+            row = conn.execute('SELECT * FROM cleanup_jobs WHERE id = ?', (job_id,)).fetchone()
+    except Exception as e:
+        print(f"Error reading cleanup {job_id}: {e}")
+        return None
+    if not row:
+        return None
+
+    progress = dict(row)
+    progress['games'] = json.loads(progress['games'])
+    total = progress['entries_total']
+    progress['percent'] = round(100 * progress['entries_deleted'] / total, 1) if total else 100.0
+    return progress
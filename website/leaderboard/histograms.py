@@ -0,0 +1,278 @@
+"""
+Precomputed per-game score histograms and percentile tables
+
+Each game has one row in game_score_histograms holding fixed-width bucket
+counts over ranking_score plus a small percentile table. add_score bumps a
+single bucket and recomputes the percentiles from the buckets (constant work),
+so "top X%" and distribution charts never scan leaderboard_entries.
+
+Rebuilds (one grouped query over the game's index range) leave
+HISTOGRAM_HEADROOM of empty span beyond the lowest and highest scores. A
+score still outside the span - a new record - is counted in the edge bucket
+instead of rescanning on the submit path, and the game is queued for the
+background refresher, which re-ranges it within HISTOGRAM_RERANGE_DELAY. The
+refresher also periodically rebuilds every row to pick up admin edits and
+deletes.
+"""
+
+import json
+import os
+import threading
+import time
+from datetime import datetime
+
+HISTOGRAM_BUCKETS = 20
+HISTOGRAM_HEADROOM = 0.25  # Share of the score range left empty beyond each extreme
+HISTOGRAM_REFRESH_SECONDS = 600
+HISTOGRAM_RERANGE_DELAY = 5  # Seconds a queued re-range waits, so a burst of records shares one
+PERCENTILE_POINTS = [10, 25, 50, 75, 90, 95, 99]
+
+# ===== BUCKET MATH =====
+
+def _bucket_index(row, ranking_score):
+    """Bucket for a score, clamped to the edge buckets"""
+    if row['bucket_width'] <= 0:
+        return 0
+    index = int((ranking_score - row['bucket_min']) / row['bucket_width'])
+    return max(0, min(index, len(row['counts']) - 1))
+
+def _score_at_fraction(row, fraction):
+    """Interpolated ranking_score below which `fraction` of entries fall"""
+    target = fraction * row['total']
+    seen = 0
+    for i, count in enumerate(row['counts']):
+        if count and seen + count >= target:
+            within = (target - seen) / count
+            return row['bucket_min'] + (i + within) * row['bucket_width']
+        seen += count
+    return row['bucket_min'] + len(row['counts']) * row['bucket_width']
+
+def _compute_percentiles(row):
+    """
+    Percentile table in 'better than X% of players' terms
+
+    For higher-is-better games p90 is the score that beats 90% of entries;
+    for lower-is-better games the table is mirrored so p90 is still the
+    score that beats 90% of entries.
+    """
+    if not row['total']:
+        return {}
+    table = {}
+    for point in PERCENTILE_POINTS:
+        fraction = point / 100 if row['higher_is_better'] else 1 - point / 100
+        # Headroom buckets are partly empty, so keep interpolation within the real scores
+        score = min(max(_score_at_fraction(row, fraction), row['min_score']), row['max_score'])
+        table[f'p{point}'] = round(score, 4)
+    return table
+
+def top_percent(row, ranking_score):
+    """Share of entries (in %) that are at least as good as this score - 'top X%'"""
+    if not row or not row['total']:
+        return None
+    index = _bucket_index(row, ranking_score)
+    bucket_start = row['bucket_min'] + index * row['bucket_width']
+    within = 0.0
+    if row['bucket_width'] > 0:
+        within = min(max((ranking_score - bucket_start) / row['bucket_width'], 0.0), 1.0)
+
+    below = sum(row['counts'][:index]) + row['counts'][index] * within
+    better_share = (row['total'] - below) / row['total'] if row['higher_is_better'] else below / row['total']
+    return round(max(better_share * 100, 0.1), 1)
+
+# ===== STORAGE =====
+
+def _load_row(cursor, game_name):
+    cursor.execute('''
+        SELECT game_name, bucket_min, bucket_width, bucket_counts, total, percentiles,
+               min_score, max_score, higher_is_better, rebuilt_at, updated_at
+        FROM game_score_histograms WHERE game_name = ?
+    ''', (game_name,))
+    row = cursor.fetchone()
+    if not row:
+        return None
+    row = dict(row)
+    row['counts'] = json.loads(row.pop('bucket_counts'))
+    row['percentiles'] = json.loads(row['percentiles'] or '{}')
+    row['higher_is_better'] = bool(row['higher_is_better'])
+    return row
+
+def _save_row(cursor, row):
+    cursor.execute('''
+        INSERT OR REPLACE INTO game_score_histograms
+        (game_name, bucket_min, bucket_width, bucket_counts, total, percentiles,
+         min_score, max_score, higher_is_better, rebuilt_at, updated_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+    ''', (row['game_name'], row['bucket_min'], row['bucket_width'], json.dumps(row['counts']),
+          row['total'], json.dumps(row['percentiles']), row['min_score'], row['max_score'],
+          row['higher_is_better'], row['rebuilt_at']))
+
+def rebuild_histogram(cursor, game_name, higher_is_better):
+    """Rebuild one game's histogram from its entries (background / first-insert path)"""
+    cursor.execute('''
+        SELECT MIN(ranking_score), MAX(ranking_score), COUNT(*)
+        FROM leaderboard_entries WHERE game_name = ?
+    ''', (game_name,))
+    low, high, total = cursor.fetchone()
+
+    if not total:
+        cursor.execute('DELETE FROM game_score_histograms WHERE game_name = ?', (game_name,))
+        return None
+
+    # Headroom so new records usually still land inside the span
+    padding = (high - low) * HISTOGRAM_HEADROOM if high > low else max(abs(high) * HISTOGRAM_HEADROOM, 1.0)
+    bucket_min = low - padding
+    width = (high - low + 2 * padding) / HISTOGRAM_BUCKETS
+    row = {
+        'game_name': game_name,
+        'bucket_min': bucket_min,
+        'bucket_width': width,
+        'counts': [0] * HISTOGRAM_BUCKETS,
+        'total': total,
+        'min_score': low,
+        'max_score': high,
+        'higher_is_better': higher_is_better,
+        'rebuilt_at': datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')
+    }
+
+    # Let SQLite do the bucketing - one pass over the game's index range
+    cursor.execute('''
+        SELECT MIN(CAST((ranking_score - ?) / ? AS INTEGER), ?) AS bucket, COUNT(*)
+        FROM leaderboard_entries WHERE game_name = ?
+        GROUP BY bucket
+    ''', (bucket_min, width, HISTOGRAM_BUCKETS - 1, game_name))
+    for bucket, count in cursor.fetchall():
+        row['counts'][max(0, bucket)] += count
+
+    row['percentiles'] = _compute_percentiles(row)
+    _save_row(cursor, row)
+    return row
+
+def update_histogram(cursor, game_name, ranking_score, higher_is_better):
+    """
+    Fold a new score into its game's histogram (call inside add_score's transaction)
+
+    Returns:
+        float: 'top X%' for the new score, or None
+    """
+    row = _load_row(cursor, game_name)
+    if row is None or row['higher_is_better'] != higher_is_better:
+        # First score for the game (a one-row scan) or ranking changed - build
+        # from the entries, which already include the new score
+        row = rebuild_histogram(cursor, game_name, higher_is_better)
+        return top_percent(row, ranking_score)
+
+    # Scores past the span (new records) go in the edge bucket; the refresher re-ranges
+    upper = row['bucket_min'] + len(row['counts']) * row['bucket_width']
+    if not row['bucket_min'] <= ranking_score <= upper:
+        request_rerange(game_name)
+    row['counts'][_bucket_index(row, ranking_score)] += 1
+    row['total'] += 1
+    row['min_score'] = min(row['min_score'], ranking_score)
+    row['max_score'] = max(row['max_score'], ranking_score)
+    row['percentiles'] = _compute_percentiles(row)
+    _save_row(cursor, row)
+    return top_percent(row, ranking_score)
+
+def get_score_distribution(game_name):
+    """Histogram and percentile table for a game (single primary-key lookup)"""
+    from website.leaderboard.leaderboard import get_db_connection
+    ensure_histogram_refresher()
+    try:
+        with get_db_connection() as conn:
+            row = _load_row(conn.cursor(), game_name)
+    except Exception as e:
+        print(f"Error getting score distribution: {e}")
+        return None
+
+    if not row:
+        return None
+
+    return {
+        'game_name': game_name,
+        'total_entries': row['total'],
+        'higher_is_better': row['higher_is_better'],
+        'min_score': row['min_score'],
+        'max_score': row['max_score'],
+        'buckets': [
+            {
+                'min': row['bucket_min'] + i * row['bucket_width'],
+                'max': row['bucket_min'] + (i + 1) * row['bucket_width'],
+                'count': count
+            }
+            for i, count in enumerate(row['counts'])
+        ],
+        'percentiles': row['percentiles'],
+        'rebuilt_at': row['rebuilt_at'],
+        'updated_at': row['updated_at']
+    }
+
+# ===== BACKGROUND REFRESH =====
+
+def rebuild_all_histograms():
+    """Rebuild every game's histogram from its entries"""
+    from website.leaderboard.leaderboard import get_db_connection
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute('SELECT game_name, higher_is_better FROM game_configs')
+        games = cursor.fetchall()
+        for game_name, higher_is_better in games:
+            rebuild_histogram(cursor, game_name, bool(higher_is_better))
+        conn.commit()
+    return len(games)
+
+_refresher_pid = None
+_refresher_lock = threading.Lock()
+_rerange_games = set()  # Games with scores clamped into an edge bucket
+_rerange_lock = threading.Lock()
+_rerange_wanted = threading.Event()
+
+def request_rerange(game_name):
+    """Queue a game's histogram for a rebuild by the refresher thread"""
+    with _rerange_lock:
+        _rerange_games.add(game_name)
+    _rerange_wanted.set()
+
+def _rerange_queued():
+    """Rebuild the queued games, one short transaction each"""
+    from website.leaderboard.leaderboard import get_db_connection
+    with _rerange_lock:
+        games = list(_rerange_games)
+        _rerange_games.clear()
+    for game_name in games:
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('SELECT higher_is_better FROM game_configs WHERE game_name = ?', (game_name,))
+            config = cursor.fetchone()
+            if config:
+                rebuild_histogram(cursor, game_name, bool(config[0]))
+                conn.commit()
+
+def _refresh_loop(interval):
+    next_full = time.monotonic() + interval
+    while True:
+        _rerange_wanted.wait(max(next_full - time.monotonic(), 0))
+        try:
+            if time.monotonic() >= next_full:
+                next_full = time.monotonic() + interval
+                _rerange_wanted.clear()
+                with _rerange_lock:
+                    _rerange_games.clear()
+                rebuild_all_histograms()
+            else:
+                time.sleep(HISTOGRAM_RERANGE_DELAY)
+                _rerange_wanted.clear()
+                _rerange_queued()
+        except Exception as e:
+            print(f"Error refreshing score histograms: {e}")
+
+def ensure_histogram_refresher(interval=HISTOGRAM_REFRESH_SECONDS):
+    """Start the refresher thread once per process (threads don't survive a fork)"""
+    global _refresher_pid
+    if _refresher_pid == os.getpid():
+        return
+    with _refresher_lock:
+        if _refresher_pid == os.getpid():
+            return
+        threading.Thread(target=_refresh_loop, args=(interval,),
+                         name='histogram-refresher', daemon=True).start()
+        _refresher_pid = os.getpid()
@@ -2,8 +2,22 @@
 from flask import Blueprint, request, session, jsonify, render_template, redirect, url_for, flash
 import sqlite3
 import os
+import copy
+import threading
+import time
 from datetime import datetime
 from contextlib import contextmanager
+from .widgets import widget_response, invalidate_game_widgets, clamp_limit
+from website.pagecache import invalidate_pages
+from website.singleflight import singleflight, singleflight_view
+from .verification import (wait_for_verification, hold_score, link_verification_entry, requires_replay,
+                           HELD_STATUSES)
+from .outliers import check_and_update_distribution
+from .histograms import update_histogram, get_score_distribution, ensure_histogram_refresher
+from .periods import record_period_entry, get_period_scores, is_valid_period
+from .retention import ensure_retention_compactor
+from .user_bests import update_user_best, get_player_rank, get_unique_player_scores
+from .migrations import run_migrations
 
 # Create the leaderboard blueprint
 leaderboard = Blueprint('leaderboard', __name__, template_folder='templates')
@@ -62,160 +76,9 @@ def get_db_connection():
             conn.close()
 
 def init_database():
-    """Initialize database tables"""
-    with get_db_connection() as conn:
-        cursor = conn.cursor()
-        
-        # Enhanced leaderboard entries table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS leaderboard_entries (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                game_name TEXT NOT NULL,
-                username TEXT NOT NULL,
-                score REAL NOT NULL,
-                ranking_score REAL NOT NULL,
-                original_score REAL NOT NULL,
-                score_type TEXT NOT NULL DEFAULT 'points',
-                ranking_method TEXT NOT NULL DEFAULT 'higher_is_better',
-                target_value REAL,
-                higher_is_better BOOLEAN NOT NULL DEFAULT 1,
-                timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
-                date_submitted DATE DEFAULT (date('now')),
-                ip_address TEXT,
-                session_id TEXT
-            )
-        ''')
-        
-        # Enhanced game configurations table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS game_configs (
-                game_name TEXT PRIMARY KEY,
-                score_type TEXT NOT NULL DEFAULT 'points',
-                ranking_method TEXT NOT NULL DEFAULT 'higher_is_better',
-                target_value REAL,
-                higher_is_better BOOLEAN NOT NULL DEFAULT 1,
-                max_entries_per_user INTEGER DEFAULT 10,
-                created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-                updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
-        
-        # Add new columns to existing tables if they don't exist
-        try:
-            cursor.execute('ALTER TABLE leaderboard_entries ADD COLUMN ranking_score REAL DEFAULT 0')
-        except sqlite3.OperationalError:
-            pass  # Column already exists
-        
-        try:
-            cursor.execute('ALTER TABLE leaderboard_entries ADD COLUMN original_score REAL DEFAULT 0')
-        except sqlite3.OperationalError:
-            pass
-        
-        try:
-            cursor.execute('ALTER TABLE leaderboard_entries ADD COLUMN ranking_method TEXT DEFAULT "higher_is_better"')
-        except sqlite3.OperationalError:
-            pass
-        
-        try:
-            cursor.execute('ALTER TABLE leaderboard_entries ADD COLUMN target_value REAL')
-        except sqlite3.OperationalError:
-            pass
-        
-        try:
-            cursor.execute('ALTER TABLE game_configs ADD COLUMN ranking_method TEXT DEFAULT "higher_is_better"')
-        except sqlite3.OperationalError:
-            pass
-        
-        try:
-            cursor.execute('ALTER TABLE game_configs ADD COLUMN target_value REAL')
-        except sqlite3.OperationalError:
-            pass
-        
-        # Update existing entries with missing data
-        cursor.execute('''
-            UPDATE leaderboard_entries 
-            SET ranking_score = score, original_score = score 
-            WHERE ranking_score IS NULL OR ranking_score = 0
-        ''')
-        
-        # Indexes for performance
-        cursor.execute('''
-            CREATE INDEX IF NOT EXISTS idx_leaderboard_game_ranking_score 
-            ON leaderboard_entries(game_name, ranking_score)
-        ''')
-        
-        cursor.execute('''
-            CREATE INDEX IF NOT EXISTS idx_leaderboard_game_timestamp 
-            ON leaderboard_entries(game_name, timestamp DESC)
-        ''')
-        
-        # User interactions tables for likes and favorites
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS user_likes (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                user_identifier TEXT NOT NULL,
-                game_name TEXT NOT NULL,
-                liked_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-                ip_address TEXT,
-                UNIQUE(user_identifier, game_name)
-            )
-        ''')
-        
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS user_favorites (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                user_identifier TEXT NOT NULL,
-                game_name TEXT NOT NULL,
-                favorited_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-                ip_address TEXT,
-                UNIQUE(user_identifier, game_name)
-            )
-        ''')
-        
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS game_stats (
-                game_name TEXT PRIMARY KEY,
-                total_likes INTEGER DEFAULT 0,
-                total_favorites INTEGER DEFAULT 0,
-                total_plays INTEGER DEFAULT 0,
-                last_updated DATETIME DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
-        
-        # Indexes for user interactions
-        cursor.execute('''
-            CREATE INDEX IF NOT EXISTS idx_user_likes_identifier 
-            ON user_likes(user_identifier)
-        ''')
-        
-        cursor.execute('''
-            CREATE INDEX IF NOT EXISTS idx_user_likes_game 
-            ON user_likes(game_name)
-        ''')
-        
-        cursor.execute('''
-            CREATE INDEX IF NOT EXISTS idx_user_favorites_identifier 
-            ON user_favorites(user_identifier)
-        ''')
-        
-        cursor.execute('''
-            CREATE INDEX IF NOT EXISTS idx_user_favorites_game 
-            ON user_favorites(game_name)
-        ''')
-        
-        cursor.execute('''
-            CREATE INDEX IF NOT EXISTS idx_leaderboard_username 
-            ON leaderboard_entries(username)
-        ''')
-        
-        conn.commit()
-        print("Database initialized successfully")
-
-# Initialize database on import
-try:
-    init_database()
-except Exception as e:
-    print(f"WARNING: Database initialization failed: {e}")
+    """Initialize database tables (applies any pending schema migrations)"""
+    applied = run_migrations()
+    print(f"Database initialized successfully (applied migrations: {applied or 'none'})")
 
 # ===== RANKING CALCULATION FUNCTIONS (NEW) =====
 
@@ -268,7 +131,7 @@ def is_higher_better_for_ranking(ranking_method):
 
 # ===== ENHANCED CORE FUNCTIONS =====
 
-def add_score(game_name, username, score, score_type="points", ranking_method=RankingMethod.HIGHER_IS_BETTER, target_value=None, ip_address=None):
+def add_score(game_name, username, score, score_type="points", ranking_method=RankingMethod.HIGHER_IS_BETTER, target_value=None, ip_address=None, session_id=None):
     """
     Enhanced add_score function with advanced ranking methods
     
@@ -280,6 +143,7 @@ def add_score(game_name, username, score, score_type="points", ranking_method=Ra
         ranking_method: How to rank scores (see RankingMethod class)
         target_value: Target value for target-based ranking
         ip_address: Player IP address
+        session_id: Submitting session (defaults to the current request's session)
         
     Returns:
         dict: Result with success status and rank info
@@ -288,6 +152,8 @@ def add_score(game_name, username, score, score_type="points", ranking_method=Ra
         # Calculate ranking score
         ranking_score = calculate_ranking_score(score, ranking_method, target_value)
         higher_is_better = is_higher_better_for_ranking(ranking_method)
+        if session_id is None:
+            session_id = session.get('session_id', 'unknown')
         
         with get_db_connection() as conn:
             cursor = conn.cursor()
@@ -306,10 +172,23 @@ def add_score(game_name, username, score, score_type="points", ranking_method=Ra
                  ranking_method, target_value, higher_is_better, ip_address, session_id)
                 VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
             ''', (game_name, username.strip()[:20], score, ranking_score, score, score_type, 
-                  ranking_method, target_value, higher_is_better, ip_address, session.get('session_id', 'unknown')))
+                  ranking_method, target_value, higher_is_better, ip_address, session_id))
             
             entry_id = cursor.lastrowid
             
+            # Check against the game's running distribution (O(1), no table scan)
+            outlier_flag = check_and_update_distribution(cursor, game_name, entry_id, ranking_score, higher_is_better)
+            
+            # Keep the precomputed histogram current and get "top X%" for free
+            top_percent = update_histogram(cursor, game_name, ranking_score, higher_is_better)
+            
+            # Add to today's / this week's / this month's boards
+            record_period_entry(cursor, game_name, entry_id, ranking_score)
+            
+            # Keep the player's personal best (only replaced when beaten)
+            is_personal_best = update_user_best(cursor, game_name, username.strip()[:20], entry_id,
+                                                score, ranking_score, higher_is_better)
+            
             # Calculate rank based on ranking_score
             if higher_is_better:
                 cursor.execute('''
@@ -358,18 +237,34 @@ def add_score(game_name, username, score, score_type="points", ranking_method=Ra
             else:
                 is_new_record = ranking_score < previous_best
             
+            # Rank among distinct players, by the player's best
+            player_rank = None
+            if is_personal_best:
+                player_rank = get_player_rank(cursor, game_name, ranking_score, higher_is_better)
+            
             conn.commit()
             
-            return {
-                'success': True,
-                'rank': rank,
-                'total_entries': total_entries,
-                'is_top_10': rank <= 10,
-                'is_new_record': is_new_record,
-                'entry_id': entry_id,
-                'original_score': score,
-                'ranking_score': ranking_score
-            }
+        # Rendered widgets for this game are now stale, as is the home page's top scores
+        invalidate_game_widgets(game_name)
+        invalidate_games_summary()
+        invalidate_pages('home.index')
+        ensure_histogram_refresher()
+        ensure_retention_compactor()
+        
+        return {
+            'success': True,
+            'rank': rank,
+            'total_entries': total_entries,
+            'is_top_10': rank <= 10,
+            'is_new_record': is_new_record,
+            'entry_id': entry_id,
+            'original_score': score,
+            'ranking_score': ranking_score,
+            'is_outlier': outlier_flag is not None,
+            'top_percent': top_percent,
+            'is_personal_best': is_personal_best,
+            'player_rank': player_rank
+        }
             
     except Exception as e:
         print(f"Error adding score: {e}")
@@ -382,9 +277,10 @@ def add_score(game_name, username, score, score_type="points", ranking_method=Ra
             'is_new_record': False
         }
 
-def save_score_to_session(game_name, score, score_type="points", ranking_method=RankingMethod.HIGHER_IS_BETTER, target_value=None):
+def save_score_to_session(game_name, score, score_type="points", ranking_method=RankingMethod.HIGHER_IS_BETTER, target_value=None, verification_id=None):
     """Enhanced save score to session with ranking method"""
     session['pending_score'] = {
+        'verification_id': verification_id,
         'game_name': game_name,
         'score': score,
         'score_type': score_type,
@@ -595,14 +491,29 @@ def _update_game_stats_internal(game_name, cursor):
     cursor.execute('SELECT COUNT(*) FROM user_favorites WHERE game_name = ?', (game_name,))
     favorites = cursor.fetchone()[0]
     
+    # Upsert so total_plays (maintained by plays.py) is kept
     cursor.execute('''
-        INSERT OR REPLACE INTO game_stats 
+        INSERT INTO game_stats 
         (game_name, total_likes, total_favorites, last_updated)
         VALUES (?, ?, ?, CURRENT_TIMESTAMP)
+        ON CONFLICT(game_name) DO UPDATE SET
+            total_likes = excluded.total_likes,
+            total_favorites = excluded.total_favorites,
+            last_updated = excluded.last_updated
     ''', (game_name, likes, favorites))
 
-def get_leaderboard(game_name, limit=50, offset=0):
-    """Enhanced get leaderboard function"""
+@singleflight('leaderboard queries')
+def get_leaderboard(game_name, limit=50, offset=0, period=None, bucket=None, unique_players=False):
+    """
+    Enhanced get leaderboard function
+    
+    Concurrent calls with the same arguments share one set of queries (singleflight.py).
+    
+    Args:
+        period: None for all-time, or 'day' / 'week' / 'month' (see periods.py)
+        bucket: Past period bucket to show (defaults to the current one)
+        unique_players: All-time board with one row per player (their best score)
+    """
     try:
         with get_db_connection() as conn:
             cursor = conn.cursor()
@@ -623,7 +534,9 @@ def get_leaderboard(game_name, limit=50, offset=0):
                     'ranking_method': RankingMethod.HIGHER_IS_BETTER,
                     'target_value': None,
                     'higher_is_better': True,
-                    'total_entries': 0
+                    'total_entries': 0,
+                    'period': period,
+                    'unique_players': unique_players
                 }
             
             score_type = config['score_type']
@@ -631,6 +544,39 @@ def get_leaderboard(game_name, limit=50, offset=0):
             target_value = config['target_value']
             higher_is_better = bool(config['higher_is_better'])
             
+            if period:
+                # Served from the period rollup instead of the full history
+                scores, total_entries, bucket = get_period_scores(
+                    cursor, game_name, period, higher_is_better, limit, offset, bucket)
+                return {
+                    'game_name': game_name,
+                    'scores': scores,
+                    'score_type': score_type,
+                    'ranking_method': ranking_method,
+                    'target_value': target_value,
+                    'higher_is_better': higher_is_better,
+                    'total_entries': total_entries,
+                    'period': period,
+                    'period_bucket': bucket,
+                    'unique_players': False
+                }
+            
+            if unique_players:
+                # Served from user_bests instead of grouping every attempt
+                scores, total_players = get_unique_player_scores(
+                    cursor, game_name, higher_is_better, limit, offset)
+                return {
+                    'game_name': game_name,
+                    'scores': scores,
+                    'score_type': score_type,
+                    'ranking_method': ranking_method,
+                    'target_value': target_value,
+                    'higher_is_better': higher_is_better,
+                    'total_entries': total_players,
+                    'period': None,
+                    'unique_players': True
+                }
+            
             # Get total entries
             cursor.execute('''
                 SELECT COUNT(*) as total
@@ -670,7 +616,9 @@ def get_leaderboard(game_name, limit=50, offset=0):
                 'ranking_method': ranking_method,
                 'target_value': target_value,
                 'higher_is_better': higher_is_better,
-                'total_entries': total_entries
+                'total_entries': total_entries,
+                'period': None,
+                'unique_players': False
             }
             
     except Exception as e:
@@ -682,12 +630,80 @@ def get_leaderboard(game_name, limit=50, offset=0):
             'ranking_method': RankingMethod.HIGHER_IS_BETTER,
             'target_value': None,
             'higher_is_better': True,
-            'total_entries': 0
+            'total_entries': 0,
+            'period': period,
+            'unique_players': unique_players
         }
 
+# Games per statement in get_top_n_for_games (two compound SELECT terms each;
+# SQLite allows 500 by default)
+TOP_N_BATCH_SIZE = 200
+
+# One game's top n in its own direction. Only the branch matching the game's
+# higher_is_better returns rows; both walk idx_leaderboard_game_ranking_score.
+_TOP_N_BRANCH = '''
+    SELECT * FROM (
+        SELECT game_name, username, original_score, ranking_score, timestamp, date_submitted,
+               {higher_is_better} as higher_is_better
+        FROM leaderboard_entries
+        WHERE game_name = ?
+          AND EXISTS (SELECT 1 FROM game_configs
+                      WHERE game_name = ? AND higher_is_better = {higher_is_better})
+        ORDER BY ranking_score {order}
+        LIMIT ?
+    )'''
+
+def get_top_n_for_games(game_names, n=3):
+    """
+    Top-n all-time entries for several games in one query
+    
+    Returns:
+        dict: {game_name: scores} with scores shaped like get_leaderboard's;
+              games without entries (or a config) map to []
+    """
+    names = tuple(dict.fromkeys(game_names))
+    top = {name: [] for name in names}
+    for start in range(0, len(names), TOP_N_BATCH_SIZE):
+        top.update(_query_top_n(names[start:start + TOP_N_BATCH_SIZE], n))
+    return top
+
+@singleflight('leaderboard queries')
+def _query_top_n(game_names, n):
+    try:
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            branches = []
+            params = []
+            for game_name in game_names:
+                branches.append(_TOP_N_BRANCH.format(order='DESC', higher_is_better=1))
+                branches.append(_TOP_N_BRANCH.format(order='ASC', higher_is_better=0))
+                params.extend([game_name, game_name, n] * 2)
+            cursor.execute(' UNION ALL '.join(branches), params)
+            
+            rows = {}
+            for row in cursor.fetchall():
+                rows.setdefault(row['game_name'], []).append(row)
+            
+            top = {}
+            for game_name, game_rows in rows.items():
+                # Ranks are positions in ranking order (a stable sort keeps index order on ties)
+                game_rows.sort(key=lambda row: row['ranking_score'], reverse=bool(game_rows[0]['higher_is_better']))
+                top[game_name] = [{
+                    'rank': rank,
+                    'username': row['username'],
+                    'score': row['original_score'],
+                    'ranking_score': row['ranking_score'],
+                    'timestamp': row['timestamp'],
+                    'date': row['date_submitted']
+                } for rank, row in enumerate(game_rows, 1)]
+            return top
+    except Exception as e:
+        print(f"Error getting top scores: {e}")
+        return {}
+
 # ===== SIMPLE SUBMISSION FUNCTIONS (NEW) =====
 
-def submit_game_score(game_name, score, score_type="points", ranking_method=RankingMethod.HIGHER_IS_BETTER, target_value=None):
+def submit_game_score(game_name, score, score_type="points", ranking_method=RankingMethod.HIGHER_IS_BETTER, target_value=None, verification_id=None):
     """
     Simple function for games to submit scores with advanced ranking
     
@@ -697,6 +713,7 @@ def submit_game_score(game_name, score, score_type="points", ranking_method=Rank
         score_type (str): What to call this score type
         ranking_method (str): How to rank scores (see RankingMethod class)
         target_value (float): Target value for target-based ranking
+        verification_id (int): Pending run-replay verification for this score, if any
     
     Returns:
         dict: Success status and redirect URL
@@ -729,7 +746,7 @@ def submit_game_score(game_name, score, score_type="points", ranking_method=Rank
                 }
         
         # Save score to session for username input
-        save_score_to_session(game_name, score, score_type, ranking_method, target_value)
+        save_score_to_session(game_name, score, score_type, ranking_method, target_value, verification_id)
         
         return {
             'success': True,
@@ -745,9 +762,9 @@ def submit_game_score(game_name, score, score_type="points", ranking_method=Rank
 
 # ===== CONVENIENCE FUNCTIONS (NEW) =====
 
-def submit_score_higher_better(game_name, score, score_type="points"):
+def submit_score_higher_better(game_name, score, score_type="points", verification_id=None):
     """Higher scores are better (traditional scoring)"""
-    return submit_game_score(game_name, score, score_type, RankingMethod.HIGHER_IS_BETTER)
+    return submit_game_score(game_name, score, score_type, RankingMethod.HIGHER_IS_BETTER, verification_id=verification_id)
 
 def submit_score_lower_better(game_name, score, score_type="time"):
     """Lower scores are better (time-based, attempts, etc.)"""
@@ -776,6 +793,7 @@ def submit_positive_only_lower(game_name, score, score_type="attempts"):
 # ===== EXISTING ROUTES (ENHANCED) =====
 
 @leaderboard.route('/')
+@singleflight_view()
 def index():
     """Show all games with leaderboards"""
     games = get_all_games_with_leaderboards()
@@ -785,10 +803,16 @@ def index():
 def view_game_leaderboard(game_name):
     """View leaderboard for specific game"""
     page = request.args.get('page', 1, type=int)
+    period = request.args.get('period')
+    if not is_valid_period(period):
+        period = None
     per_page = 50
     offset = (page - 1) * per_page
     
-    leaderboard_data = get_leaderboard(game_name, limit=per_page, offset=offset)
+    unique_players = request.args.get('unique') == '1'
+    
+    leaderboard_data = get_leaderboard(game_name, limit=per_page, offset=offset, period=period,
+                                       unique_players=unique_players)
     
     # Calculate pagination
     total_pages = (leaderboard_data['total_entries'] + per_page - 1) // per_page
@@ -827,6 +851,17 @@ def submit_score():
         flash('Username must be 20 characters or less!', 'error')
         return redirect(url_for('leaderboard.submit_score_form'))
     
+    # Runs with an input log only reach the ranked table once their replay clears
+    verification_id = pending_score.get('verification_id')
+    if verification_id:
+        status = wait_for_verification(verification_id)
+        if status in HELD_STATUSES:
+            hold_score(verification_id, pending_score, username, request.remote_addr,
+                       session.get('session_id', 'unknown'))
+            clear_score_from_session()
+            flash('Score received! It will appear on the leaderboard once our replay check clears it.', 'info')
+            return redirect(url_for('leaderboard.view_game_leaderboard', game_name=pending_score['game_name']))
+    
     # Add the score to leaderboard using enhanced function
     result = add_score(
         game_name=pending_score['game_name'],
@@ -841,6 +876,9 @@ def submit_score():
     # Clear the pending score
     clear_score_from_session()
     
+    if result['success'] and verification_id:
+        link_verification_entry(verification_id, result['entry_id'])
+    
     if result['success']:
         # Show success message with rank
         if result['is_new_record']:
@@ -850,6 +888,12 @@ def submit_score():
         else:
             flash(f'Score submitted! You ranked #{result["rank"]} with {pending_score["score"]} {pending_score["score_type"]}.', 'info')
         
+        if result.get('is_personal_best') and not result['is_new_record']:
+            flash(f'⭐ Personal best! That makes you #{result["player_rank"]} among all players.', 'success')
+        
+        if result.get('top_percent') is not None and not result['is_new_record']:
+            flash(f'📊 That puts you in the top {result["top_percent"]}% of all {pending_score["game_name"]} scores!', 'info')
+        
         return redirect(url_for('leaderboard.view_game_leaderboard', game_name=pending_score['game_name']))
     else:
         flash(f'Error saving score: {result.get("error", "Unknown error")}', 'error')
@@ -866,67 +910,90 @@ def clear_score_from_session():
     if 'pending_score' in session:
         del session['pending_score']
 
+# Backstop for other workers' copies, which never see this worker's invalidations
+GAMES_SUMMARY_TTL = 30  # seconds
+
+_games_summary_cache = {'games': None, 'loaded_at': 0}
+_games_summary_lock = threading.Lock()
+
+def invalidate_games_summary():
+    """Drop the cached leaderboard index (call after scores are added or removed)"""
+    with _games_summary_lock:
+        _games_summary_cache['games'] = None
+
 def get_all_games_with_leaderboards():
-    """Get all games that have leaderboard entries"""
+    """
+    Get all games that have leaderboard entries, with their current leader
+    
+    One query: per-game totals come from a single pass over the covering
+    idx_leaderboard_game_ranking_score, then each game's leader is one seek
+    on the same index. Results are cached until a score changes (or
+    GAMES_SUMMARY_TTL passes, for changes made by other workers).
+    """
+    with _games_summary_lock:
+        games = _games_summary_cache['games']
+        if games is not None and time.time() - _games_summary_cache['loaded_at'] < GAMES_SUMMARY_TTL:
+            return copy.deepcopy(games)
+    
+    games = _query_games_summary()
+    if games is not None:
+        with _games_summary_lock:
+            _games_summary_cache.update(games=games, loaded_at=time.time())
+        return copy.deepcopy(games)
+    return []
+
+@singleflight('leaderboard queries')
+def _query_games_summary():
     try:
         with get_db_connection() as conn:
             cursor = conn.cursor()
-            
-            # First get games with submission counts
             cursor.execute('''
-                SELECT 
-                    gc.game_name,
-                    gc.score_type,
-                    gc.ranking_method,
-                    gc.higher_is_better,
-                    COUNT(le.id) as total_submissions
-                FROM game_configs gc
-                LEFT JOIN leaderboard_entries le ON gc.game_name = le.game_name
-                GROUP BY gc.game_name, gc.score_type, gc.ranking_method, gc.higher_is_better
-                HAVING total_submissions > 0
-                ORDER BY total_submissions DESC
+                WITH totals AS (
+                    SELECT game_name, COUNT(*) AS total_submissions
+                    FROM leaderboard_entries
+                    GROUP BY game_name
+                ),
+                leaders AS (
+                    -- Same ordering as get_leaderboard, so the leader matches rank 1 there
+                    SELECT t.game_name, t.total_submissions,
+                           gc.score_type, gc.ranking_method,
+                           CASE WHEN gc.higher_is_better THEN
+                               (SELECT le.id FROM leaderboard_entries le
+                                WHERE le.game_name = t.game_name
+                                ORDER BY le.ranking_score DESC LIMIT 1)
+                           ELSE
+                               (SELECT le.id FROM leaderboard_entries le
+                                WHERE le.game_name = t.game_name
+                                ORDER BY le.ranking_score ASC LIMIT 1)
+                           END AS leader_id
+                    FROM totals t
+                    JOIN game_configs gc ON gc.game_name = t.game_name
+                )
+                SELECT l.game_name, l.score_type, l.ranking_method, l.total_submissions,
+                       le.username, le.original_score
+                FROM leaders l
+                LEFT JOIN leaderboard_entries le ON le.id = l.leader_id
+                ORDER BY l.total_submissions DESC
             ''')
             
             games = []
             for row in cursor.fetchall():
-                game_name = row['game_name']
-                
-                # Get the top score for this game
-                if row['higher_is_better']:
-                    cursor.execute('''
-                        SELECT username, original_score 
-                        FROM leaderboard_entries 
-                        WHERE game_name = ? 
-                        ORDER BY ranking_score DESC 
-                        LIMIT 1
-                    ''', (game_name,))
-                else:
-                    cursor.execute('''
-                        SELECT username, original_score 
-                        FROM leaderboard_entries 
-                        WHERE game_name = ? 
-                        ORDER BY ranking_score ASC 
-                        LIMIT 1
-                    ''', (game_name,))
-                
-                top_score_row = cursor.fetchone()
-                
                 games.append({
-                    'name': game_name,
+                    'name': row['game_name'],
                     'score_type': row['score_type'],
                     'ranking_method': row['ranking_method'],
                     'total_submissions': row['total_submissions'],
                     'top_score': {
-                        'username': top_score_row['username'],
-                        'score': top_score_row['original_score']
-                    } if top_score_row else None
+                        'username': row['username'],
+                        'score': row['original_score']
+                    } if row['username'] is not None else None
                 })
             
             return games
             
     except Exception as e:
         print(f"Error getting games list: {e}")
-        return []
+        return None
 
 # ===== TEMPLATE FILTERS (ENHANCED) =====
 
@@ -956,16 +1023,41 @@ def format_score_display(score, score_type, ranking_method=None, target_value=No
 def format_score_filter(score, score_type, ranking_method=None, target_value=None):
     return format_score_display(score, score_type, ranking_method, target_value)
 
+def is_registered_game(game_name):
+    """True if the game has a row in game_configs"""
+    try:
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('SELECT 1 FROM game_configs WHERE game_name = ?', (game_name,))
+            return cursor.fetchone() is not None
+    except Exception as e:
+        print(f"Error checking game config: {e}")
+        return False
+
 # ===== API ENDPOINTS (EXISTING) =====
 
 @leaderboard.route('/api/leaderboard/<game_name>')
+@singleflight_view()
 def api_leaderboard(game_name):
     """API endpoint for leaderboard data"""
     limit = request.args.get('limit', 50, type=int)
     offset = request.args.get('offset', 0, type=int)
-    leaderboard_data = get_leaderboard(game_name, limit, offset)
+    period = request.args.get('period')
+    if period and not is_valid_period(period):
+        return jsonify({'error': 'period must be one of day, week, month'}), 400
+    leaderboard_data = get_leaderboard(game_name, limit, offset, period=period or None,
+                                       bucket=request.args.get('bucket'),
+                                       unique_players=request.args.get('unique') == '1')
     return jsonify(leaderboard_data)
 
+@leaderboard.route('/api/distribution/<game_name>')
+def api_distribution(game_name):
+    """API endpoint for precomputed score histogram and percentiles"""
+    distribution = get_score_distribution(game_name)
+    if distribution is None:
+        return jsonify({'error': 'No scores for this game'}), 404
+    return jsonify(distribution)
+
 @leaderboard.route('/api/submit', methods=['POST'])
 def api_submit_score():
     """API endpoint for submitting scores"""
@@ -974,6 +1066,8 @@ def api_submit_score():
     required_fields = ['game_name', 'username', 'score']
     if not all(field in data for field in required_fields):
         return jsonify({'error': 'Missing required fields'}), 400
+    if requires_replay(data['game_name']):
+        return jsonify({'error': 'Scores for this game are submitted from the game'}), 403
     
     result = add_score(
         game_name=data['game_name'],
@@ -990,6 +1084,7 @@ def api_submit_score():
 @leaderboard.route('/widget/<game_name>')
 def leaderboard_widget(game_name):
     """Small leaderboard widget for embedding in games"""
-    limit = request.args.get('limit', 5, type=int)
-    leaderboard_data = get_leaderboard(game_name, limit)
-    return render_template('leaderboard_widget.html', leaderboard=leaderboard_data)
\ No newline at end of file
+    if not is_registered_game(game_name):
+        return jsonify({'error': 'Unknown game'}), 404
+    limit = clamp_limit(request.args.get('limit', type=int))
+    return widget_response(game_name, limit, style='full')
\ No newline at end of file
@@ -0,0 +1,396 @@
+"""
+Versioned schema migrations for the leaderboard database
+
+The schema version lives in SQLite's PRAGMA user_version. Each migration runs
+exactly once, inside its own BEGIN EXCLUSIVE transaction, so when several
+worker processes start together one applies it and the others wait, re-read
+the version and skip it. Once the schema is current, startup costs a single
+PRAGMA read.
+
+Add new schema changes as a new function appended to MIGRATIONS - never edit
+a migration that has already shipped.
+"""
+
+import sqlite3
+from website.startup import deferred_init
+
+# ===== MIGRATIONS =====
+
+def _column_names(cursor, table):
+    cursor.execute(f'PRAGMA table_info({table})')
+    return {row[1] for row in cursor.fetchall()}
+
+def _initial_schema(cursor):
+    """Core leaderboard, likes/favorites and stats tables (schema before versioning)"""
+    # Enhanced leaderboard entries table
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS leaderboard_entries (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            game_name TEXT NOT NULL,
+            username TEXT NOT NULL,
+            score REAL NOT NULL,
+            ranking_score REAL NOT NULL,
+            original_score REAL NOT NULL,
+            score_type TEXT NOT NULL DEFAULT 'points',
+            ranking_method TEXT NOT NULL DEFAULT 'higher_is_better',
+            target_value REAL,
+            higher_is_better BOOLEAN NOT NULL DEFAULT 1,
+            timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
+            date_submitted DATE DEFAULT (date('now')),
+            ip_address TEXT,
+            session_id TEXT
+        )
+    ''')
+    
+    # Enhanced game configurations table
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS game_configs (
+            game_name TEXT PRIMARY KEY,
+            score_type TEXT NOT NULL DEFAULT 'points',
+            ranking_method TEXT NOT NULL DEFAULT 'higher_is_better',
+            target_value REAL,
+            higher_is_better BOOLEAN NOT NULL DEFAULT 1,
+            max_entries_per_user INTEGER DEFAULT 10,
+            created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+            updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+    
+    # Columns added after the first release, for databases that predate them
+    legacy_columns = [
+        ('leaderboard_entries', 'ranking_score', 'REAL DEFAULT 0'),
+        ('leaderboard_entries', 'original_score', 'REAL DEFAULT 0'),
+        ('leaderboard_entries', 'ranking_method', 'TEXT DEFAULT "higher_is_better"'),
+        ('leaderboard_entries', 'target_value', 'REAL'),
+        ('game_configs', 'ranking_method', 'TEXT DEFAULT "higher_is_better"'),
+        ('game_configs', 'target_value', 'REAL')
+    ]
+    for table, column, definition in legacy_columns:
+        if column not in _column_names(cursor, table):
+            cursor.execute(f'ALTER TABLE {table} ADD COLUMN {column} {definition}')
+    
+    # Update existing entries with missing data
+    cursor.execute('''
+        UPDATE leaderboard_entries 
+        SET ranking_score = score, original_score = score 
+        WHERE ranking_score IS NULL OR ranking_score = 0
+    ''')
+    
+    # Indexes for performance
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_leaderboard_game_ranking_score 
+        ON leaderboard_entries(game_name, ranking_score)
+    ''')
+    
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_leaderboard_game_timestamp 
+        ON leaderboard_entries(game_name, timestamp DESC)
+    ''')
+    
+    # User interactions tables for likes and favorites
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS user_likes (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            user_identifier TEXT NOT NULL,
+            game_name TEXT NOT NULL,
+            liked_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+            ip_address TEXT,
+            UNIQUE(user_identifier, game_name)
+        )
+    ''')
+    
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS user_favorites (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            user_identifier TEXT NOT NULL,
+            game_name TEXT NOT NULL,
+            favorited_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+            ip_address TEXT,
+            UNIQUE(user_identifier, game_name)
+        )
+    ''')
+    
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS game_stats (
+            game_name TEXT PRIMARY KEY,
+            total_likes INTEGER DEFAULT 0,
+            total_favorites INTEGER DEFAULT 0,
+            total_plays INTEGER DEFAULT 0,
+            last_updated DATETIME DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+    
+    # Indexes for user interactions
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_user_likes_identifier 
+        ON user_likes(user_identifier)
+    ''')
+    
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_user_likes_game 
+        ON user_likes(game_name)
+    ''')
+    
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_user_favorites_identifier 
+        ON user_favorites(user_identifier)
+    ''')
+    
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_user_favorites_game 
+        ON user_favorites(game_name)
+    ''')
+    
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_leaderboard_username 
+        ON leaderboard_entries(username)
+    ''')
+
+def _verification_tables(cursor):
+    """Run-replay verification verdicts and held scores"""
+    # Run-replay verification verdicts (see verification.py)
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS run_verifications (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            game_name TEXT NOT NULL,
+            claimed_score REAL NOT NULL,
+            simulated_score REAL,
+            seed INTEGER,
+            status TEXT NOT NULL DEFAULT 'pending',
+            reason TEXT,
+            duration_ms INTEGER,
+            entry_id INTEGER,
+            session_id TEXT,
+            submitted_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+            verified_at DATETIME
+        )
+    ''')
+    
+    # Scores held out of the ranked tables until their run is cleared
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS quarantined_scores (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            verification_id INTEGER NOT NULL UNIQUE,
+            game_name TEXT NOT NULL,
+            username TEXT NOT NULL,
+            score REAL NOT NULL,
+            score_type TEXT NOT NULL DEFAULT 'points',
+            ranking_method TEXT NOT NULL DEFAULT 'higher_is_better',
+            target_value REAL,
+            ip_address TEXT,
+            session_id TEXT,
+            held_at DATETIME DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+    
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_run_verifications_status 
+        ON run_verifications(status)
+    ''')
+
+def _outlier_tables(cursor):
+    """Streaming score distributions and outlier flags"""
+    # Streaming score distributions for outlier detection (see outliers.py)
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS score_distributions (
+            game_name TEXT NOT NULL,
+            quantile REAL NOT NULL,
+            state TEXT NOT NULL,
+            sample_count INTEGER NOT NULL DEFAULT 0,
+            estimate REAL,
+            updated_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+            PRIMARY KEY (game_name, quantile)
+        )
+    ''')
+    
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS score_outlier_flags (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            entry_id INTEGER NOT NULL,
+            game_name TEXT NOT NULL,
+            ranking_score REAL NOT NULL,
+            threshold REAL NOT NULL,
+            percentile REAL NOT NULL,
+            reviewed BOOLEAN NOT NULL DEFAULT 0,
+            flagged_at DATETIME DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+    
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_outlier_flags_reviewed 
+        ON score_outlier_flags(reviewed, id)
+    ''')
+
+def _histogram_table(cursor):
+    """Per-game histogram and percentile snapshots"""
+    # Per-game histogram and percentile snapshots (see histograms.py)
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS game_score_histograms (
+            game_name TEXT PRIMARY KEY,
+            bucket_min REAL NOT NULL,
+            bucket_width REAL NOT NULL,
+            bucket_counts TEXT NOT NULL,
+            total INTEGER NOT NULL DEFAULT 0,
+            percentiles TEXT,
+            min_score REAL,
+            max_score REAL,
+            higher_is_better BOOLEAN NOT NULL DEFAULT 1,
+            rebuilt_at DATETIME,
+            updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+
+def _period_rollups(cursor):
+    """Daily/weekly/monthly leaderboard rollups"""
+    # Daily/weekly/monthly leaderboard rollups (see periods.py)
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS period_leaderboard_entries (
+            game_name TEXT NOT NULL,
+            period TEXT NOT NULL,
+            bucket TEXT NOT NULL,
+            entry_id INTEGER NOT NULL,
+            ranking_score REAL NOT NULL,
+            PRIMARY KEY (period, entry_id)
+        )
+    ''')
+    
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_period_entries_rank 
+        ON period_leaderboard_entries(game_name, period, bucket, ranking_score)
+    ''')
+    
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_period_entries_bucket 
+        ON period_leaderboard_entries(period, bucket)
+    ''')
+
+def _user_bests(cursor):
+    """Best entry per player per game, backfilled from existing entries"""
+    # Best entry per player per game (see user_bests.py)
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS user_bests (
+            game_name TEXT NOT NULL,
+            username TEXT NOT NULL,
+            entry_id INTEGER NOT NULL,
+            original_score REAL NOT NULL,
+            ranking_score REAL NOT NULL,
+            attempts INTEGER NOT NULL DEFAULT 1,
+            achieved_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+            PRIMARY KEY (game_name, username)
+        )
+    ''')
+    
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_user_bests_rank 
+        ON user_bests(game_name, ranking_score)
+    ''')
+    
+    # Backfill personal bests for databases that predate user_bests
+    from website.leaderboard.user_bests import rebuild_all_user_bests
+    cursor.execute('SELECT EXISTS(SELECT 1 FROM user_bests), EXISTS(SELECT 1 FROM leaderboard_entries)')
+    has_bests, has_entries = cursor.fetchone()
+    if has_entries and not has_bests:
+        rebuild_all_user_bests(cursor)
+
+def _cleanup_jobs(cursor):
+    """Admin cleanup job progress"""
+    # Admin cleanup job progress (see cleanup.py)
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS cleanup_jobs (
+            id TEXT PRIMARY KEY,
+            policy TEXT NOT NULL,
+            status TEXT NOT NULL,
+            games TEXT NOT NULL,
+            games_done INTEGER NOT NULL DEFAULT 0,
+            current_game TEXT,
+            entries_total INTEGER NOT NULL DEFAULT 0,
+            entries_deleted INTEGER NOT NULL DEFAULT 0,
+            configs_deleted INTEGER NOT NULL DEFAULT 0,
+            error TEXT,
+            started_at REAL,
+            finished_at REAL
+        )
+    ''')
+
+def _play_events(cursor):
+    """Individual game plays, written in batches by the play counter (see plays.py)"""
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS play_events (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            game_name TEXT NOT NULL,
+            user_identifier TEXT,
+            played_at REAL NOT NULL
+        )
+    ''')
+    
+    # Recently played lookups
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_play_events_user 
+        ON play_events(user_identifier, played_at DESC)
+    ''')
+
+# (version, migration) - versions are consecutive and never reused
+MIGRATIONS = [
+    (1, _initial_schema),
+    (2, _verification_tables),
+    (3, _outlier_tables),
+    (4, _histogram_table),
+    (5, _period_rollups),
+    (6, _user_bests),
+    (7, _cleanup_jobs),
+    (8, _play_events)
+]
+
+LATEST_VERSION = MIGRATIONS[-1][0]
+
+# ===== RUNNER =====
+
+def _connect(db_path=None):
+    from website.leaderboard.leaderboard import get_db_path
+    # Autocommit mode so transactions (including DDL) are controlled explicitly
+    conn = sqlite3.connect(db_path or get_db_path(), timeout=60.0, isolation_level=None)
+    conn.row_factory = sqlite3.Row
+    return conn
+
+def get_schema_version(conn):
+    return conn.execute('PRAGMA user_version').fetchone()[0]
+
+def run_migrations(db_path=None):
+    """
+    Apply any pending migrations
+
+    Returns:
+        list: Versions applied by this call (empty when already current)
+    """
+    conn = _connect(db_path)
+    applied = []
+    try:
+        if get_schema_version(conn) >= LATEST_VERSION:
+            return applied
+
+        for version, migration in MIGRATIONS:
+            conn.execute('BEGIN EXCLUSIVE')
+            try:
+                # Another process may have applied it while we waited for the lock
+                if get_schema_version(conn) >= version:
+                    conn.execute('COMMIT')
+                    continue
+                migration(conn.cursor())
+                conn.execute(f'PRAGMA user_version = {version}')
+                conn.execute('COMMIT')
+            except Exception:
+                conn.execute('ROLLBACK')
+                raise
+            applied.append(version)
+            print(f"Applied migration {version}: {migration.__name__.strip('_')}")
+    finally:
+        conn.close()
+    return applied
+
+@deferred_init('leaderboard schema')
+def ensure_schema():
+    """Startup hook: bring the schema up to date (one PRAGMA read when current)"""
+    try:
+        run_migrations()
+    except Exception as e:
+        print(f"WARNING: Database migration failed: {e}")
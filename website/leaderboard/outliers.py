@@ -0,0 +1,233 @@
+"""
+Streaming outlier detection for leaderboard submissions
+
+Each game keeps a running estimate of the percentile that marks its
+"suspiciously good" tail of ranking_score, using the P-squared algorithm
+(Jain & Chlamtac). The estimator is five markers, so updating it on every
+insert is O(1) and never scans leaderboard_entries. Submissions beyond the
+estimate are written to score_outlier_flags for the admin panel.
+"""
+
+import json
+
+# ===== CONFIGURATION =====
+
+# Percentile of the "better" tail beyond which a score is flagged, per game
+DEFAULT_OUTLIER_PERCENTILE = 0.99
+OUTLIER_PERCENTILES = {
+    # 'Space Invaders': 0.995,
+}
+
+# Don't flag anything until the distribution has seen this many scores
+MIN_SAMPLES_FOR_FLAGGING = 50
+
+def get_outlier_percentile(game_name):
+    """Configured percentile for a game"""
+    return OUTLIER_PERCENTILES.get(game_name, DEFAULT_OUTLIER_PERCENTILE)
+
+# ===== P-SQUARED QUANTILE ESTIMATOR =====
+
+class StreamingQuantile:
+    """Single-quantile P-squared estimator with JSON-serialisable state"""
+
+    def __init__(self, p, state=None):
+        self.p = p
+        if state:
+            self.count = state['count']
+            self.heights = state['heights']
+            self.positions = state['positions']
+            self.desired = state['desired']
+        else:
+            self.count = 0
+            self.heights = []
+            self.positions = [1, 2, 3, 4, 5]
+            self.desired = [1, 1 + 2 * p, 1 + 4 * p, 3 + 2 * p, 5]
+        self.increments = [0, p / 2, p, (1 + p) / 2, 1]
+
+    def to_state(self):
+        return {
+            'count': self.count,
+            'heights': self.heights,
+            'positions': self.positions,
+            'desired': self.desired
+        }
+
+    def add(self, x):
+        """Add an observation"""
+        self.count += 1
+
+        # Collect the first five observations exactly
+        if self.count <= 5:
+            self.heights.append(x)
+            self.heights.sort()
+            return
+
+        q, n = self.heights, self.positions
+
+        # Find the cell containing x, widening the extremes if needed
+        if x < q[0]:
+            q[0] = x
+            k = 0
+        elif x >= q[4]:
+            q[4] = x
+            k = 3
+        else:
+            k = 0
+            while k < 3 and x >= q[k + 1]:
+                k += 1
+
+        for i in range(k + 1, 5):
+            n[i] += 1
+        for i in range(5):
+            self.desired[i] += self.increments[i]
+
+        # Nudge the middle markers towards their desired positions
+        for i in range(1, 4):
+            d = self.desired[i] - n[i]
+            if (d >= 1 and n[i + 1] - n[i] > 1) or (d <= -1 and n[i - 1] - n[i] < -1):
+                d = 1 if d > 0 else -1
+                candidate = self._parabolic(i, d)
+                if q[i - 1] < candidate < q[i + 1]:
+                    q[i] = candidate
+                else:
+                    q[i] = q[i] + d * (q[i + d] - q[i]) / (n[i + d] - n[i])
+                n[i] += d
+
+    def _parabolic(self, i, d):
+        q, n = self.heights, self.positions
+        return q[i] + d / (n[i + 1] - n[i - 1]) * (
+            (n[i] - n[i - 1] + d) * (q[i + 1] - q[i]) / (n[i + 1] - n[i]) +
+            (n[i + 1] - n[i] - d) * (q[i] - q[i - 1]) / (n[i] - n[i - 1])
+        )
+
+    def value(self):
+        """Current quantile estimate (None until the first observation)"""
+        if not self.heights:
+            return None
+        if self.count <= 5:
+            index = min(int(self.p * len(self.heights)), len(self.heights) - 1)
+            return self.heights[index]
+        return self.heights[2]
+
+# ===== PER-GAME DISTRIBUTIONS =====
+
+def _tail_quantile(game_name, higher_is_better):
+    """Quantile tracked for a game - the 'too good to be true' tail"""
+    percentile = get_outlier_percentile(game_name)
+    return percentile if higher_is_better else 1 - percentile
+
+def check_and_update_distribution(cursor, game_name, entry_id, ranking_score, higher_is_better):
+    """
+    Check a new score against its game's distribution, then fold it in
+
+    Runs inside the caller's transaction (one row read + one row write).
+
+    Returns:
+        dict: Flag details if the score is an outlier, otherwise None
+    """
+    quantile = _tail_quantile(game_name, higher_is_better)
+
+    cursor.execute('''
+        SELECT state FROM score_distributions
+        WHERE game_name = ? AND quantile = ?
+    ''', (game_name, quantile))
+    row = cursor.fetchone()
+    estimator = StreamingQuantile(quantile, json.loads(row[0]) if row else None)
+
+    flag = None
+    threshold = estimator.value()
+    if estimator.count >= MIN_SAMPLES_FOR_FLAGGING and threshold is not None:
+        beyond = ranking_score > threshold if higher_is_better else ranking_score < threshold
+        if beyond:
+            flag = {
+                'entry_id': entry_id,
+                'game_name': game_name,
+                'ranking_score': ranking_score,
+                'threshold': threshold,
+                'percentile': get_outlier_percentile(game_name)
+            }
+            cursor.execute('''
+                INSERT INTO score_outlier_flags
+                (entry_id, game_name, ranking_score, threshold, percentile)
+                VALUES (?, ?, ?, ?, ?)
+            ''', (entry_id, game_name, ranking_score, threshold, flag['percentile']))
+
+    estimator.add(ranking_score)
+    cursor.execute('''
+        INSERT OR REPLACE INTO score_distributions
+        (game_name, quantile, state, sample_count, estimate, updated_at)
+        VALUES (?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+    ''', (game_name, quantile, json.dumps(estimator.to_state()), estimator.count, estimator.value()))
+
+    return flag
+
+def rebuild_distribution(cursor, game_name, higher_is_better):
+    """
+    Rebuild a game's distribution from its existing entries
+    (one-off backfill for scores submitted before tracking started)
+    """
+    quantile = _tail_quantile(game_name, higher_is_better)
+    estimator = StreamingQuantile(quantile)
+
+    cursor.execute('''
+        SELECT ranking_score FROM leaderboard_entries
+        WHERE game_name = ? ORDER BY id
+    ''', (game_name,))
+    for (ranking_score,) in cursor.fetchall():
+        estimator.add(ranking_score)
+
+    cursor.execute('DELETE FROM score_distributions WHERE game_name = ?', (game_name,))
+    cursor.execute('''
+        INSERT INTO score_distributions
+        (game_name, quantile, state, sample_count, estimate, updated_at)
+        VALUES (?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+    ''', (game_name, quantile, json.dumps(estimator.to_state()), estimator.count, estimator.value()))
+    return estimator.count
+
+def get_outlier_overview(limit=100):
+    """Per-game distribution estimates and recent flags for the admin panel"""
+    from website.leaderboard.leaderboard import get_db_connection
+    try:
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                SELECT game_name, quantile, sample_count, estimate, updated_at
+                FROM score_distributions
+                ORDER BY game_name
+            ''')
+            distributions = [dict(row) for row in cursor.fetchall()]
+
+            cursor.execute('''
+                SELECT f.id, f.entry_id, f.game_name, f.ranking_score, f.threshold,
+                       f.percentile, f.flagged_at, le.username, le.original_score
+                FROM score_outlier_flags f
+                LEFT JOIN leaderboard_entries le ON le.id = f.entry_id
+                WHERE f.reviewed = 0
+                ORDER BY f.id DESC
+                LIMIT ?
+            ''', (limit,))
+            flags = [dict(row) for row in cursor.fetchall()]
+
+            return {'distributions': distributions, 'flags': flags}
+    except Exception as e:
+        print(f"Error getting outlier overview: {e}")
+        return {'distributions': [], 'flags': []}
+
+def dismiss_outlier_flag(flag_id):
+    """Mark a flag as reviewed"""
+    from website.leaderboard.leaderboard import get_db_connection
+    with get_db_connection() as conn:
+        conn.execute('UPDATE score_outlier_flags SET reviewed = 1 WHERE id = ?', (flag_id,))
+        conn.commit()
+
+def rebuild_all_distributions():
+    """Backfill every game's distribution (admin action)"""
+    from website.leaderboard.leaderboard import get_db_connection
+    rebuilt = {}
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute('SELECT game_name, higher_is_better FROM game_configs')
+        for game_name, higher_is_better in cursor.fetchall():
+            rebuilt[game_name] = rebuild_distribution(cursor, game_name, bool(higher_is_better))
+        conn.commit()
+    return rebuilt
@@ -0,0 +1,164 @@
+"""
+Time-windowed leaderboards (daily / weekly / monthly)
+
+Every new entry is also written to period_leaderboard_entries once per period,
+keyed by the bucket it falls in ('2026-10-18', '2026-W42', '2026-10'). The
+(game_name, period, bucket, ranking_score) index makes "today's top 10" a
+short range read, the same cost as the all-time board however much history
+the game has. Display fields are joined from leaderboard_entries, so admin
+edits show up without touching the rollup.
+
+Buckets use UTC to match SQLite's CURRENT_TIMESTAMP.
+"""
+
+import time
+from datetime import datetime, timedelta
+
+class LeaderboardPeriod:
+    """Supported leaderboard windows"""
+    DAY = "day"
+    WEEK = "week"
+    MONTH = "month"
+
+# strftime format of each period's bucket key (keys sort chronologically)
+PERIOD_BUCKET_FORMATS = {
+    LeaderboardPeriod.DAY: '%Y-%m-%d',
+    LeaderboardPeriod.WEEK: '%G-W%V',
+    LeaderboardPeriod.MONTH: '%Y-%m'
+}
+
+# How many buckets of each period to keep (older rollup rows are pruned)
+PERIOD_RETENTION = {
+    LeaderboardPeriod.DAY: 31,
+    LeaderboardPeriod.WEEK: 26,
+    LeaderboardPeriod.MONTH: 24
+}
+
+PRUNE_INTERVAL_SECONDS = 3600
+
+def is_valid_period(period):
+    """Check if a period name is supported"""
+    return period in PERIOD_BUCKET_FORMATS
+
+def get_period_bucket(period, when=None):
+    """Bucket key for a period at a given UTC time (defaults to now)"""
+    when = when or datetime.utcnow()
+    return when.strftime(PERIOD_BUCKET_FORMATS[period])
+
+def _oldest_kept_bucket(period, now=None):
+    """First bucket key that is still inside the retention window"""
+    now = now or datetime.utcnow()
+    keep = PERIOD_RETENTION[period]
+    if period == LeaderboardPeriod.DAY:
+        oldest = now - timedelta(days=keep - 1)
+    elif period == LeaderboardPeriod.WEEK:
+        oldest = now - timedelta(weeks=keep - 1)
+    else:
+        months = now.year * 12 + now.month - 1 - (keep - 1)
+        oldest = datetime(months // 12, months % 12 + 1, 1)
+    return get_period_bucket(period, oldest)
+
+# ===== WRITE PATH =====
+
+_last_prune = 0.0
+
+def record_period_entry(cursor, game_name, entry_id, ranking_score, when=None):
+    """
+    Add a new entry to the current day/week/month rollups
+    (call inside add_score's transaction)
+    """
+    global _last_prune
+    when = when or datetime.utcnow()
+    cursor.executemany('''
+        INSERT OR REPLACE INTO period_leaderboard_entries
+        (game_name, period, bucket, entry_id, ranking_score)
+        VALUES (?, ?, ?, ?, ?)
+    ''', [(game_name, period, get_period_bucket(period, when), entry_id, ranking_score)
+          for period in PERIOD_BUCKET_FORMATS])
+
+    # Expired buckets are dropped at most once an hour per process
+    if time.time() - _last_prune > PRUNE_INTERVAL_SECONDS:
+        _last_prune = time.time()
+        prune_expired_periods(cursor)
+
+def prune_expired_periods(cursor):
+    """Delete rollup rows older than each period's retention window"""
+    removed = 0
+    for period in PERIOD_BUCKET_FORMATS:
+        cursor.execute('''
+            DELETE FROM period_leaderboard_entries
+            WHERE period = ? AND bucket < ?
+        ''', (period, _oldest_kept_bucket(period)))
+        removed += cursor.rowcount
+    return removed
+
+def purge_deleted_period_entries(cursor):
+    """Drop rollup rows whose leaderboard entry was deleted (admin deletes)"""
+    cursor.execute('''
+        DELETE FROM period_leaderboard_entries
+        WHERE entry_id NOT IN (SELECT id FROM leaderboard_entries)
+    ''')
+    return cursor.rowcount
+
+def rebuild_period_rollups():
+    """Backfill the rollups from leaderboard_entries for every retained bucket"""
+    from website.leaderboard.leaderboard import get_db_connection
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute('DELETE FROM period_leaderboard_entries')
+        # The month window is the longest, so it covers the other periods too
+        oldest = datetime.strptime(_oldest_kept_bucket(LeaderboardPeriod.MONTH), '%Y-%m')
+        cursor.execute('''
+            SELECT id, game_name, ranking_score, timestamp
+            FROM leaderboard_entries
+            WHERE timestamp >= ?
+        ''', (oldest.strftime('%Y-%m-%d %H:%M:%S'),))
+        rows = cursor.fetchall()
+        for row in rows:
+            when = datetime.strptime(row['timestamp'][:19], '%Y-%m-%d %H:%M:%S')
+            record_period_entry(cursor, row['game_name'], row['id'], row['ranking_score'], when)
+        prune_expired_periods(cursor)
+        conn.commit()
+    return len(rows)
+
+# ===== READ PATH =====
+
+def get_period_scores(cursor, game_name, period, higher_is_better, limit=50, offset=0, bucket=None):
+    """
+    Ranked entries for one period bucket
+
+    Returns:
+        tuple: (scores, total_entries, bucket)
+    """
+    bucket = bucket or get_period_bucket(period)
+
+    cursor.execute('''
+        SELECT COUNT(*) AS total
+        FROM period_leaderboard_entries
+        WHERE game_name = ? AND period = ? AND bucket = ?
+    ''', (game_name, period, bucket))
+    total_entries = cursor.fetchone()['total']
+
+    # Rows come straight off the rank index, so the rank is just the position
+    order_clause = "ORDER BY p.ranking_score DESC" if higher_is_better else "ORDER BY p.ranking_score ASC"
+    cursor.execute(f'''
+        SELECT le.username, le.original_score, p.ranking_score, le.timestamp, le.date_submitted
+        FROM period_leaderboard_entries p
+        JOIN leaderboard_entries le ON le.id = p.entry_id
+        WHERE p.game_name = ? AND p.period = ? AND p.bucket = ?
+        {order_clause}
+        LIMIT ? OFFSET ?
+    ''', (game_name, period, bucket, limit, offset))
+
+    scores = []
+    for position, row in enumerate(cursor.fetchall()):
+        scores.append({
+            'rank': offset + position + 1,
+            'username': row['username'],
+            'score': row['original_score'],
+            'ranking_score': row['ranking_score'],
+            'timestamp': row['timestamp'],
+            'date': row['date_submitted']
+        })
+
+    return scores, total_entries, bucket
@@ -0,0 +1,266 @@
+"""
+Buffered play counting
+
+Game start endpoints call record_play(). A play is appended to an in-process
+buffer and a per-game pending counter; nothing is written per play. A
+background flusher writes the buffer every PLAY_FLUSH_SECONDS (or sooner
+once PLAY_FLUSH_BATCH plays are waiting) in one transaction: the events go
+to play_events and each game's count is added to game_stats.total_plays.
+
+get_play_count() is a dictionary lookup: the persisted totals (reloaded from
+game_stats on every flush, which also picks up other workers' plays) plus
+this worker's unflushed plays.
+
+A crash loses at most one flush interval of plays; a normal shutdown
+flushes the buffer at exit. While the database is unavailable the buffer
+keeps at most PLAY_BUFFER_MAX events: the oldest are dropped (counted in
+the 'dropped' stat), but their plays stay in the pending counts.
+
+play_events only feeds the recently-played list, so every PLAY_PRUNE_EVERY
+flushes the flusher calls prune_play_events() to keep each player's latest
+play of each game from the last PLAY_EVENTS_KEEP_DAYS days.
+"""
+
+import atexit
+import os
+import threading
+import time
+from collections import Counter
+
+PLAY_FLUSH_SECONDS = 5
+PLAY_FLUSH_BATCH = 500
+PLAY_BUFFER_MAX = 20000
+PLAY_EVENTS_KEEP_DAYS = 30
+PLAY_PRUNE_EVERY = 720  # flushes - about hourly at PLAY_FLUSH_SECONDS
+RECENTLY_PLAYED_LIMIT = 10
+
+_buffer = []  # (game_name, user_identifier, played_at) not yet written
+_pending_counts = Counter()  # game_name -> plays in _buffer
+_persisted_totals = None  # game_name -> game_stats.total_plays at the last flush
+_buffer_lock = threading.Lock()
+_flush_lock = threading.Lock()  # One flush at a time
+_flush_wanted = threading.Event()
+_unflushed_counts = Counter()  # game_name -> plays dropped from _buffer but not yet counted
+_stats = {'recorded': 0, 'flushes': 0, 'flushed': 0, 'errors': 0, 'dropped': 0, 'last_flush_ms': None,
+          'pruned': 0, 'last_prune_at': None}
+
+# ===== RECORDING =====
+
+def record_play(game_name, user_identifier=None):
+    """Count one play of a game (buffered - see module docstring)"""
+    ensure_play_flusher()
+    with _buffer_lock:
+        _buffer.append((game_name, user_identifier, time.time()))
+        _pending_counts[game_name] += 1
+        _stats['recorded'] += 1
+        _trim_buffer()
+        if len(_buffer) >= PLAY_FLUSH_BATCH:
+            _flush_wanted.set()
+
+def _trim_buffer():
+    """Drop the oldest events past PLAY_BUFFER_MAX, keeping their counts (hold _buffer_lock)"""
+    overflow = len(_buffer) - PLAY_BUFFER_MAX
+    if overflow > 0:
+        for game_name, _, _ in _buffer[:overflow]:
+            _unflushed_counts[game_name] += 1
+        del _buffer[:overflow]
+        _stats['dropped'] += overflow
+
+def record_request_play(game_name):
+    """record_play for the user of the current request"""
+    from flask import request
+    from website.leaderboard.leaderboard import get_user_identifier
+    record_play(game_name, get_user_identifier(request))
+
+def flush_plays():
+    """Write buffered plays in one transaction; returns how many were written"""
+    from website.leaderboard.leaderboard import get_db_connection
+    global _persisted_totals
+
+    with _flush_lock:
+        with _buffer_lock:
+            events = _buffer[:]
+            counts = Counter(game_name for game_name, _, _ in events)
+            counts.update(_unflushed_counts)
+            _unflushed_counts.clear()
+            del _buffer[:len(events)]
+
+        started = time.perf_counter()
+        try:
+            with get_db_connection() as conn:
+                cursor = conn.cursor()
+                if counts:
+                    cursor.executemany('''
+                        INSERT INTO play_events (game_name, user_identifier, played_at)
+                        VALUES (?, ?, ?)
+                    ''', events)
+                    cursor.executemany('''
+                        INSERT INTO game_stats (game_name, total_plays, last_updated)
+                        VALUES (?, ?, CURRENT_TIMESTAMP)
+                        ON CONFLICT(game_name) DO UPDATE SET
+                            total_plays = total_plays + excluded.total_plays,
+                            last_updated = excluded.last_updated
+                    ''', list(counts.items()))
+                    conn.commit()
+                totals = _read_totals(cursor)
+        except Exception as e:
+            print(f"Error flushing play events: {e}")
+            with _buffer_lock:
+                # Put them back in front of anything recorded meanwhile
+                _buffer[:0] = events
+                counts.subtract(game_name for game_name, _, _ in events)
+                _unflushed_counts.update(counts)
+                _trim_buffer()
+                _stats['errors'] += 1
+            return 0
+
+        with _buffer_lock:
+            # Swapped in together, so a read never counts a play twice or not at all
+            _persisted_totals = totals
+            for game_name, count in counts.items():
+                _pending_counts[game_name] -= count
+                if not _pending_counts[game_name]:
+                    del _pending_counts[game_name]
+            _stats['flushes'] += 1
+            _stats['flushed'] += len(events)
+            _stats['last_flush_ms'] = round((time.perf_counter() - started) * 1000, 2)
+        return len(events)
+
+# ===== READING =====
+
+def _read_totals(cursor):
+    cursor.execute('SELECT game_name, total_plays FROM game_stats')
+    return {row['game_name']: row['total_plays'] or 0 for row in cursor.fetchall()}
+
+def _load_totals():
+    """First read in a process: load the persisted totals without writing anything"""
+    from website.leaderboard.leaderboard import get_db_connection
+    global _persisted_totals
+
+    try:
+        with get_db_connection() as conn:
+            totals = _read_totals(conn.cursor())
+    except Exception as e:
+        # Leave it to the flusher thread rather than retrying on every read
+        print(f"Error loading play totals: {e}")
+        totals = {}
+    with _buffer_lock:
+        if _persisted_totals is None:  # A flush may have loaded them meanwhile
+            _persisted_totals = totals
+
+def get_play_count(game_name):
+    """Total plays of a game across all workers, plus this worker's unflushed plays"""
+    ensure_play_flusher()  # Also refreshes the totals in workers that never record plays
+    if _persisted_totals is None:
+        _load_totals()
+    with _buffer_lock:
+        return _persisted_totals.get(game_name, 0) + _pending_counts[game_name]
+
+def get_recently_played(user_identifier, limit=RECENTLY_PLAYED_LIMIT):
+    """A player's most recently played games, newest first, without repeats"""
+    from website.leaderboard.leaderboard import get_db_connection
+
+    with _buffer_lock:
+        recent = [game_name for game_name, user, _ in reversed(_buffer) if user == user_identifier]
+    try:
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                SELECT game_name, MAX(played_at) AS last_played
+                FROM play_events
+                WHERE user_identifier = ?
+                GROUP BY game_name
+                ORDER BY last_played DESC
+                LIMIT ?
+            ''', (user_identifier, limit))
+            recent.extend(row['game_name'] for row in cursor.fetchall())
+    except Exception as e:
+        print(f"Error getting recently played games: {e}")
+    return list(dict.fromkeys(recent))[:limit]
+
+def prune_play_events(batch_size=500, pause=0.05):
+    """
+    Delete play events the recently-played list no longer needs
+
+    Keeps each player's latest play of each game, if it is from the last
+    PLAY_EVENTS_KEEP_DAYS days. Returns how many rows were deleted.
+    """
+    from website.leaderboard.leaderboard import get_db_connection
+
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute('''
+            SELECT id FROM (
+                SELECT id, played_at,
+                       ROW_NUMBER() OVER (PARTITION BY user_identifier, game_name
+                                          ORDER BY played_at DESC, id DESC) AS position
+                FROM play_events
+            )
+            WHERE position > 1 OR played_at < ?
+            ORDER BY id
+        ''', (time.time() - PLAY_EVENTS_KEEP_DAYS * 86400,))
+        event_ids = [row[0] for row in cursor.fetchall()]
+
+    deleted = 0
+    for start in range(0, len(event_ids), batch_size):
+        batch = event_ids[start:start + batch_size]
+        with get_db_connection() as conn:
+            conn.execute(f"DELETE FROM play_events WHERE id IN ({','.join('?' * len(batch))})", batch)
+            conn.commit()
+        deleted += len(batch)
+        time.sleep(pause)
+    return deleted
+
+def forget_game_plays(game_name):
+    """Drop a game's unflushed plays and cached total (before the game is deleted)"""
+    with _flush_lock:  # Wait out a flush that may be writing them
+        with _buffer_lock:
+            _buffer[:] = [event for event in _buffer if event[0] != game_name]
+            _pending_counts.pop(game_name, None)
+            _unflushed_counts.pop(game_name, None)
+            if _persisted_totals is not None:
+                _persisted_totals.pop(game_name, None)
+
+def get_play_pipeline_stats():
+    """Buffer and flush counters for the admin panel"""
+    with _buffer_lock:
+        return dict(_stats, buffered=len(_buffer))
+
+# ===== BACKGROUND FLUSHER =====
+
+_flusher_pid = None
+_flusher_lock = threading.Lock()
+
+def _flush_loop(interval):
+    rounds = 0
+    while True:
+        _flush_wanted.wait(interval)
+        _flush_wanted.clear()
+        try:
+            flush_plays()
+        except Exception as e:
+            print(f"Error in play flusher: {e}")
+
+        rounds += 1
+        if rounds % PLAY_PRUNE_EVERY == 0:
+            try:
+                pruned = prune_play_events()
+                with _buffer_lock:
+                    _stats['pruned'] += pruned
+                    _stats['last_prune_at'] = time.time()
+            except Exception as e:
+                print(f"Error pruning play events: {e}")
+
+def ensure_play_flusher(interval=PLAY_FLUSH_SECONDS):
+    """Start the flusher thread once per process (threads don't survive a fork)"""
+    global _flusher_pid
+    if _flusher_pid == os.getpid():
+        return
+    with _flusher_lock:
+        if _flusher_pid == os.getpid():
+            return
+        threading.Thread(target=_flush_loop, args=(interval,),
+                         name='play-flusher', daemon=True).start()
+        if _flusher_pid is None:
+            atexit.register(flush_plays)
+        _flusher_pid = os.getpid()
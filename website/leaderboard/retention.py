@@ -0,0 +1,304 @@
+"""
+Retention and archival for leaderboard_entries
+
+Each game has a retention policy describing which entries stay in the hot
+table:
+
+- keep_top:        the game's top N entries overall
+- keep_days:       everything submitted in the last M days
+- keep_per_user:   each player's best K entries (defaults to the game's
+                   game_configs.max_entries_per_user)
+- each player's personal best (user_bests) and anything with an unreviewed
+  outlier flag are always kept
+
+Everything else is moved by a background compactor into a separate archive
+database as zlib-compressed JSON batches, so the hot table and its rank
+indexes stay small. Rows are written to the archive before they are deleted
+from the hot table, so an interrupted run can duplicate a batch but never
+lose one.
+
+Retention deletes rows from the hot table, so the background compactor is
+opt-in: set LEADERBOARD_RETENTION=1. The admin panel can still apply the
+policies on demand.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+
+# ===== CONFIGURATION =====
+
+DEFAULT_RETENTION_POLICY = {
+    'keep_top': 1000,
+    'keep_days': 90,
+    'keep_per_user': None  # None = use game_configs.max_entries_per_user
+}
+
+# Per-game overrides, merged over the default
+RETENTION_POLICIES = {
+    # 'Cosmic Dino Runner': {'keep_top': 5000},
+}
+
+RETENTION_ENABLED = os.environ.get('LEADERBOARD_RETENTION', '0') == '1'
+RETENTION_INTERVAL_SECONDS = 6 * 3600
+RETENTION_BATCH_SIZE = 500
+RETENTION_BATCH_PAUSE = 0.05  # Seconds between batches so score submissions get the write lock
+
+ARCHIVE_DB_NAME = 'leaderboards_archive.db'
+
+# How long the admin panel reuses its prunable-entry counts (a window query per game)
+PRUNABLE_COUNTS_TTL = 600  # seconds
+
+_prunable_counts = {'counts': None, 'computed_at': None}
+_prunable_lock = threading.Lock()
+
+def get_retention_policy(game_name):
+    """Effective policy for a game"""
+    return dict(DEFAULT_RETENTION_POLICY, **RETENTION_POLICIES.get(game_name, {}))
+
+# ===== ARCHIVE DATABASE =====
+
+def get_archive_path():
+    """Archive database lives next to the main database"""
+    from website.leaderboard.leaderboard import get_db_path
+    return os.path.join(os.path.dirname(get_db_path()), ARCHIVE_DB_NAME)
+
+def _connect_archive():
+    conn = sqlite3.connect(get_archive_path(), timeout=30.0)
+    conn.row_factory = sqlite3.Row
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS archive_batches (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            game_name TEXT NOT NULL,
+            entry_count INTEGER NOT NULL,
+            first_entry_id INTEGER NOT NULL,
+            last_entry_id INTEGER NOT NULL,
+            payload BLOB NOT NULL,
+            archived_at DATETIME DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+    conn.execute('''
+        CREATE INDEX IF NOT EXISTS idx_archive_batches_game
+        ON archive_batches(game_name, first_entry_id)
+    ''')
+    return conn
+
+def load_archive_batch(batch_id):
+    """Decompress an archived batch back into entry dicts"""
+    conn = _connect_archive()
+    try:
+        row = conn.execute('SELECT payload FROM archive_batches WHERE id = ?', (batch_id,)).fetchone()
+        return json.loads(zlib.decompress(row['payload'])) if row else None
+    finally:
+        conn.close()
+
+def get_archive_summary():
+    """Archived entry counts per game"""
+    if not os.path.exists(get_archive_path()):
+        return {}
+    conn = _connect_archive()
+    try:
+        rows = conn.execute('''
+            SELECT game_name, SUM(entry_count) AS entries, COUNT(*) AS batches,
+                   SUM(LENGTH(payload)) AS bytes, MAX(archived_at) AS last_archived
+            FROM archive_batches GROUP BY game_name
+        ''').fetchall()
+        return {row['game_name']: dict(row) for row in rows}
+    finally:
+        conn.close()
+
+# ===== PRUNE SELECTION =====
+
+def find_prunable_entries(cursor, game_name, higher_is_better, policy):
+    """
+    Ids of entries the policy no longer keeps in the hot table (oldest first)
+    """
+    order = 'DESC' if higher_is_better else 'ASC'
+    keep_per_user = policy['keep_per_user']
+    if keep_per_user is None:
+        cursor.execute('SELECT max_entries_per_user FROM game_configs WHERE game_name = ?', (game_name,))
+        config = cursor.fetchone()
+        keep_per_user = config[0] if config and config[0] else 10
+
+    cursor.execute(f'''
+        SELECT id FROM (
+            SELECT id, timestamp,
+                   ROW_NUMBER() OVER (ORDER BY ranking_score {order}, id) AS overall_position,
+                   ROW_NUMBER() OVER (PARTITION BY username ORDER BY ranking_score {order}, id) AS user_position
+            FROM leaderboard_entries
+            WHERE game_name = ?
+        )
+        WHERE overall_position > ?
+          AND user_position > ?
+          AND timestamp < datetime('now', ?)
+          AND id NOT IN (SELECT entry_id FROM user_bests WHERE game_name = ?)
+          AND id NOT IN (SELECT entry_id FROM score_outlier_flags WHERE reviewed = 0)
+        ORDER BY id
+    ''', (game_name, policy['keep_top'], keep_per_user, f"-{int(policy['keep_days'])} days", game_name))
+    return [row[0] for row in cursor.fetchall()]
+
+# ===== COMPACTOR =====
+
+def _archive_batch(game_name, entry_ids):
+    """Move one batch of entries to the archive; returns how many were moved"""
+    from website.leaderboard.leaderboard import get_db_connection
+    placeholders = ','.join('?' * len(entry_ids))
+
+    with get_db_connection() as conn:
+        # Hold the write lock across archive + delete so concurrent compactors
+        # in other worker processes can't archive the same rows twice
+        conn.execute('BEGIN IMMEDIATE')
+        cursor = conn.cursor()
+        cursor.execute(f'SELECT * FROM leaderboard_entries WHERE id IN ({placeholders}) ORDER BY id',
+                       entry_ids)
+        rows = [dict(row) for row in cursor.fetchall()]
+        if not rows:
+            conn.rollback()
+            return 0
+
+        archive = _connect_archive()
+        try:
+            archive.execute('''
+                INSERT INTO archive_batches (game_name, entry_count, first_entry_id, last_entry_id, payload)
+                VALUES (?, ?, ?, ?, ?)
+            ''', (game_name, len(rows), rows[0]['id'], rows[-1]['id'],
+                  zlib.compress(json.dumps(rows).encode('utf-8'), 9)))
+            archive.commit()
+        finally:
+            archive.close()
+
+        moved_ids = [row['id'] for row in rows]
+        placeholders = ','.join('?' * len(moved_ids))
+        cursor.execute(f'DELETE FROM leaderboard_entries WHERE id IN ({placeholders})', moved_ids)
+        cursor.execute(f'DELETE FROM period_leaderboard_entries WHERE entry_id IN ({placeholders})', moved_ids)
+        conn.commit()
+        return len(moved_ids)
+
+def compact_game(game_name, higher_is_better, batch_size=RETENTION_BATCH_SIZE):
+    """Archive everything a game's policy no longer keeps, in batched transactions"""
+    from website.leaderboard.leaderboard import get_db_connection, invalidate_games_summary
+    from website.leaderboard.histograms import rebuild_histogram
+    from website.leaderboard.widgets import invalidate_game_widgets
+
+    policy = get_retention_policy(game_name)
+    with get_db_connection() as conn:
+        entry_ids = find_prunable_entries(conn.cursor(), game_name, higher_is_better, policy)
+
+    archived = 0
+    for start in range(0, len(entry_ids), batch_size):
+        archived += _archive_batch(game_name, entry_ids[start:start + batch_size])
+        time.sleep(RETENTION_BATCH_PAUSE)
+
+    if archived:
+        with get_db_connection() as conn:
+            rebuild_histogram(conn.cursor(), game_name, higher_is_better)
+            conn.commit()
+        invalidate_game_widgets(game_name)
+        invalidate_games_summary()
+
+    return archived
+
+_last_run = {'started_at': None, 'finished_at': None, 'archived': {}, 'error': None}
+
+def run_retention():
+    """Apply retention to every game"""
+    from website.leaderboard.leaderboard import get_db_connection
+    _last_run.update(started_at=time.time(), finished_at=None, archived={}, error=None)
+    try:
+        with get_db_connection() as conn:
+            games = conn.execute('SELECT game_name, higher_is_better FROM game_configs').fetchall()
+        for game_name, higher_is_better in games:
+            _last_run['archived'][game_name] = compact_game(game_name, bool(higher_is_better))
+        with _prunable_lock:
+            # Everything prunable was just archived
+            _prunable_counts.update(counts={game_name: 0 for game_name, _ in games},
+                                    computed_at=time.time())
+    except Exception as e:
+        print(f"Error applying retention: {e}")
+        _last_run['error'] = str(e)
+    _last_run['finished_at'] = time.time()
+    return dict(_last_run)
+
+def _get_prunable_counts(cursor, configs, refresh=False):
+    """{game_name: prunable entries}, recomputed at most every PRUNABLE_COUNTS_TTL"""
+    with _prunable_lock:
+        counts, computed_at = _prunable_counts['counts'], _prunable_counts['computed_at']
+    if not refresh and counts is not None and time.time() - computed_at < PRUNABLE_COUNTS_TTL \
+            and all(game_name in counts for game_name, _ in configs):
+        return counts, computed_at
+
+    counts = {game_name: len(find_prunable_entries(cursor, game_name, higher_is_better,
+                                                   get_retention_policy(game_name)))
+              for game_name, higher_is_better in configs}
+    computed_at = time.time()
+    with _prunable_lock:
+        _prunable_counts.update(counts=counts, computed_at=computed_at)
+    return counts, computed_at
+
+def get_retention_overview(refresh=False):
+    """
+    Policies, hot/prunable/archived counts and the last run for the admin panel
+
+    Prunable counts are cached (see PRUNABLE_COUNTS_TTL); refresh=True recomputes them.
+    """
+    from website.leaderboard.leaderboard import get_db_connection
+    archive = get_archive_summary()
+    games = []
+    prunable_computed_at = None
+    try:
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                SELECT gc.game_name, gc.higher_is_better, COUNT(le.id) AS hot_entries
+                FROM game_configs gc
+                LEFT JOIN leaderboard_entries le ON le.game_name = gc.game_name
+                GROUP BY gc.game_name
+                ORDER BY gc.game_name
+            ''')
+            rows = cursor.fetchall()
+            prunable, prunable_computed_at = _get_prunable_counts(
+                cursor, [(row['game_name'], bool(row['higher_is_better'])) for row in rows], refresh)
+            for row in rows:
+                games.append({
+                    'game_name': row['game_name'],
+                    'policy': get_retention_policy(row['game_name']),
+                    'hot_entries': row['hot_entries'],
+                    'prunable_entries': prunable.get(row['game_name'], 0),
+                    'archived_entries': archive.get(row['game_name'], {}).get('entries') or 0
+                })
+    except Exception as e:
+        print(f"Error getting retention overview: {e}")
+
+    return {
+        'enabled': RETENTION_ENABLED,
+        'prunable_computed_at': prunable_computed_at,
+        'interval_seconds': RETENTION_INTERVAL_SECONDS,
+        'games': games,
+        'archive': archive,
+        'last_run': dict(_last_run)
+    }
+
+# ===== BACKGROUND COMPACTOR =====
+
+_compactor_pid = None
+_compactor_lock = threading.Lock()
+
+def _compact_loop(interval):
+    while True:
+        time.sleep(interval)
+        run_retention()
+
+def ensure_retention_compactor(interval=RETENTION_INTERVAL_SECONDS):
+    """Start the compactor thread once per process (threads don't survive a fork)"""
+    global _compactor_pid
+    if not RETENTION_ENABLED or _compactor_pid == os.getpid():
+        return
+    with _compactor_lock:
+        if _compactor_pid == os.getpid():
+            return
+        threading.Thread(target=_compact_loop, args=(interval,),
+                         name='retention-compactor', daemon=True).start()
+        _compactor_pid = os.getpid()
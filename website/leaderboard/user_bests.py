@@ -0,0 +1,116 @@
+"""
+Personal-best-per-player leaderboards
+
+user_bests holds one row per (game, username): the player's best entry so far
+and how many attempts they have made. add_score upserts it, replacing the row
+only when the new ranking_score is better, so a "unique players" board is an
+ordered read of the (game_name, ranking_score) index rather than a GROUP BY
+over every attempt.
+"""
+
+def _better(higher_is_better):
+    """SQL condition for 'the new score beats the stored best'"""
+    if higher_is_better:
+        return 'excluded.ranking_score > user_bests.ranking_score'
+    return 'excluded.ranking_score < user_bests.ranking_score'
+
+def update_user_best(cursor, game_name, username, entry_id, original_score, ranking_score, higher_is_better):
+    """
+    Fold a new entry into the player's best (call inside add_score's transaction)
+
+    Returns:
+        bool: True if this entry is the player's new personal best
+    """
+    better = _better(higher_is_better)
+    cursor.execute(f'''
+        INSERT INTO user_bests
+        (game_name, username, entry_id, original_score, ranking_score, attempts, achieved_at)
+        VALUES (?, ?, ?, ?, ?, 1, CURRENT_TIMESTAMP)
+        ON CONFLICT(game_name, username) DO UPDATE SET
+            attempts = user_bests.attempts + 1,
+            entry_id = CASE WHEN {better} THEN excluded.entry_id ELSE user_bests.entry_id END,
+            original_score = CASE WHEN {better} THEN excluded.original_score ELSE user_bests.original_score END,
+            achieved_at = CASE WHEN {better} THEN excluded.achieved_at ELSE user_bests.achieved_at END,
+            ranking_score = CASE WHEN {better} THEN excluded.ranking_score ELSE user_bests.ranking_score END
+    ''', (game_name, username, entry_id, original_score, ranking_score))
+
+    cursor.execute('''
+        SELECT entry_id FROM user_bests WHERE game_name = ? AND username = ?
+    ''', (game_name, username))
+    return cursor.fetchone()[0] == entry_id
+
+def get_player_rank(cursor, game_name, ranking_score, higher_is_better):
+    """Rank among distinct players for a best score (index range count)"""
+    comparison = '>' if higher_is_better else '<'
+    cursor.execute(f'''
+        SELECT COUNT(*) + 1 AS rank
+        FROM user_bests
+        WHERE game_name = ? AND ranking_score {comparison} ?
+    ''', (game_name, ranking_score))
+    return cursor.fetchone()[0]
+
+def get_unique_player_scores(cursor, game_name, higher_is_better, limit=50, offset=0):
+    """
+    One row per player, ranked by their best score
+
+    Returns:
+        tuple: (scores, total_players)
+    """
+    cursor.execute('SELECT COUNT(*) AS total FROM user_bests WHERE game_name = ?', (game_name,))
+    total_players = cursor.fetchone()['total']
+
+    order_clause = "ORDER BY ranking_score DESC" if higher_is_better else "ORDER BY ranking_score ASC"
+    cursor.execute(f'''
+        SELECT username, original_score, ranking_score, attempts, achieved_at
+        FROM user_bests
+        WHERE game_name = ?
+        {order_clause}
+        LIMIT ? OFFSET ?
+    ''', (game_name, limit, offset))
+
+    scores = []
+    for position, row in enumerate(cursor.fetchall()):
+        scores.append({
+            'rank': offset + position + 1,
+            'username': row['username'],
+            'score': row['original_score'],
+            'ranking_score': row['ranking_score'],
+            'attempts': row['attempts'],
+            'timestamp': row['achieved_at'],
+            'date': row['achieved_at']
+        })
+
+    return scores, total_players
+
+def rebuild_user_bests(cursor, game_name, higher_is_better=None):
+    """Recompute a game's bests from its entries (after admin edits/deletes or for backfill)"""
+    if higher_is_better is None:
+        cursor.execute('SELECT higher_is_better FROM game_configs WHERE game_name = ?', (game_name,))
+        config = cursor.fetchone()
+        higher_is_better = bool(config[0]) if config else True
+    order = 'DESC' if higher_is_better else 'ASC'
+    cursor.execute('DELETE FROM user_bests WHERE game_name = ?', (game_name,))
+    cursor.execute(f'''
+        INSERT INTO user_bests
+        (game_name, username, entry_id, original_score, ranking_score, attempts, achieved_at)
+        SELECT game_name, username, id, original_score, ranking_score, attempts, timestamp
+        FROM (
+            SELECT *,
+                   ROW_NUMBER() OVER (PARTITION BY username ORDER BY ranking_score {order}, id) AS position,
+                   COUNT(*) OVER (PARTITION BY username) AS attempts
+            FROM leaderboard_entries
+            WHERE game_name = ?
+        )
+        WHERE position = 1
+    ''', (game_name,))
+    return cursor.rowcount
+
+def rebuild_all_user_bests(cursor):
+    """Recompute bests for every game"""
+    cursor.execute('SELECT game_name, higher_is_better FROM game_configs')
+    rebuilt = {}
+    for game_name, higher_is_better in cursor.fetchall():
+        rebuilt[game_name] = rebuild_user_bests(cursor, game_name, bool(higher_is_better))
+    # Games whose config was removed keep no bests
+    cursor.execute('DELETE FROM user_bests WHERE game_name NOT IN (SELECT game_name FROM game_configs)')
+    return rebuilt
@@ -0,0 +1,347 @@
+"""
+Run-replay verification pipeline for leaderboard submissions
+
+Games may attach a compact input log to a score (delta-encoded frame inputs plus
+the seed the run was played with). The log is re-simulated by a headless
+verifier on a background worker pool, off the request path, and the verdict
+decides whether the score is allowed into the ranked leaderboard tables:
+
+- verified:    replay reproduces the claimed score, entry is ranked normally
+- plausible:   no replay exists for the game, but the run summary allows the
+               score; entry is ranked normally (weaker than verified)
+- flagged:     replay is close but not exact, entry is ranked and marked for review
+- quarantined: replay cannot reach the claimed score, entry is held back
+
+Submissions without an input log skip verification entirely (unchanged behaviour).
+"""
+
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+
+# ===== CONFIGURATION =====
+
+VERIFIER_WORKERS = int(os.environ.get('VERIFIER_WORKERS', 2))
+VERIFY_WAIT_SECONDS = 2.0  # How long score submission waits for a verdict before holding the entry
+MAX_INPUT_EVENTS = 20000   # Upper bound on logged input events accepted per run
+MAX_REPLAY_FRAMES = 1000000  # Roughly 4.5 hours of play at 60fps
+
+class VerificationStatus:
+    """Verdicts a run can receive"""
+    PENDING = "pending"
+    VERIFIED = "verified"
+    PLAUSIBLE = "plausible"  # Passed a bounds check, not a replay
+    FLAGGED = "flagged"
+    QUARANTINED = "quarantined"
+    ERROR = "error"
+
+# Verdicts that keep an entry out of the ranked tables
+HELD_STATUSES = [VerificationStatus.PENDING, VerificationStatus.QUARANTINED, VerificationStatus.ERROR]
+
+class InvalidInputLog(ValueError):
+    """Raised when an uploaded input log is malformed"""
+
+# Verdicts that need no admin review
+CLEARED_STATUSES = [VerificationStatus.VERIFIED, VerificationStatus.PLAUSIBLE]
+
+# ===== INPUT LOG DECODING =====
+
+def decode_input_log(input_log):
+    """
+    Validate an uploaded input log and expand its delta-encoded inputs
+
+    The log is a dict like {'v': 1, 'inputs': [delta0, bits0, delta1, bits1, ...], ...}
+    where each delta is the number of frames since the previous input event.
+
+    Returns:
+        dict: The log with 'events' added as a list of (absolute_frame, bits)
+    """
+    if not isinstance(input_log, dict):
+        raise InvalidInputLog('Input log must be an object')
+    if input_log.get('v') != 1:
+        raise InvalidInputLog('Unsupported input log version')
+
+    inputs = input_log.get('inputs') or []
+    if not isinstance(inputs, list) or len(inputs) % 2 != 0:
+        raise InvalidInputLog('Inputs must be a flat list of (delta, bits) pairs')
+    if len(inputs) > MAX_INPUT_EVENTS * 2:
+        raise InvalidInputLog('Input log too long')
+
+    events = []
+    frame = 0
+    for i in range(0, len(inputs), 2):
+        delta, bits = inputs[i], inputs[i + 1]
+        if not isinstance(delta, int) or not isinstance(bits, int) or delta < 0 or bits < 0:
+            raise InvalidInputLog('Input events must be non-negative integers')
+        frame += delta
+        events.append((frame, bits))
+
+    decoded = dict(input_log)
+    decoded['events'] = events
+    return decoded
+
+# ===== VERIFIER REGISTRY =====
+
+_verifiers = {}
+_replay_required = set()  # Games whose scores are only ranked through their own replay path
+
+def register_verifier(game_name, replay_required=False):
+    """
+    Decorator registering a headless verifier for a game
+
+    A verifier is called as verifier(claimed_score, decoded_log) and returns a
+    dict with 'status', 'simulated_score', 'frames' and 'reason'.
+    replay_required=True refuses the game's scores on the generic submit API.
+    """
+    def decorator(func):
+        _verifiers[game_name] = func
+        if replay_required:
+            _replay_required.add(game_name)
+        return func
+    return decorator
+
+def has_verifier(game_name):
+    """Check if a game supports replay verification"""
+    return game_name in _verifiers
+
+def requires_replay(game_name):
+    """Check if a game's scores must come with a replayable run"""
+    return game_name in _replay_required
+
+# ===== WORKER POOL =====
+
+_executor = None
+_executor_lock = threading.Lock()
+_futures = {}  # verification_id -> Future (in-process only)
+
+_metrics_lock = threading.Lock()
+_metrics = {
+    'started_at': time.time(),
+    'submitted': 0,
+    'completed': 0,
+    'frames_simulated': 0,
+    'busy_seconds': 0.0,
+    'max_seconds': 0.0,
+    'by_status': {}
+}
+
+def _get_executor():
+    """Create the verifier pool on first use (keeps worker startup cheap)"""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=VERIFIER_WORKERS,
+                                           thread_name_prefix='run-verifier')
+        return _executor
+
+def reset_worker_pool():
+    """Drop the pool so a forked worker process starts its own threads"""
+    global _executor
+    with _executor_lock:
+        _executor = None
+        _futures.clear()
+
+def submit_run_for_verification(game_name, claimed_score, input_log, session_id=None):
+    """
+    Queue a run for background replay
+
+    Returns:
+        int: verification id to carry with the pending score
+    Raises:
+        InvalidInputLog: if the log is malformed or the game has no verifier
+    """
+    if not has_verifier(game_name):
+        raise InvalidInputLog(f'No replay verifier for {game_name}')
+
+    decoded = decode_input_log(input_log)
+
+    from website.leaderboard.leaderboard import get_db_connection
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute('''
+            INSERT INTO run_verifications (game_name, claimed_score, seed, status, session_id)
+            VALUES (?, ?, ?, ?, ?)
+        ''', (game_name, claimed_score, decoded.get('seed'), VerificationStatus.PENDING, session_id))
+        verification_id = cursor.lastrowid
+        conn.commit()
+
+    with _metrics_lock:
+        _metrics['submitted'] += 1
+
+    future = _get_executor().submit(_run_verification, verification_id, game_name, claimed_score, decoded)
+    _futures[verification_id] = future
+    future.add_done_callback(lambda f: _futures.pop(verification_id, None))
+    return verification_id
+
+def _run_verification(verification_id, game_name, claimed_score, decoded):
+    """Worker job: replay a run, store the verdict and release held entries"""
+    started = time.time()
+    try:
+        result = _verifiers[game_name](claimed_score, decoded)
+    except Exception as e:
+        print(f"Error verifying run {verification_id}: {e}")
+        result = {'status': VerificationStatus.ERROR, 'simulated_score': None,
+                  'frames': 0, 'reason': str(e)}
+    elapsed = time.time() - started
+
+    with _metrics_lock:
+        _metrics['completed'] += 1
+        _metrics['frames_simulated'] += result.get('frames', 0)
+        _metrics['busy_seconds'] += elapsed
+        _metrics['max_seconds'] = max(_metrics['max_seconds'], elapsed)
+        _metrics['by_status'][result['status']] = _metrics['by_status'].get(result['status'], 0) + 1
+
+    try:
+        from website.leaderboard.leaderboard import get_db_connection
+        with get_db_connection() as conn:
+            conn.execute('''
+                UPDATE run_verifications
+                SET status = ?, simulated_score = ?, reason = ?, duration_ms = ?,
+                    verified_at = CURRENT_TIMESTAMP
+                WHERE id = ?
+            ''', (result['status'], result.get('simulated_score'), result.get('reason'),
+                  int(elapsed * 1000), verification_id))
+            conn.commit()
+
+        if result['status'] not in HELD_STATUSES:
+            release_held_score(verification_id)
+    except Exception as e:
+        print(f"Error storing verification {verification_id}: {e}")
+
+    return result
+
+def get_verification_status(verification_id):
+    """Get the stored verdict for a run"""
+    from website.leaderboard.leaderboard import get_db_connection
+    try:
+        with get_db_connection() as conn:
+            row = conn.execute('SELECT status FROM run_verifications WHERE id = ?',
+                               (verification_id,)).fetchone()
+            return row['status'] if row else None
+    except Exception as e:
+        print(f"Error reading verification {verification_id}: {e}")
+        return None
+
+def wait_for_verification(verification_id, timeout=VERIFY_WAIT_SECONDS):
+    """
+    Wait briefly for a verdict (the player is typing their name meanwhile,
+    so the replay has normally finished long before this is called)
+    """
+    future = _futures.get(verification_id)
+    if future is not None:
+        try:
+            future.result(timeout=timeout)
+        except FutureTimeoutError:
+            pass
+    return get_verification_status(verification_id)
+
+# ===== HELD (QUARANTINED) SCORES =====
+
+def hold_score(verification_id, pending_score, username, ip_address=None, session_id=None):
+    """Keep a score out of the ranked tables until its run is cleared"""
+    from website.leaderboard.leaderboard import get_db_connection
+    with get_db_connection() as conn:
+        conn.execute('''
+            INSERT INTO quarantined_scores
+            (verification_id, game_name, username, score, score_type, ranking_method,
+             target_value, ip_address, session_id)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ''', (verification_id, pending_score['game_name'], username.strip()[:20],
+              pending_score['score'], pending_score['score_type'],
+              pending_score.get('ranking_method'), pending_score.get('target_value'),
+              ip_address, session_id))
+        conn.commit()
+
+    # The verdict may have landed between the wait and the insert
+    if get_verification_status(verification_id) not in HELD_STATUSES:
+        release_held_score(verification_id)
+
+def release_held_score(verification_id):
+    """Move a held score into the ranked leaderboard (after a late verdict or admin review)"""
+    from website.leaderboard.leaderboard import get_db_connection, add_score
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute('''
+            SELECT game_name, username, score, score_type, ranking_method,
+                   target_value, ip_address, session_id
+            FROM quarantined_scores WHERE verification_id = ?
+        ''', (verification_id,))
+        held = cursor.fetchone()
+        cursor.execute('DELETE FROM quarantined_scores WHERE verification_id = ?', (verification_id,))
+        deleted = cursor.rowcount
+        conn.commit()
+
+    # Another worker (or the admin) may have released it first
+    if not held or not deleted:
+        return None
+
+    result = add_score(held['game_name'], held['username'], held['score'], held['score_type'],
+                       held['ranking_method'], held['target_value'], held['ip_address'],
+                       session_id=held['session_id'])
+    if result['success']:
+        link_verification_entry(verification_id, result['entry_id'])
+    return result
+
+def reject_held_score(verification_id):
+    """Discard a held score (admin decision)"""
+    from website.leaderboard.leaderboard import get_db_connection
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute('DELETE FROM quarantined_scores WHERE verification_id = ?', (verification_id,))
+        cursor.execute('''
+            UPDATE run_verifications SET status = ?, reason = COALESCE(reason, 'rejected by admin')
+            WHERE id = ?
+        ''', (VerificationStatus.QUARANTINED, verification_id))
+        conn.commit()
+        return cursor.rowcount > 0
+
+def link_verification_entry(verification_id, entry_id):
+    """Remember which leaderboard entry a verified run produced"""
+    from website.leaderboard.leaderboard import get_db_connection
+    with get_db_connection() as conn:
+        conn.execute('UPDATE run_verifications SET entry_id = ? WHERE id = ?',
+                     (entry_id, verification_id))
+        conn.commit()
+
+def get_review_queue(limit=100):
+    """Flagged and quarantined runs for the admin panel"""
+    from website.leaderboard.leaderboard import get_db_connection
+    try:
+        with get_db_connection() as conn:
+            rows = conn.execute('''
+                SELECT rv.id, rv.game_name, rv.claimed_score, rv.simulated_score, rv.status,
+                       rv.reason, rv.entry_id, rv.submitted_at, qs.username
+                FROM run_verifications rv
+                LEFT JOIN quarantined_scores qs ON qs.verification_id = rv.id
+                WHERE rv.status NOT IN (?, ?)
+                ORDER BY rv.id DESC
+                LIMIT ?
+            ''', (*CLEARED_STATUSES, limit)).fetchall()
+            return [dict(row) for row in rows]
+    except Exception as e:
+        print(f"Error getting review queue: {e}")
+        return []
+
+# ===== METRICS =====
+
+def get_verifier_metrics():
+    """Throughput metrics for sizing the verifier pool"""
+    with _metrics_lock:
+        uptime = max(time.time() - _metrics['started_at'], 1e-9)
+        completed = _metrics['completed']
+        busy = _metrics['busy_seconds']
+        return {
+            'workers': VERIFIER_WORKERS,
+            'submitted': _metrics['submitted'],
+            'completed': completed,
+            'queue_depth': _metrics['submitted'] - completed,
+            'by_status': dict(_metrics['by_status']),
+            'runs_per_second': round(completed / uptime, 4),
+            'frames_simulated': _metrics['frames_simulated'],
+            'frames_per_busy_second': round(_metrics['frames_simulated'] / busy) if busy else 0,
+            'avg_verify_ms': round(busy / completed * 1000, 2) if completed else 0,
+            'max_verify_ms': round(_metrics['max_seconds'] * 1000, 2),
+            # Fraction of total worker capacity spent replaying
+            'utilization': round(busy / (uptime * VERIFIER_WORKERS), 4)
+        }
@@ -0,0 +1,127 @@
+"""
+Leaderboard widget rendering service
+Shared by leaderboard.leaderboard_widget and the in-game widgets (dino_runner.leaderboard)
+
+Rendered HTML fragments are cached per (game, limit, style) in a size-capped
+LRU and dropped as soon as a new score is added for that game. Responses carry
+an ETag so clients that poll between runs get a 304 instead of the full fragment.
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from flask import render_template, request, jsonify, make_response
+
+# Backstop for caches held by other worker processes, which never see
+# invalidations triggered by a score submitted to a different worker
+WIDGET_CACHE_TTL = 30  # seconds
+WIDGET_CACHE_MAX_ENTRIES = 256
+
+# Largest leaderboard a widget shows; requested limits are clamped to this
+WIDGET_MAX_LIMIT = 50
+
+# Template used for each widget style
+WIDGET_TEMPLATES = {
+    'full': 'leaderboard_widget.html',      # Standalone embeddable page
+    'compact': 'leaderboard_widget_compact.html'  # Fragment injected by game pages
+}
+
+_widget_cache = OrderedDict()  # (game_name, limit, style) -> {'html', 'etag', 'rendered_at'}, LRU first
+_cache_lock = threading.Lock()
+_cache_stats = {'hits': 0, 'misses': 0, 'evictions': 0, 'invalidations': 0}
+
+# Bumped by every invalidation, so a render that overlapped one isn't stored
+_generation = 0
+
+def _make_etag(html):
+    """Strong ETag from fragment content"""
+    return hashlib.sha1(html.encode('utf-8')).hexdigest()
+
+def _render_fragment(game_name, limit, style):
+    """Render a widget fragment from the database (cache miss path)"""
+    from website.leaderboard.leaderboard import get_leaderboard
+    leaderboard_data = get_leaderboard(game_name, limit=limit)
+    return render_template(WIDGET_TEMPLATES[style], leaderboard=leaderboard_data, limit=limit)
+
+def clamp_limit(limit, default=5):
+    """A requested widget size, kept within 1..WIDGET_MAX_LIMIT"""
+    if limit is None:
+        return default
+    return max(1, min(limit, WIDGET_MAX_LIMIT))
+
+def get_widget_fragment(game_name, limit=5, style='full'):
+    """
+    Get rendered widget HTML for a game, serving from cache when possible
+
+    Returns:
+        tuple: (html, etag)
+    """
+    if style not in WIDGET_TEMPLATES:
+        raise ValueError(f"Unknown widget style: {style}")
+
+    limit = clamp_limit(limit)
+    key = (game_name, limit, style)
+
+    with _cache_lock:
+        entry = _widget_cache.get(key)
+        if entry and time.time() - entry['rendered_at'] < WIDGET_CACHE_TTL:
+            _widget_cache.move_to_end(key)
+            _cache_stats['hits'] += 1
+            return entry['html'], entry['etag']
+        _cache_stats['misses'] += 1
+        generation = _generation
+        started = time.time()
+
+    html = _render_fragment(game_name, limit, style)
+    etag = _make_etag(html)
+
+    with _cache_lock:
+        # A score added mid-render may be missing from this fragment - serve it, don't keep it
+        if generation == _generation:
+            _widget_cache[key] = {'html': html, 'etag': etag, 'rendered_at': started}
+            _widget_cache.move_to_end(key)
+            while len(_widget_cache) > WIDGET_CACHE_MAX_ENTRIES:
+                _widget_cache.popitem(last=False)
+                _cache_stats['evictions'] += 1
+
+    return html, etag
+
+def widget_response(game_name, limit=5, style='full', as_json=False):
+    """
+    Build a conditional response for a widget
+    Returns 304 when the client's If-None-Match matches the cached fragment
+    """
+    html, etag = get_widget_fragment(game_name, limit, style)
+
+    if as_json:
+        response = jsonify({'html': html})
+    else:
+        response = make_response(html)
+
+    response.set_etag(etag)
+    # Always revalidate - the ETag makes revalidation cheap
+    response.headers['Cache-Control'] = 'no-cache'
+    return response.make_conditional(request)
+
+def invalidate_game_widgets(game_name):
+    """Drop every cached widget for a game (call after its scores change)"""
+    global _generation
+    with _cache_lock:
+        _generation += 1
+        for key in [k for k in _widget_cache if k[0] == game_name]:
+            del _widget_cache[key]
+        _cache_stats['invalidations'] += 1
+
+def invalidate_all_widgets():
+    """Drop all cached widgets (bulk edits from the admin panel)"""
+    global _generation
+    with _cache_lock:
+        _generation += 1
+        _widget_cache.clear()
+        _cache_stats['invalidations'] += 1
+
+def get_widget_cache_stats():
+    """Cache statistics for the admin panel"""
+    with _cache_lock:
+        return dict(_cache_stats, entries=len(_widget_cache), capacity=WIDGET_CACHE_MAX_ENTRIES)
@@ -0,0 +1,127 @@
+"""
+Full-page output cache for anonymous views
+
+The hub pages (home.index, test_home.index) render the same HTML for every
+visitor; per-user state (likes, favorites, recently played) is hydrated by
+the page's own JSON call after load. So their rendered body is cached per
+(endpoint, view args, the query args the view declares it varies on) for a
+short TTL. Other query args (utm tags, cache busters) share the entry.
+
+When an entry is missing or expired, only one request per key re-renders it
+(single-flight, see singleflight.py): concurrent requests for the same key
+wait for that render instead of stampeding the database and Jinja, then
+serve its result.
+
+Caches are per worker process; PAGE_CACHE_TTL bounds how stale another
+worker's copy can be after invalidate_pages() runs here.
+
+Configuration (environment):
+    PAGE_CACHE=1|0          enable/disable (default: on in production)
+    PAGE_CACHE_TTL          seconds a rendered page is served (default 10)
+"""
+
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+
+from flask import current_app, make_response, request
+
+from .runtime import is_production
+from .singleflight import Group
+
+PAGE_CACHE_ENABLED = os.environ.get('PAGE_CACHE', '1' if is_production() else '0') == '1'
+PAGE_CACHE_TTL = int(os.environ.get('PAGE_CACHE_TTL', 10))
+PAGE_CACHE_MAX_ENTRIES = 256
+
+_page_cache = OrderedDict()  # key -> {'body', 'mimetype', 'etag', 'rendered_at'}, LRU first
+_cache_lock = threading.Lock()
+_cache_stats = {'hits': 0, 'misses': 0, 'coalesced': 0, 'bypassed': 0, 'invalidations': 0}
+
+# Renders hold Response objects, so they are coalesced within this worker only
+_render_flight = Group('page renders', lock_dir=None)
+
+def _page_key(vary_args):
+    view_args = tuple(sorted((request.view_args or {}).items()))
+    return (request.endpoint, view_args, tuple(request.args.get(arg, '') for arg in vary_args))
+
+def _cached_response(entry, status):
+    response = current_app.response_class(entry['body'], mimetype=entry['mimetype'])
+    response.set_etag(entry['etag'])
+    response.headers['X-Page-Cache'] = status
+    return response.make_conditional(request)
+
+def _store(key, response):
+    """Keep a successful rendered page; returns the entry (None if not cacheable)"""
+    if response.status_code != 200 or response.direct_passthrough or response.is_streamed:
+        return None
+    body = response.get_data()
+    entry = {
+        'body': body,
+        'mimetype': response.mimetype,
+        'etag': hashlib.sha1(body).hexdigest(),
+        'rendered_at': time.time()
+    }
+    with _cache_lock:
+        _page_cache[key] = entry
+        _page_cache.move_to_end(key)
+        while len(_page_cache) > PAGE_CACHE_MAX_ENTRIES:
+            _page_cache.popitem(last=False)
+    return entry
+
+def cached_page(vary_args=(), unless=None):
+    """
+    Cache a view's rendered page (see module docstring)
+
+    Args:
+        vary_args: query args that change the page; all others are ignored
+        unless: optional callable; when it returns True the view runs uncached
+                (e.g. per-user pages)
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            if not PAGE_CACHE_ENABLED or request.method != 'GET' or (unless and unless()):
+                with _cache_lock:
+                    _cache_stats['bypassed'] += 1
+                return view(*args, **kwargs)
+
+            key = _page_key(vary_args)
+            with _cache_lock:
+                entry = _page_cache.get(key)
+                if entry and time.time() - entry['rendered_at'] < PAGE_CACHE_TTL:
+                    _page_cache.move_to_end(key)
+                    _cache_stats['hits'] += 1
+                    return _cached_response(entry, 'HIT')
+
+            def render():
+                response = make_response(view(*args, **kwargs))
+                return _store(key, response), response
+
+            (entry, response), shared = _render_flight.do(key, render, copy_result=False)
+            with _cache_lock:
+                _cache_stats['coalesced' if shared else 'misses'] += 1
+            if entry:
+                return _cached_response(entry, 'COALESCED' if shared else 'MISS')
+            # Not cacheable (error page, redirect...) - a waiter renders its own
+            return view(*args, **kwargs) if shared else response
+        return wrapper
+    return decorator
+
+def invalidate_pages(endpoint=None):
+    """Drop cached pages for one endpoint (or all) after data they show changes"""
+    with _cache_lock:
+        if endpoint is None:
+            _page_cache.clear()
+        else:
+            for key in [k for k in _page_cache if k[0] == endpoint]:
+                del _page_cache[key]
+        _cache_stats['invalidations'] += 1
+
+def get_page_cache_stats():
+    """Cache statistics for the admin panel"""
+    with _cache_lock:
+        return dict(_cache_stats, entries=len(_page_cache), enabled=PAGE_CACHE_ENABLED,
+                    ttl=PAGE_CACHE_TTL)
@@ -6,7 +6,6 @@ import traceback
 import random
 from datetime import datetime
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 LEADERBOARD_AVAILABLE = False
@@ -14,6 +13,7 @@ LEADERBOARD_ERROR = None
 
 try:
     from website.leaderboard.leaderboard import submit_score_lower_better
+    from website.leaderboard.plays import record_request_play
     LEADERBOARD_AVAILABLE = True
     logger.info("Leaderboard system loaded successfully")
 except ImportError as e:
@@ -190,6 +190,9 @@ def start_game():
         
         logger.info(f"React time game started at {start_time}, indicator at {indicator_time} (delay: {indicator_delay:.2f}s)")
         
+        if LEADERBOARD_AVAILABLE:
+            record_request_play('React Time Challenge')
+        
         return jsonify({
             'success': True,
             'start_time': start_time,
@@ -0,0 +1,49 @@
+"""
+Runtime environment detection and process lifecycle helpers
+
+Production is detected from RENDER (our host), APP_ENV=production (set by
+gunicorn.conf.py) or running under gunicorn. Debug mode, template
+auto-reload and similar development conveniences are only enabled outside
+production, unless forced off with FLASK_DEBUG=0.
+"""
+
+import os
+
+def is_production():
+    """Whether we're serving real traffic (Render, gunicorn, or APP_ENV=production)"""
+    return (
+        bool(os.environ.get('RENDER'))
+        or os.environ.get('APP_ENV') == 'production'
+        or 'gunicorn' in os.environ.get('SERVER_SOFTWARE', '')
+    )
+
+def debug_enabled():
+    """Flask debug mode - never on in production"""
+    if is_production():
+        return False
+    return os.environ.get('FLASK_DEBUG', '1') != '0'
+
+DEBUG_MODE = debug_enabled()
+
+def reset_after_fork():
+    """
+    Reset per-process state inherited from a preloading parent
+
+    Database connections are opened per call (get_db_connection), so there is
+    no shared SQLite handle to reopen. Thread pools and background threads,
+    however, don't survive a fork and must be recreated lazily in the child.
+    """
+    from website.leaderboard.verification import reset_worker_pool
+    from website.leaderboard.widgets import invalidate_all_widgets
+    from website.pagecache import invalidate_pages
+    from website.leaderboard.leaderboard import invalidate_games_summary
+    from website.leaderboard import histograms, retention, plays
+
+    reset_worker_pool()
+    invalidate_all_widgets()
+    invalidate_pages()
+    invalidate_games_summary()
+    # Started again on first use in this process
+    histograms._refresher_pid = None
+    retention._compactor_pid = None
+    plays._flusher_pid = None
@@ -0,0 +1,283 @@
+"""
+Single-flight request coalescing
+
+When a burst of identical requests arrives together (everyone refreshing the
+leaderboard as a round ends), only the first one - the leader - runs the
+expensive computation. The others wait for it and get its result, so N
+concurrent identical requests cost one set of SQLite queries per worker.
+
+    Group.do(key, fn)     coalesce calls of fn sharing a key
+    @singleflight(group)  the same for a function, keyed on its arguments
+    @singleflight_view()  the same for a Flask GET view, keyed on the URL;
+                          each waiter gets its own copy of the leader's response
+
+Nothing is cached: once the leader finishes, the next call computes afresh.
+A call that joins a computation already in flight may therefore see data read
+a moment before it arrived.
+
+Across worker processes, set SINGLEFLIGHT_LOCK_DIR to a directory shared by
+the workers (and writable only by the app's user). Leaders of function groups
+then take a per-key lock file (POSIX only), and a leader that had to wait for
+another worker's lock reuses the result that worker just wrote instead of
+recomputing it. Results are exchanged as JSON, so they must be plain data
+(tuples come back as lists); lock and result files untouched for
+LOCK_FILE_MAX_AGE are swept. View groups coalesce within a worker only: their
+keys include arbitrary query strings.
+"""
+
+import base64
+import copy
+import hashlib
+import json
+import os
+import threading
+import time
+from functools import wraps
+
+from flask import current_app, make_response, request
+
+try:
+    import fcntl
+except ImportError:  # Windows - in-process coalescing only
+    fcntl = None
+
+SINGLEFLIGHT_LOCK_DIR = os.environ.get('SINGLEFLIGHT_LOCK_DIR') or None
+
+# How long a waiter waits for the leader (or a lock file) before computing itself
+WAIT_TIMEOUT = 30  # seconds
+LOCK_POLL_INTERVAL = 0.01  # seconds
+LOCK_FILE_MAX_AGE = 300  # seconds without use before a lock/result file is swept
+
+_last_sweep = {}  # lock_dir -> time of this process's last sweep
+_sweep_lock = threading.Lock()
+
+_groups = {}  # name -> Group, for the admin panel
+_groups_lock = threading.Lock()
+
+class _Call:
+    """One in-flight computation and the waiters sharing it"""
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+        self.waiters = 0
+
+class Group:
+    """Coalesces concurrent calls that share a key"""
+
+    def __init__(self, name, lock_dir=SINGLEFLIGHT_LOCK_DIR):
+        self.name = name
+        self.lock_dir = lock_dir if fcntl else None
+        self._calls = {}
+        self._lock = threading.Lock()
+        self._stats = {'calls': 0, 'executions': 0, 'collapsed': 0, 'cross_worker_reused': 0,
+                       'timeouts': 0, 'errors': 0}
+        with _groups_lock:
+            _groups[name] = self
+
+    def do(self, key, fn, copy_result=True):
+        """
+        Run fn() once for all concurrent callers with the same key
+
+        Args:
+            key: hashable identity of the computation
+            copy_result: give each waiter a deep copy, so callers can't see
+                         each other's mutations (pass False for immutable results)
+
+        Returns:
+            tuple: (result, shared) - shared is True for waiters
+        """
+        with self._lock:
+            self._stats['calls'] += 1
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                call.waiters += 1
+                self._stats['collapsed'] += 1
+
+        if not leader:
+            if not call.done.wait(WAIT_TIMEOUT):
+                with self._lock:
+                    self._stats['timeouts'] += 1
+                return fn(), False
+            if call.error is not None:
+                raise call.error
+            return (copy.deepcopy(call.result) if copy_result else call.result), True
+
+        result = None
+        try:
+            result = self._execute(key, fn)
+            return result, False
+        except Exception as e:
+            call.error = e
+            with self._lock:
+                self._stats['errors'] += 1
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]  # Later callers start a new computation
+                waiters = call.waiters
+            # Waiters copy from a snapshot, not the object the leader's caller may mutate
+            call.result = copy.deepcopy(result) if copy_result and waiters else result
+            call.done.set()
+
+    def _execute(self, key, fn):
+        if not self.lock_dir:
+            return self._run(fn)
+
+        _sweep_lock_dir(self.lock_dir)
+        digest = hashlib.sha1(repr(key).encode('utf-8')).hexdigest()[:20]
+        base = os.path.join(self.lock_dir, f"{self.name}-{digest}")
+        started = time.time()
+        with open(base + '.lock', 'a') as lock_file:
+            if not self._acquire(lock_file):
+                with self._lock:
+                    self._stats['timeouts'] += 1
+                return self._run(fn)
+            try:
+                os.utime(base + '.lock')  # In use - keep it from being swept
+                reused = self._load_fresh(base + '.result', started)
+                if reused is not None:
+                    with self._lock:
+                        self._stats['cross_worker_reused'] += 1
+                    return reused[0]
+                result = self._run(fn)
+                self._save(base + '.result', result)
+                return result
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _run(self, fn):
+        with self._lock:
+            self._stats['executions'] += 1
+        return fn()
+
+    @staticmethod
+    def _acquire(lock_file):
+        deadline = time.monotonic() + WAIT_TIMEOUT
+        while True:
+            try:
+                fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                return True
+            except BlockingIOError:
+                if time.monotonic() > deadline:
+                    return False
+                time.sleep(LOCK_POLL_INTERVAL)
+
+    @staticmethod
+    def _load_fresh(path, since):
+        """(result,) if another worker wrote one after we started waiting, else None"""
+        try:
+            if os.path.getmtime(path) < since:
+                return None
+            with open(path, 'r', encoding='utf-8') as f:
+                return (json.load(f, object_hook=_decode_bytes),)
+        except (OSError, ValueError):
+            return None
+
+    @staticmethod
+    def _save(path, result):
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            encoded = json.dumps(result, default=_encode_bytes)
+            with open(os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600),
+                      'w', encoding='utf-8') as f:
+                f.write(encoded)
+            os.replace(tmp_path, path)
+        except (OSError, TypeError, ValueError) as e:
+            print(f"Error saving single-flight result {path}: {e}")
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+    def stats(self):
+        with self._lock:
+            return dict(self._stats, inflight=len(self._calls), cross_worker=bool(self.lock_dir))
+
+def _encode_bytes(value):
+    if isinstance(value, bytes):
+        return {'__bytes__': base64.b64encode(value).decode('ascii')}
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+def _decode_bytes(obj):
+    if len(obj) == 1 and '__bytes__' in obj:
+        return base64.b64decode(obj['__bytes__'])
+    return obj
+
+def _sweep_lock_dir(lock_dir):
+    """Remove lock/result files unused for LOCK_FILE_MAX_AGE (at most once a minute per process)"""
+    now = time.time()
+    with _sweep_lock:
+        if now - _last_sweep.get(lock_dir, 0) < 60:
+            return
+        _last_sweep[lock_dir] = now
+    try:
+        for entry in os.scandir(lock_dir):
+            if entry.name.endswith(('.lock', '.result', '.tmp')) and \
+                    now - entry.stat().st_mtime > LOCK_FILE_MAX_AGE:
+                os.remove(entry.path)
+    except OSError as e:
+        print(f"Error sweeping single-flight lock dir {lock_dir}: {e}")
+
+def get_group(name, lock_dir=SINGLEFLIGHT_LOCK_DIR):
+    """The group registered under a name, created on first use"""
+    with _groups_lock:
+        group = _groups.get(name)
+    return group or Group(name, lock_dir=lock_dir)
+
+def singleflight(group):
+    """Coalesce concurrent calls of a function with equal arguments"""
+    if isinstance(group, str):
+        group = get_group(group)
+
+    def decorator(fn):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            key = (fn.__qualname__, args, tuple(sorted(kwargs.items())))
+            return group.do(key, lambda: fn(*args, **kwargs))[0]
+        return wrapper
+    return decorator
+
+def singleflight_view(group='views'):
+    """
+    Coalesce concurrent identical GET requests to a Flask view
+
+    Requests are identical when endpoint, view args and query string match.
+    Only for public responses: the leader's headers (but not the session
+    cookie, which is added later per request) are copied to every waiter.
+    Coalesced within this worker only (no lock files per query string).
+    """
+    if isinstance(group, str):
+        group = get_group(group, lock_dir=None)
+
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            if request.method != 'GET':
+                return view(*args, **kwargs)
+
+            def render():
+                response = make_response(view(*args, **kwargs))
+                if response.direct_passthrough or response.is_streamed:
+                    return response
+                # Plain data, so each waiter can rebuild its own response
+                return response.get_data(), response.status_code, list(response.headers.items())
+
+            key = (request.endpoint, tuple(sorted((request.view_args or {}).items())),
+                   tuple(sorted(request.args.items(multi=True))))
+            result, shared = group.do(key, render, copy_result=False)
+            if not isinstance(result, tuple):
+                return result if not shared else view(*args, **kwargs)
+            body, status, headers = result
+            return current_app.response_class(body, status=status, headers=headers)
+        return wrapper
+    return decorator
+
+def get_singleflight_stats():
+    """Per-group call/execution/collapsed counts for this worker"""
+    with _groups_lock:
+        groups = list(_groups.values())
+    return {group.name: group.stats() for group in groups}
@@ -1,10 +1,42 @@
 from flask import Blueprint, render_template, request, session, redirect, url_for, flash, jsonify
 from website.leaderboard.leaderboard import submit_score_higher_better
+from website.leaderboard.plays import record_request_play
+from website.leaderboard.verification import (
+    register_verifier, submit_run_for_verification, InvalidInputLog, VerificationStatus
+)
 
 space_invaders = Blueprint('space_invaders', __name__, template_folder='templates')
 
+# ===== RUN VERIFICATION =====
+# The game uses Math.random and wall-clock cooldowns, so runs cannot be replayed
+# exactly. Instead the run summary bounds the score the run could have reached.
+# The summary comes from the client, so passing the bound only makes a score
+# plausible - it is never recorded as verified.
+
+MAX_POINTS_PER_SHOT = 1000  # Dual shot hitting two nukes (500 each)
+BOSS_BONUS_PER_LEVEL = 500  # Boss kill bonus scales with level
+UPGRADE_BONUS = 5000        # One-off maximum power bonus
+
+@register_verifier("Space Invaders")
+def verify_space_invaders_run(claimed_score, run_log):
+    """Bound a Space Invaders score by the ceiling its run summary implies (not a replay)"""
+    frames = int(run_log.get('frames', 0))
+    shots = int(run_log.get('shots', 0))
+    level = max(1, int(run_log.get('level', 1)))
+    ceiling = shots * MAX_POINTS_PER_SHOT + BOSS_BONUS_PER_LEVEL * level * level + UPGRADE_BONUS
+
+    if claimed_score > ceiling:
+        status, reason = VerificationStatus.QUARANTINED, f'score exceeds ceiling of {ceiling} for {shots} shots'
+    elif shots > frames:
+        status, reason = VerificationStatus.FLAGGED, 'more shots than frames played'
+    else:
+        status, reason = VerificationStatus.PLAUSIBLE, 'within the run summary ceiling (not replayed)'
+
+    return {'status': status, 'simulated_score': ceiling, 'frames': frames, 'reason': reason}
+
 @space_invaders.route('/')
 def index():
+    record_request_play('Space Invaders')
     return render_template('space_invaders.html')
 
 @space_invaders.route('/test')
@@ -23,7 +55,16 @@ def submit_score():
         session['game_score'] = score
         session['game_name'] = 'Space Invaders'
         
-        result = submit_score_higher_better("Space Invaders", score, "points")
+        # Optional run summary - queue it for background verification
+        verification_id = None
+        if data.get('input_log'):
+            try:
+                verification_id = submit_run_for_verification(
+                    "Space Invaders", score, data['input_log'], session.get('session_id', 'unknown'))
+            except InvalidInputLog as e:
+                return jsonify({'success': False, 'error': str(e)})
+        
+        result = submit_score_higher_better("Space Invaders", score, "points", verification_id=verification_id)
         
         return jsonify({
             'success': True,
@@ -0,0 +1,100 @@
+"""
+Startup profiling and deferred initialization for the Flask app
+
+Set STARTUP_PROFILE=1 to print a per-step breakdown (blueprint imports,
+registration, deferred init hooks) when create_app() runs.
+
+Modules register one-off setup work with @deferred_init instead of doing it
+at import time. Hooks run once per process, before the first request, or
+eagerly via run_deferred_inits() - e.g. in a preloading gunicorn master, so
+forked workers inherit the finished state and do no setup of their own.
+"""
+
+import os
+import threading
+import time
+
+STARTUP_PROFILE = os.environ.get('STARTUP_PROFILE') == '1'
+
+# ===== STARTUP PROFILER =====
+
+class StartupProfiler:
+    """Collects wall-clock timings for named startup steps"""
+
+    def __init__(self, enabled=STARTUP_PROFILE):
+        self.enabled = enabled
+        self.steps = []  # (name, milliseconds)
+        self.started = time.perf_counter()
+
+    def step(self, name):
+        return _ProfiledStep(self, name)
+
+    def record(self, name, seconds):
+        self.steps.append((name, round(seconds * 1000, 2)))
+
+    def report(self):
+        """Breakdown as a dict for tooling, printed when profiling is enabled"""
+        total = round((time.perf_counter() - self.started) * 1000, 2)
+        summary = {'total_ms': total, 'steps': [{'name': n, 'ms': ms} for n, ms in self.steps]}
+        if self.enabled:
+            print(f"Startup profile (pid {os.getpid()}):")
+            for name, ms in sorted(self.steps, key=lambda s: -s[1]):
+                print(f"  {ms:9.2f} ms  {name}")
+            print(f"  {total:9.2f} ms  total")
+        return summary
+
+class _ProfiledStep:
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.profiler.record(self.name, time.perf_counter() - self.started)
+        return False
+
+profiler = StartupProfiler()
+
+# ===== DEFERRED INIT HOOKS =====
+
+_deferred_hooks = []  # (name, func) in registration order
+_deferred_done = set()
+_deferred_lock = threading.Lock()
+
+def deferred_init(name):
+    """Decorator registering a one-off setup function to run before the first request"""
+    def decorator(func):
+        _deferred_hooks.append((name, func))
+        return func
+    return decorator
+
+def run_deferred_inits():
+    """Run every pending hook once for this process (safe to call repeatedly)"""
+    if len(_deferred_done) == len(_deferred_hooks):
+        return
+    with _deferred_lock:
+        for name, func in _deferred_hooks:
+            if name in _deferred_done:
+                continue
+            with profiler.step(f'deferred: {name}'):
+                try:
+                    func()
+                except Exception as e:
+                    print(f"WARNING: Deferred init '{name}' failed: {e}")
+            _deferred_done.add(name)
+        if profiler.enabled:
+            profiler.report()
+
+def get_deferred_status():
+    """Which hooks have run in this process"""
+    return {name: name in _deferred_done for name, _ in _deferred_hooks}
+
+def install_deferred_init(app):
+    """Run pending hooks before the first request this process serves"""
+    @app.before_request
+    def _run_deferred_inits():
+        if len(_deferred_done) != len(_deferred_hooks):
+            run_deferred_inits()
@@ -0,0 +1,99 @@
+// Simple Navigation Manager
+document.addEventListener('DOMContentLoaded', function() {
+    const navLinksScroll = document.getElementById('navLinksScroll');
+    const fadeLeft = document.getElementById('fadeLeft');
+    const fadeRight = document.getElementById('fadeRight');
+    const dropdownBtn = document.getElementById('navDropdownBtn');
+    const dropdownMenu = document.getElementById('navDropdownMenu');
+    const searchInput = document.getElementById('navSearchInput');
+    const dropdownLinks = document.getElementById('navDropdownLinks');
+
+    // Update scroll indicators
+    function updateScrollIndicators() {
+        const scrollLeft = navLinksScroll.scrollLeft;
+        const scrollWidth = navLinksScroll.scrollWidth;
+        const clientWidth = navLinksScroll.clientWidth;
+        const maxScroll = scrollWidth - clientWidth;
+
+        fadeLeft.style.opacity = scrollLeft > 10 ? '1' : '0';
+        fadeRight.style.opacity = scrollLeft < maxScroll - 10 ? '1' : '0';
+    }
+
+    // Dropdown toggle
+    function toggleDropdown() {
+        const isOpen = dropdownMenu.classList.contains('active');
+
+        if (isOpen) {
+            dropdownMenu.classList.remove('active');
+            dropdownBtn.classList.remove('active');
+            dropdownBtn.setAttribute('aria-expanded', 'false');
+        } else {
+            dropdownMenu.classList.add('active');
+            dropdownBtn.classList.add('active');
+            dropdownBtn.setAttribute('aria-expanded', 'true');
+            setTimeout(() => searchInput.focus(), 100);
+        }
+    }
+
+    // Search functionality
+    function handleSearch() {
+        const searchTerm = searchInput.value.toLowerCase().trim();
+        const links = dropdownLinks.querySelectorAll('.nav-dropdown-link');
+        let visibleCount = 0;
+
+        links.forEach(link => {
+            const searchData = link.getAttribute('data-search') || '';
+            const linkText = link.textContent.toLowerCase();
+            const isMatch = searchData.includes(searchTerm) || linkText.includes(searchTerm);
+
+            link.style.display = isMatch ? 'block' : 'none';
+            if (isMatch) visibleCount++;
+        });
+
+        // Show no results message
+        let noResultsEl = document.getElementById('navNoResults');
+        if (visibleCount === 0 && searchTerm) {
+            if (!noResultsEl) {
+                noResultsEl = document.createElement('div');
+                noResultsEl.id = 'navNoResults';
+                noResultsEl.className = 'nav-no-results';
+                dropdownLinks.appendChild(noResultsEl);
+            }
+            noResultsEl.textContent = `No apps found for "${searchTerm}"`;
+            noResultsEl.style.display = 'block';
+        } else if (noResultsEl) {
+            noResultsEl.style.display = 'none';
+        }
+    }
+
+    // Event listeners
+    navLinksScroll.addEventListener('scroll', updateScrollIndicators);
+    window.addEventListener('resize', updateScrollIndicators);
+    dropdownBtn.addEventListener('click', (e) => {
+        e.stopPropagation();
+        toggleDropdown();
+    });
+
+    document.addEventListener('click', (e) => {
+        if (!dropdownMenu.contains(e.target) && !dropdownBtn.contains(e.target)) {
+            dropdownMenu.classList.remove('active');
+            dropdownBtn.classList.remove('active');
+            dropdownBtn.setAttribute('aria-expanded', 'false');
+        }
+    });
+
+    searchInput.addEventListener('input', handleSearch);
+    dropdownMenu.addEventListener('click', (e) => e.stopPropagation());
+
+    // Close dropdown on link click
+    dropdownLinks.querySelectorAll('.nav-dropdown-link').forEach(link => {
+        link.addEventListener('click', () => {
+            dropdownMenu.classList.remove('active');
+            dropdownBtn.classList.remove('active');
+            dropdownBtn.setAttribute('aria-expanded', 'false');
+        });
+    });
+
+    // Initialize
+    updateScrollIndicators();
+});
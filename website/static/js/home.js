@@ -0,0 +1,587 @@
+// ===== SIMPLIFIED VIRAL GAME HUB JAVASCRIPT - DIRECT NAVIGATION =====
+
+let searchTimeout;
+// Server-rendered state comes from window.HOME_CONFIG (set in home.html)
+let currentCategory = window.HOME_CONFIG.selectedCategory;
+let userStats = Object.assign({ playTime: 0 }, window.HOME_CONFIG.userStats);
+
+// Store games data
+window.currentGames = window.HOME_CONFIG.games;
+
+// Achievement definitions
+const ACHIEVEMENTS = {
+    'first_game': { title: 'First Steps', description: 'Played your first game!', icon: '🎮' },
+    'explorer': { title: 'Space Explorer', description: 'Tried 5 different games', icon: '🚀' },
+    'category_master': { title: 'Category Master', description: 'Played games from 3+ categories', icon: '🌟' },
+    'daily_player': { title: 'Daily Pilot', description: 'Played the daily game', icon: '⭐' },
+    'random_adventurer': { title: 'Quantum Jumper', description: 'Used random game 3 times', icon: '🎲' },
+    'streak_warrior': { title: 'Streak Master', description: 'Maintained a 7-day streak', icon: '🔥' }
+};
+
+// Daily games rotation - only existing games
+const DAILY_GAMES = [
+    'Time Predict Challenge', 'Cosmic Dino Runner'
+];
+
+// ===== INITIALIZATION =====
+document.addEventListener('DOMContentLoaded', function() {
+    initializeCosmicHub();
+    createParticleField();
+    setupAdvancedSearch();
+    setupKeyboardShortcuts();
+    initializeDailyGame();
+    loadUserProgress();
+
+    console.log('🚀 Cosmic Game Hub initialized successfully!');
+});
+
+function initializeCosmicHub() {
+    // Update user interface elements
+    updateUserStats();
+
+    // Check for daily login bonus
+    checkDailyBonus();
+}
+
+function createParticleField() {
+    const particleLayer = document.getElementById('particleLayer');
+
+    // Create floating particles
+    for (let i = 0; i < 20; i++) {
+        const particle = document.createElement('div');
+        particle.className = 'particle';
+        particle.style.left = Math.random() * 100 + '%';
+        particle.style.animationDelay = Math.random() * 15 + 's';
+        particle.style.animationDuration = (15 + Math.random() * 10) + 's';
+        particleLayer.appendChild(particle);
+    }
+}
+
+// ===== ADVANCED SEARCH SYSTEM =====
+function setupAdvancedSearch() {
+    const searchInput = document.getElementById('searchInput');
+    const dropdown = document.getElementById('autocompleteDropdown');
+
+    searchInput.addEventListener('input', function() {
+        clearTimeout(searchTimeout);
+        const query = this.value.trim();
+
+        if (query.length >= 2) {
+            searchTimeout = setTimeout(() => {
+                showAutocomplete(query);
+                performSearch(query);
+            }, 300);
+        } else {
+            hideAutocomplete();
+            if (query.length === 0) {
+                performSearch('');
+            }
+        }
+    });
+
+    searchInput.addEventListener('keydown', function(e) {
+        if (e.key === 'Escape') {
+            hideAutocomplete();
+            this.blur();
+        }
+    });
+
+    // Click outside to close
+    document.addEventListener('click', function(e) {
+        if (!searchInput.contains(e.target) && !dropdown.contains(e.target)) {
+            hideAutocomplete();
+        }
+    });
+}
+
+function showAutocomplete(query) {
+    const dropdown = document.getElementById('autocompleteDropdown');
+    const suggestions = generateSuggestions(query);
+
+    if (suggestions.length === 0) {
+        hideAutocomplete();
+        return;
+    }
+
+    dropdown.innerHTML = suggestions.map(suggestion => `
+        <div class="autocomplete-item" onclick="selectSuggestion('${suggestion.text}')">
+            <span style="font-size: 1.2rem;">${suggestion.icon}</span>
+            <div>
+                <div style="font-weight: 600;">${suggestion.text}</div>
+                <div style="font-size: 0.8rem; opacity: 0.7;">${suggestion.type}</div>
+            </div>
+        </div>
+    `).join('');
+
+    dropdown.classList.add('active');
+}
+
+function generateSuggestions(query) {
+    const suggestions = [];
+    const lowerQuery = query.toLowerCase();
+
+    // Game name suggestions
+    window.currentGames.forEach(game => {
+        if (game.name.toLowerCase().includes(lowerQuery)) {
+            suggestions.push({
+                text: game.name,
+                type: 'Game',
+                icon: game.icon
+            });
+        }
+    });
+
+    // Category suggestions
+    const categories = ['arcade', 'puzzle', 'skill', 'strategy', 'word', 'action'];
+    categories.forEach(category => {
+        if (category.includes(lowerQuery)) {
+            suggestions.push({
+                text: category,
+                type: 'Category',
+                icon: '📁'
+            });
+        }
+    });
+
+    return suggestions.slice(0, 6);
+}
+
+function selectSuggestion(text) {
+    document.getElementById('searchInput').value = text;
+    hideAutocomplete();
+    performSearch(text);
+}
+
+function hideAutocomplete() {
+    document.getElementById('autocompleteDropdown').classList.remove('active');
+}
+
+// ===== ENHANCED SEARCH AND FILTERING =====
+async function performSearch(query) {
+    const filteredGames = filterGames(query, currentCategory);
+    displayGames(filteredGames);
+}
+
+function filterGames(query, category) {
+    let filtered = window.currentGames;
+
+    // Filter by category
+    if (category) {
+        filtered = filtered.filter(game => game.category === category);
+    }
+
+    // Filter by search query
+    if (query) {
+        const lowerQuery = query.toLowerCase();
+        filtered = filtered.filter(game => 
+            game.name.toLowerCase().includes(lowerQuery) ||
+            game.description.toLowerCase().includes(lowerQuery) ||
+            game.category.toLowerCase().includes(lowerQuery) ||
+            (game.tags && game.tags.some(tag => tag.toLowerCase().includes(lowerQuery)))
+        );
+    }
+
+    return filtered;
+}
+
+function filterByCategory(category) {
+    currentCategory = category;
+
+    // Update button states
+    document.querySelectorAll('.category-chip').forEach(chip => {
+        chip.classList.remove('active');
+    });
+    event.target.classList.add('active');
+
+    const query = document.getElementById('searchInput').value;
+    performSearch(query);
+
+    // Update URL
+    const url = new URL(window.location);
+    if (category) {
+        url.searchParams.set('category', category);
+    } else {
+        url.searchParams.delete('category');
+    }
+    window.history.pushState({}, '', url);
+}
+
+function displayGames(games) {
+    const grid = document.getElementById('gamesGrid');
+
+    if (!games || games.length === 0) {
+        showNoResults();
+        return;
+    }
+
+    const html = games.map((game, index) => {
+        // Generate proper Flask URL based on endpoint
+        let gameUrl = '';
+        if (game.endpoint === 'time_predict.index') {
+            gameUrl = '/timepredict';
+        } else if (game.endpoint === 'react_time.index') {
+            gameUrl = '/reacttime';
+        } else if (game.endpoint === 'dino_runner.index') {
+            gameUrl = '/dino-runner';
+        } else if (game.endpoint === 'space_invaders.index') {
+            gameUrl = '/spaceinvaders';
+        } else {
+            gameUrl = '#'; // fallback for unknown endpoints
+        }
+
+        return `
+        <a href="${gameUrl}" 
+           class="game-card${game.leaderboard && game.leaderboard.length > 0 ? ' has-leaderboard' : ''}" 
+           data-game-index="${index}" 
+           data-category="${game.category}"
+           onclick="trackGameLaunch('${game.name}')">
+
+            <div class="game-category">${game.category}</div>
+
+            <div class="game-header">
+                <div class="game-icon">${game.icon}</div>
+                <h3 class="game-title">${game.name}</h3>
+            </div>
+
+            <p class="game-description">${game.description}</p>
+
+            ${game.leaderboard && game.leaderboard.length > 0 ? `
+            <div class="game-leaderboard">
+                <div class="leaderboard-title">🏆 Top Players</div>
+                ${game.leaderboard.map((entry, index) => `
+                    <div class="leaderboard-entry">
+                        <span class="leaderboard-rank">#${index + 1}</span>
+                        <span class="leaderboard-name">${entry.username}</span>
+                        <span class="leaderboard-score">${entry.score.toLocaleString()}</span>
+                    </div>
+                `).join('')}
+            </div>
+            ` : ''}
+
+            <div class="game-footer">
+                <div class="play-indicator">
+                    <span class="play-icon">▶</span>
+                    <span>Ready to Play</span>
+                </div>
+                <div class="difficulty-indicator">
+                    ${generateDifficultyDots(game.difficulty || 2)}
+                </div>
+            </div>
+        </a>
+        `;
+    }).join('');
+
+    grid.innerHTML = html;
+
+    // Store current filtered games
+    window.currentFilteredGames = games;
+}
+
+function generateDifficultyDots(difficulty) {
+    let dots = '';
+    for (let i = 1; i <= 5; i++) {
+        dots += `<div class="difficulty-dot ${i <= difficulty ? 'active' : ''}"></div>`;
+    }
+    return dots;
+}
+
+function showNoResults() {
+    const grid = document.getElementById('gamesGrid');
+    grid.innerHTML = `
+        <div style="grid-column: 1 / -1; text-align: center; padding: 4rem; color: rgba(255,255,255,0.6);">
+            <div style="font-size: 4rem; margin-bottom: 1rem;">🌌</div>
+            <h3 style="color: var(--primary-neon); margin-bottom: 1rem;">No Games Found</h3>
+            <p>Try adjusting your search or filter criteria.</p>
+            <button class="discovery-btn" onclick="clearFilters()">Reset Filters</button>
+        </div>
+    `;
+}
+
+// ===== VIRAL DISCOVERY FEATURES =====
+function playRandomGame() {
+    const button = document.getElementById('randomBtn');
+    const originalText = button.textContent;
+
+    button.textContent = 'Scanning...';
+    button.disabled = true;
+
+    setTimeout(() => {
+        const games = window.currentFilteredGames || window.currentGames;
+        if (games.length === 0) {
+            alert('No games available!');
+            return;
+        }
+
+        const randomIndex = Math.floor(Math.random() * games.length);
+        const randomGame = games[randomIndex];
+
+        // Navigate directly to the random game
+        let gameUrl = '';
+        if (randomGame.endpoint === 'time_predict.index') {
+            gameUrl = '/timepredict';
+        } else if (randomGame.endpoint === 'react_time.index') {
+            gameUrl = '/reacttime';
+        } else if (randomGame.endpoint === 'dino_runner.index') {
+            gameUrl = '/dino-runner';
+        } else if (randomGame.endpoint === 'space_invaders.index') {
+            gameUrl = '/spaceinvaders';
+        } else {
+            gameUrl = '/'; // fallback to home
+        }
+        window.location.href = gameUrl;
+
+        trackRandomGameUsage();
+
+        button.textContent = originalText;
+        button.disabled = false;
+    }, 1500);
+}
+
+function initializeDailyGame() {
+    const today = new Date();
+    const dayOfYear = Math.floor((today - new Date(today.getFullYear(), 0, 0)) / 1000 / 60 / 60 / 24);
+    const dailyIndex = dayOfYear % DAILY_GAMES.length;
+    const dailyGame = DAILY_GAMES[dailyIndex];
+
+    const descElement = document.getElementById('dailyGameDesc');
+    if (descElement) {
+        descElement.textContent = `Today's mission: ${dailyGame}`;
+    }
+
+    window.currentDailyGame = dailyGame;
+}
+
+function playDailyGame() {
+    const game = window.currentGames.find(g => g.name === window.currentDailyGame);
+    if (game) {
+        // Navigate directly to daily game
+        let gameUrl = '';
+        if (game.endpoint === 'time_predict.index') {
+            gameUrl = '/timepredict';
+        } else if (game.endpoint === 'react_time.index') {
+            gameUrl = '/reacttime';
+        } else if (game.endpoint === 'dino_runner.index') {
+            gameUrl = '/dino-runner';
+        } else if (game.endpoint === 'space_invaders.index') {
+            gameUrl = '/spaceinvaders';
+        } else {
+            gameUrl = '/'; // fallback to home
+        }
+        window.location.href = gameUrl;
+
+        // Track daily game achievement
+        unlockAchievement('daily_player');
+    }
+}
+
+function showAchievements() {
+    const unlockedCount = getUserProgress().achievements.length;
+    const totalCount = Object.keys(ACHIEVEMENTS).length;
+
+    alert(`🏆 Achievements: ${unlockedCount}/${totalCount} unlocked!\n\nKeep playing to unlock more cosmic achievements!`);
+}
+
+function showLeaderboards() {
+    window.open('/leaderboard', '_blank');
+}
+
+// ===== USER PROGRESS AND ACHIEVEMENTS =====
+function loadUserProgress() {
+    const saved = localStorage.getItem('summerlockin_progress');
+    if (saved) {
+        const progress = JSON.parse(saved);
+        userStats = { ...userStats, ...progress };
+        updateUserStats();
+    }
+}
+
+function getUserProgress() {
+    const saved = localStorage.getItem('summerlockin_progress');
+    return saved ? JSON.parse(saved) : {
+        gamesPlayed: new Set(),
+        achievements: [],
+        categoriesPlayed: new Set(),
+        randomGameUses: 0,
+        lastLogin: null,
+        streak: 1
+    };
+}
+
+function updateUserProgress(data) {
+    const progress = getUserProgress();
+    Object.assign(progress, data);
+    localStorage.setItem('summerlockin_progress', JSON.stringify(progress));
+    return progress;
+}
+
+function trackGameLaunch(gameName) {
+    const progress = getUserProgress();
+    progress.gamesPlayed.add(gameName);
+
+    // Find game category
+    const game = window.currentGames.find(g => g.name === gameName);
+    if (game) {
+        progress.categoriesPlayed.add(game.category);
+    }
+
+    updateUserProgress(progress);
+
+    // Check achievements
+    if (progress.gamesPlayed.size === 1) {
+        unlockAchievement('first_game');
+    } else if (progress.gamesPlayed.size >= 5) {
+        unlockAchievement('explorer');
+    }
+
+    if (progress.categoriesPlayed.size >= 3) {
+        unlockAchievement('category_master');
+    }
+
+    updateUserStats();
+    trackEvent('game_launched', { game: gameName });
+}
+
+function trackRandomGameUsage() {
+    const progress = getUserProgress();
+    progress.randomGameUses = (progress.randomGameUses || 0) + 1;
+    updateUserProgress(progress);
+
+    if (progress.randomGameUses >= 3) {
+        unlockAchievement('random_adventurer');
+    }
+
+    trackEvent('random_game_used');
+}
+
+function unlockAchievement(achievementId) {
+    const progress = getUserProgress();
+
+    if (!progress.achievements.includes(achievementId)) {
+        progress.achievements.push(achievementId);
+        updateUserProgress(progress);
+
+        // Show achievement notification
+        showAchievementNotification(achievementId);
+        updateUserStats();
+
+        trackEvent('achievement_unlocked', { achievement: achievementId });
+    }
+}
+
+function showAchievementNotification(achievementId) {
+    const achievement = ACHIEVEMENTS[achievementId];
+    if (!achievement) return;
+
+    const notification = document.getElementById('achievementNotification');
+    const titleEl = document.getElementById('achievementTitle');
+    const descEl = document.getElementById('achievementDescription');
+    const iconEl = notification.querySelector('.achievement-icon');
+
+    titleEl.textContent = achievement.title;
+    descEl.textContent = achievement.description;
+    iconEl.textContent = achievement.icon;
+
+    notification.classList.add('show');
+
+    setTimeout(() => {
+        notification.classList.remove('show');
+    }, 4000);
+}
+
+function updateUserStats() {
+    const progress = getUserProgress();
+
+    document.getElementById('gamesPlayed').textContent = progress.gamesPlayed ? progress.gamesPlayed.size : 0;
+    document.getElementById('achievementsUnlocked').textContent = progress.achievements ? progress.achievements.length : 0;
+    document.getElementById('streakCount').textContent = progress.streak || 1;
+}
+
+function checkDailyBonus() {
+    const progress = getUserProgress();
+    const today = new Date().toDateString();
+
+    if (progress.lastLogin !== today) {
+        progress.lastLogin = today;
+
+        // Increment streak or reset
+        const yesterday = new Date();
+        yesterday.setDate(yesterday.getDate() - 1);
+
+        if (progress.lastLogin === yesterday.toDateString()) {
+            progress.streak = (progress.streak || 1) + 1;
+        } else {
+            progress.streak = 1;
+        }
+
+        updateUserProgress(progress);
+
+        // Check streak achievements
+        if (progress.streak >= 7) {
+            unlockAchievement('streak_warrior');
+        }
+
+        updateUserStats();
+    }
+}
+
+// ===== UTILITY FUNCTIONS =====
+function clearFilters() {
+    document.getElementById('searchInput').value = '';
+    currentCategory = '';
+
+    document.querySelectorAll('.category-chip').forEach(chip => {
+        chip.classList.remove('active');
+    });
+    document.querySelector('.category-chip').classList.add('active');
+
+    performSearch('');
+    hideAutocomplete();
+
+    const url = new URL(window.location);
+    url.searchParams.delete('search');
+    url.searchParams.delete('category');
+    window.history.pushState({}, '', url);
+}
+
+function setupKeyboardShortcuts() {
+    document.addEventListener('keydown', function(e) {
+        // Escape - clear search
+        if (e.key === 'Escape') {
+            clearFilters();
+        }
+
+        // Ctrl/Cmd + K - focus search
+        if ((e.ctrlKey || e.metaKey) && e.key === 'k') {
+            e.preventDefault();
+            document.getElementById('searchInput').focus();
+        }
+
+        // R - random game
+        if (e.key === 'r' && !e.target.matches('input, textarea')) {
+            e.preventDefault();
+            playRandomGame();
+        }
+
+        // D - daily game
+        if (e.key === 'd' && !e.target.matches('input, textarea')) {
+            e.preventDefault();
+            playDailyGame();
+        }
+    });
+}
+
+function trackEvent(eventName, data = {}) {
+    console.log(`📊 Event: ${eventName}`, data);
+    // In production: send to analytics
+}
+
+// Export global functions
+window.filterByCategory = filterByCategory;
+window.clearFilters = clearFilters;
+window.playRandomGame = playRandomGame;
+window.playDailyGame = playDailyGame;
+window.showAchievements = showAchievements;
+window.showLeaderboards = showLeaderboards;
+window.trackGameLaunch = trackGameLaunch;
+
+console.log('🌌 Cosmic Game Hub fully loaded and operational with direct navigation!');
@@ -0,0 +1,72 @@
+"""
+Fragment cache for the gaming hub's card HTML
+
+Game cards are keyed by (game, card options hash, stats version), where the
+stats version is the tuple of numbers a card displays (likes, plays, rating,
+featured). A card is rebuilt only when one of those changes or it falls out
+of the LRU; category rows cache the joined HTML of their cards the same way.
+
+Card HTML is identical for every visitor: liked/favorited state is rendered
+as data-liked="false"/data-favorited="false" and applied client-side by the
+hub's gameState sync, so cached fragments are safe to share across users.
+"""
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+
+FRAGMENT_CACHE_SIZE = 512
+
+_fragment_cache = OrderedDict()  # key -> html, least recently used first
+_cache_lock = threading.Lock()
+_cache_stats = {'hits': 0, 'misses': 0, 'evictions': 0, 'invalidations': 0}
+
+def options_key(options):
+    """Stable short hash of a card options dict"""
+    encoded = json.dumps(options or {}, sort_keys=True, default=str)
+    return hashlib.md5(encoded.encode('utf-8')).hexdigest()[:12]
+
+def stats_version(game):
+    """The card-visible stats; a change to any of them is a new version"""
+    return (game.get('likes'), game.get('plays'), game.get('rating'), bool(game.get('featured')))
+
+def card_key(game, options):
+    return ('card', game['name'], options_key(options), stats_version(game))
+
+def get_fragment(key, render):
+    """Cached HTML for key, calling render() to build it on a miss"""
+    with _cache_lock:
+        html = _fragment_cache.get(key)
+        if html is not None:
+            _fragment_cache.move_to_end(key)
+            _cache_stats['hits'] += 1
+            return html
+        _cache_stats['misses'] += 1
+
+    # Rendered outside the lock; a concurrent miss just renders the same HTML twice
+    html = render()
+    with _cache_lock:
+        _fragment_cache[key] = html
+        _fragment_cache.move_to_end(key)
+        while len(_fragment_cache) > FRAGMENT_CACHE_SIZE:
+            _fragment_cache.popitem(last=False)
+            _cache_stats['evictions'] += 1
+    return html
+
+def invalidate_fragments(game_name=None):
+    """Drop cached fragments for one game (or all); rows containing it go too"""
+    with _cache_lock:
+        if game_name is None:
+            _fragment_cache.clear()
+        else:
+            for key in [k for k in _fragment_cache
+                        if (k[0] == 'card' and k[1] == game_name)
+                        or (k[0] == 'row' and any(card[1] == game_name for card in k[1]))]:
+                del _fragment_cache[key]
+        _cache_stats['invalidations'] += 1
+
+def get_fragment_cache_stats():
+    """Cache statistics for the admin panel"""
+    with _cache_lock:
+        return dict(_cache_stats, entries=len(_fragment_cache), capacity=FRAGMENT_CACHE_SIZE)
@@ -11,14 +11,18 @@ Features:
 """
 
 from flask import Blueprint, render_template, jsonify, request, session, make_response
+from markupsafe import Markup, escape
 import datetime
 import json
-from collections import defaultdict
 import urllib.parse
 from website.leaderboard.leaderboard import (
     get_user_identifier, toggle_like, toggle_favorite, 
     get_user_likes, get_user_favorites, get_game_stats
 )
+from website.leaderboard.plays import get_play_count, get_recently_played as get_recently_played_games
+from website.test_home.fragments import get_fragment, card_key
+from website.pagecache import cached_page, invalidate_pages
+from website.singleflight import singleflight_view
 
 class GameCard:
     """Reusable game card component class"""
@@ -37,15 +41,25 @@ class GameCard:
         }
     
     def render_html(self):
-        """Generate HTML string for the card"""
+        """
+        Generate HTML string for the card
+        
+        Served from the fragment cache, keyed by game, card options and the
+        stats the card shows. The markup must stay user-neutral: liked and
+        favorited state is applied client-side by gameState.
+        """
+        return get_fragment(card_key(self.game_data, self.card_options), self._build_html)
+    
+    def _build_html(self):
         css_classes = ['game-card'] + self.card_options.get('css_classes', [])
+        name = escape(self.game_data['name'])
         
         # Build card meta content
         meta_items = []
         if self.card_options.get('show_likes', True):
             meta_items.append(f'''
                 <span class="card-likes-container">
-                    <button class="btn-like" aria-label="Like this game" data-liked="false" data-game-name="{self.game_data['name']}">
+                    <button class="btn-like" aria-label="Like this game" data-liked="false" data-game-name="{name}">
                         <span class="thumb-outline">👍</span>
                         <span class="thumb-filled">👍</span>
                     </button>
@@ -79,7 +93,7 @@ class GameCard:
                             {meta_html}
                         </div>
                     </div>
-                    <button class="btn-favorite" aria-label="Add to favorites" data-favorited="false" data-game-name="{self.game_data['name']}">
+                    <button class="btn-favorite" aria-label="Add to favorites" data-favorited="false" data-game-name="{name}">
                         <span class="heart-outline">♡</span>
                         <span class="heart-filled">♥</span>
                     </button>
@@ -88,14 +102,14 @@ class GameCard:
         
         return f'''
             <article class="{' '.join(css_classes)}" 
-                     data-category="{self.game_data['category']}" 
+                     data-category="{escape(self.game_data['category'])}" 
                      data-featured="{str(self.game_data.get('featured', False)).lower()}" 
-                     data-game-name="{self.game_data['name']}" 
-                     data-game-description="{self.game_data.get('description', '')}" 
-                     data-game-endpoint="{self.game_data.get('endpoint', '')}">
+                     data-game-name="{name}" 
+                     data-game-description="{escape(self.game_data.get('description', ''))}" 
+                     data-game-endpoint="{escape(self.game_data.get('endpoint') or '')}">
                 <div class="card-thumbnail">
-                    <div class="thumbnail-placeholder" data-game-title="{self.game_data['name']}">
-                        <span class="thumbnail-title">{self.game_data['name']}</span>
+                    <div class="thumbnail-placeholder" data-game-title="{name}">
+                        <span class="thumbnail-title">{name}</span>
                     </div>
                     {featured_badge}
                 </div>
@@ -116,12 +130,22 @@ class CategoryRow:
         }
     
     def filter_games(self, games_list):
-        """Apply the category filter to get relevant games"""
+        """
+        Apply the category filter to get relevant games
+        
+        Facet filters resolve to names through HUB_CATALOG's postings; games_list
+        may be any subset or ordering of the catalog (search results, favorites)
+        and keeps its order.
+        """
         if callable(self.category_filter):
             return self.category_filter(games_list)
         elif isinstance(self.category_filter, str):
-            return [g for g in games_list if g.get('category', '').lower() == self.category_filter.lower()]
-        return games_list
+            names = HUB_CATALOG.names(category=self.category_filter)
+        elif isinstance(self.category_filter, dict):
+            names = HUB_CATALOG.names(**self.category_filter)
+        else:
+            return games_list
+        return [game for game in games_list if game['name'] in names]
     
     def get_template_context(self, games_list):
         """Get template context for rendering this category row"""
@@ -133,7 +157,8 @@ class CategoryRow:
             'category_name': self.category_name,
             'games': filtered_games,
             'count': len(filtered_games),
-            'options': self.display_options
+            'options': self.display_options,
+            'cards_html': render_game_cards(filtered_games, ROW_CARD_OPTIONS)
         }
 
 # Create blueprint with template folder
@@ -143,16 +168,24 @@ test_home = Blueprint('test_home', __name__,
                      static_url_path='/test_home/static')
 
 # Import real games data from home blueprint
-from website.home.home import GAMES_DATA as REAL_GAMES_DATA
+from website.home.home import GAMES_DATA as REAL_GAMES_DATA, SEARCH_INDEX
+from website.home.catalog import Catalog
+
+def is_game_featured(game_name):
+    """Determine if game is featured"""
+    featured_games = ['Cosmic Dino Runner', 'Space Invaders']
+    return game_name in featured_games
+
+# The hub's catalog: every game except the test layout itself, plus a featured facet
+HUB_CATALOG = Catalog(
+    [game for game in REAL_GAMES_DATA if game['name'] != 'Test Layout'],
+    facets={'featured': lambda game: [is_game_featured(game['name'])]}
+)
 
 def get_real_games_data():
     """Convert real games data to test_home format with cookie-based play counts"""
     games = []
-    for game in REAL_GAMES_DATA:
-        # Skip the test layout game from the gaming hub
-        if game['name'] == 'Test Layout':
-            continue
-            
+    for game in HUB_CATALOG.games:
         games.append({
             'name': game['name'],
             'description': game['description'],
@@ -197,14 +230,8 @@ def get_game_likes(game_name):
         return default_likes.get(game_name, 45)
 
 def get_game_play_count(game_name):
-    """Get game play count (mock for now, could be from database later)"""
-    plays = {
-        'Time Predict Challenge': 8932,
-        'React Time Challenge': 15678,
-        'Cosmic Dino Runner': 12543,
-        'Space Invaders': 23451
-    }
-    return plays.get(game_name, 5000)
+    """Get game play count (buffered counter fed by the games' start endpoints)"""
+    return get_play_count(game_name)
 
 def get_game_rating(game_name):
     """Get game rating (mock for now, could be from database later)"""
@@ -216,11 +243,6 @@ def get_game_rating(game_name):
     }
     return ratings.get(game_name, 4.0)
 
-def is_game_featured(game_name):
-    """Determine if game is featured"""
-    featured_games = ['Cosmic Dino Runner', 'Space Invaders']
-    return game_name in featured_games
-
 # User interaction management functions
 def get_user_likes_test():
     """Get user's liked games from database"""
@@ -241,25 +263,37 @@ def get_user_favorites_test():
         return []
 
 def get_recently_played():
-    """Get recently played games - placeholder for future database implementation"""
-    # TODO: Implement database-backed recently played tracking
-    return []
+    """Get the current user's recently played games from play events"""
+    try:
+        user_id = get_user_identifier(request)
+        return get_recently_played_games(user_id)
+    except Exception as e:
+        print(f"Error getting recently played: {e}")
+        return []
 
-def add_to_recently_played(game_name):
-    """Add game to recently played list - placeholder for future database implementation"""
-    # TODO: Implement database-backed recently played tracking
-    return []
+# Hub views that list the visitor's own games - rendered per user, never page-cached
+PERSONAL_CATEGORIES = ('Favorited', 'Liked', 'Recently Played')
 
-def get_navigation_sections():
-    """Get navigation sections with real counts"""
-    games_data = get_real_games_data()
-    favorites = get_user_favorites_test()
-    likes = get_user_likes_test()
-    recent_games = get_recently_played()
-    featured_count = len([g for g in games_data if g['featured']])
+def is_personal_view():
+    return request.args.get('category') in PERSONAL_CATEGORIES
+
+def get_navigation_sections(include_user_counts=True):
+    """
+    Get navigation sections with real counts
+    
+    Without include_user_counts the per-user sections show 0 so the page can
+    be shared between visitors; the hub fills them in from /api/user/state.
+    """
+    if include_user_counts:
+        favorites = get_user_favorites_test()
+        likes = get_user_likes_test()
+        recent_games = get_recently_played()
+    else:
+        favorites = likes = recent_games = []
+    featured_count = HUB_CATALOG.counts('featured').get(True, 0)
     
     return [
-        {'name': 'Home', 'icon': '🏠', 'count': len(games_data)},
+        {'name': 'Home', 'icon': '🏠', 'count': len(HUB_CATALOG.games)},
         {'name': 'Featured', 'icon': '⭐', 'count': featured_count},
         {'name': 'Favorited', 'icon': '❤️', 'count': len(favorites)},
         {'name': 'Liked', 'icon': '👍', 'count': len(likes)},
@@ -268,8 +302,7 @@ def get_navigation_sections():
 
 def get_game_categories():
     """Get game categories with real counts"""
-    games_data = get_real_games_data()
-    category_counts = defaultdict(int)
+    category_counts = HUB_CATALOG.counts('category')
     category_icons = {
         'arcade': '🕹️',
         'skill': '🎯',
@@ -279,9 +312,6 @@ def get_game_categories():
         'development': '🧪'
     }
     
-    for game in games_data:
-        category_counts[game['category']] += 1
-    
     categories = []
     for category, count in category_counts.items():
         categories.append({
@@ -293,37 +323,44 @@ def get_game_categories():
     return sorted(categories, key=lambda x: x['count'], reverse=True)
 
 # Helper functions for GameCard class
+
+# Cards in the hub's rows and grid: likes and plays, featured badge, no rating/category
+ROW_CARD_OPTIONS = {
+    'show_likes': True,
+    'show_plays': True,
+    'show_rating': False,
+    'show_featured_badge': True,
+    'show_category': False,
+    'show_overlay': True,
+    'css_classes': []
+}
+
 def create_game_card(game_data, card_options=None):
     """Factory function to create a GameCard instance"""
     return GameCard(game_data, card_options)
 
 def render_game_cards(games_list, card_options=None):
-    """Render multiple game cards as HTML"""
-    cards_html = []
-    for game in games_list:
-        card = GameCard(game, card_options)
-        cards_html.append(card.render_html())
-    return '\n'.join(cards_html)
+    """Render multiple game cards as HTML (the joined row is cached as one fragment)"""
+    keys = tuple(card_key(game, card_options or {}) for game in games_list)
+    html = get_fragment(('row', keys), lambda: '\n'.join(
+        GameCard(game, card_options).render_html() for game in games_list))
+    return Markup(html)
 
 def get_home_category_rows():
     """Get category rows based on real game data"""
-    games_data = get_real_games_data()
-    category_counts = defaultdict(int)
-    
-    for game in games_data:
-        category_counts[game['category']] += 1
+    category_counts = HUB_CATALOG.counts('category')
     
     rows = []
     
     # Only create rows for categories that have games
-    if category_counts['arcade'] > 0:
+    if category_counts.get('arcade', 0) > 0:
         rows.append(CategoryRow(
             category_name="Arcade Games",
             category_filter="arcade",
             display_options={'layout': 'horizontal', 'max_items': 8, 'card_size': 'standard'}
         ))
     
-    if category_counts['skill'] > 0:
+    if category_counts.get('skill', 0) > 0:
         rows.append(CategoryRow(
             category_name="Skill Challenges", 
             category_filter="skill",
@@ -333,16 +370,20 @@ def get_home_category_rows():
     # Add featured games row
     rows.insert(0, CategoryRow(
         category_name="Featured Games",
-        category_filter=lambda games: [g for g in games if g.get('featured', False)],
+        category_filter={'featured': True},
         display_options={'layout': 'horizontal', 'max_items': 10, 'card_size': 'standard'}
     ))
     
     return rows
 
 @test_home.route('/')
+@cached_page(vary_args=('category', 'search'), unless=is_personal_view)
 def index():
     """
     Main test layout route - displays YouTube-inspired gaming hub with category row system
+    
+    Page-cached for anonymous views (see pagecache.py): nothing user-specific
+    is rendered unless the category is one of PERSONAL_CATEGORIES.
     """
     # Get optional parameters from URL
     selected_category = request.args.get('category', 'Home')
@@ -365,11 +406,12 @@ def index():
     
     # Handle initial server-side filtering only for first load
     if search_query:
-        games = [g for g in games if search_query.lower() in g['name'].lower() or 
-                                   search_query.lower() in g['description'].lower()]
+        games_by_name = {g['name']: g for g in games}
+        games = [games_by_name[name] for name in SEARCH_INDEX.search_names(search_query)
+                 if name in games_by_name]
     elif selected_category and selected_category != 'Home':
         if selected_category == 'Featured':
-            games = [g for g in games if g.get('featured', False)]
+            games = [games_data[i] for i in HUB_CATALOG.ids(featured=True)]
         elif selected_category == 'Favorited':
             favorites = get_user_favorites_test()
             games = [g for g in games if g['name'] in favorites]
@@ -380,48 +422,65 @@ def index():
             recent = get_recently_played()
             games = [g for g in games if g['name'] in recent]
         elif selected_category in ['Arcade', 'Skill']:
-            games = [g for g in games if g['category'].lower() == selected_category.lower()]
+            games = [games_data[i] for i in HUB_CATALOG.ids(category=selected_category)]
     
     # Get featured/hero game
-    featured_games = [g for g in games_data if g.get('featured', False)]
-    hero_game = featured_games[0] if featured_games else games_data[0] if games_data else None
+    featured_ids = HUB_CATALOG.ids(featured=True)
+    hero_game = games_data[featured_ids[0]] if featured_ids else games_data[0] if games_data else None
     
     return render_template('test_home.html.jinja2',
                          games=games,
                          category_rows=category_rows,
-                         navigation_sections=get_navigation_sections(),
+                         navigation_sections=get_navigation_sections(is_personal_view()),
                          game_categories=get_game_categories(),
                          selected_category=selected_category,
                          search_query=search_query,
                          hero_game=hero_game,
                          total_games=len(games_data),
+                         games_html=render_game_cards(games, ROW_CARD_OPTIONS),
                          # Make GameCard utilities available in templates
                          GameCard=GameCard,
                          create_game_card=create_game_card,
                          render_game_cards=render_game_cards)
 
+SEARCH_PAGE_SIZE = 20
+SEARCH_MAX_PAGE_SIZE = 100
+
 @test_home.route('/api/search')
 def api_search():
     """
     API endpoint for live search functionality
+    
+    Uses the shared search index (typo-tolerant, ranked) and returns a compact
+    page of results: the client already holds full card data from /api/games.
     """
     query = request.args.get('q', '')
     category = request.args.get('category', '')
+    offset = max(request.args.get('offset', 0, type=int), 0)
+    limit = min(max(request.args.get('limit', SEARCH_PAGE_SIZE, type=int), 0), SEARCH_MAX_PAGE_SIZE)
     
-    games = MOCK_GAMES_DATA
-    if query:
-        games = [g for g in games if query.lower() in g['name'].lower() or 
-                                   query.lower() in g['description'].lower()]
+    # Only games listed in the hub (the Test Layout entry is excluded)
+    page = SEARCH_INDEX.search_page(query, category=category, offset=offset, limit=limit,
+                                    names=HUB_CATALOG.names())
     
     return jsonify({
         'success': True,
-        'games': games,
-        'count': len(games),
         'query': query,
-        'category': category
+        'category': category,
+        'total': page['total'],
+        'offset': offset,
+        'limit': limit,
+        'results': [{
+            'name': game['name'],
+            'category': game['category'],
+            'icon': game.get('icon', '🎮'),
+            'score': round(score, 3)
+        } for game, score in page['results']],
+        'facets': page['facets']
     })
 
 @test_home.route('/api/games')
+@singleflight_view()
 def api_games():
     """
     API endpoint to get all games for client-side filtering
@@ -496,6 +555,8 @@ def api_handle_likes():
         result = toggle_like(game_name, user_id, ip_address)
         
         if result['success']:
+            # Cards on the cached hub page show like counts
+            invalidate_pages('test_home.index')
             return jsonify({
                 'success': True,
                 'is_liked': result['is_liked'],
@@ -540,10 +601,39 @@ def api_get_user_favorites():
         print(f"Error getting user favorites: {e}")
         return jsonify({'success': False, 'error': str(e)}), 500
 
+@test_home.route('/api/user/state', methods=['GET'])
+def api_get_user_state():
+    """All per-user hub state in one call (hydrates the shared, page-cached hub)"""
+    try:
+        user_id = get_user_identifier(request)
+        likes = get_user_likes(user_id)
+        favorites = get_user_favorites(user_id)
+        recently_played = get_recently_played()
+        response = jsonify({
+            'success': True,
+            'likes': likes,
+            'favorites': favorites,
+            'recently_played': recently_played,
+            'counts': {
+                'Liked': len(likes),
+                'Favorited': len(favorites),
+                'Recently Played': len(recently_played)
+            }
+        })
+        response.headers['Cache-Control'] = 'private, no-store'
+        return response
+    except Exception as e:
+        print(f"Error getting user state: {e}")
+        return jsonify({'success': False, 'error': str(e)}), 500
+
 @test_home.route('/api/recently-played', methods=['POST'])
 def api_add_recently_played():
     """
-    API endpoint to add game to recently played - placeholder for future database implementation
+    API endpoint called when a game is launched from the hub
+    
+    Plays are recorded by the games' own start endpoints (see plays.py), so
+    launching from the hub doesn't count one; this returns the user's
+    recently played list for the navigation count.
     """
     data = request.get_json()
     game_name = data.get('game_name')
@@ -551,8 +641,7 @@ def api_add_recently_played():
     if not game_name:
         return jsonify({'success': False, 'error': 'Game name required'}), 400
     
-    # TODO: Implement database-backed recently played tracking
-    recent_games = []
+    recent_games = get_recently_played()
     
     return jsonify({
         'success': True,
@@ -584,10 +673,12 @@ def game_player(game_name):
                              selected_category='Home',
                              search_query='',
                              hero_game=games_data[0] if games_data else None,
-                             total_games=len(games_data))
+                             total_games=len(games_data),
+                             games_html=render_game_cards(games_data, ROW_CARD_OPTIONS))
     
     # Get related games (same category, excluding current game)
-    related_games = [g for g in games_data if g['category'] == current_game['category'] and g['name'] != current_game['name']]
+    related_games = [games_data[i] for i in HUB_CATALOG.ids(category=current_game['category'])
+                     if games_data[i]['name'] != current_game['name']]
     
     # If not enough related games, add games from other categories
     if len(related_games) < 6:
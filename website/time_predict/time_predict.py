@@ -7,8 +7,7 @@ import logging
 import traceback
 from datetime import datetime
 
-# Set up detailed logging
-logging.basicConfig(level=logging.INFO)
+# Set up detailed logging (configured in create_app)
 logger = logging.getLogger(__name__)
 
 # STEP 1: Enhanced leaderboard import with detailed error tracking
@@ -17,6 +16,7 @@ LEADERBOARD_ERROR = None
 
 try:
     from website.leaderboard.leaderboard import submit_score_closest_to_target
+    from website.leaderboard.plays import record_request_play
     LEADERBOARD_AVAILABLE = True
     logger.info("Leaderboard system loaded successfully")
 except ImportError as e:
@@ -229,6 +229,9 @@ def start_game():
         
         logger.info(f"Game started at {start_time}")
         
+        if LEADERBOARD_AVAILABLE:
+            record_request_play('Time Predict Challenge')
+        
         return jsonify({
             'success': True,
             'start_time': start_time,